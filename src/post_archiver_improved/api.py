@@ -8,11 +8,13 @@ for community posts and comments.
 from __future__ import annotations
 
 import base64
-import gzip
+import functools
 import re
 from typing import Any
+from urllib.request import Request
 
 from .constants import (
+    ACCEPT_ENCODING,
     DEFAULT_USER_AGENT,
     POSTS_TAB_PARAMS,
     YOUTUBE_BASE_URL,
@@ -22,7 +24,7 @@ from .constants import (
 )
 from .exceptions import APIError, NetworkError, ValidationError
 from .logging_config import get_logger
-from .utils import make_http_request
+from .utils import decompress_body, make_http_request, urlopen
 
 logger = get_logger(__name__)
 
@@ -31,21 +33,110 @@ logger = get_logger(__name__)
 # YouTube pages for Official Artist Channels (OAC) may contain multiple channel IDs
 # (sub-channels, topic channels, etc.). The canonical URL and externalId always
 # point to the primary channel, so they must be checked before generic patterns.
+# The patterns are bytes so pages are searched without decoding them first.
 _CHANNEL_ID_PATTERNS = [
     re.compile(
-        r'<link[^>]*rel="canonical"[^>]*href="[^"]*channel\/(UC[a-zA-Z0-9_-]{22})"'
+        rb'<link[^>]*rel="canonical"[^>]*href="[^"]*channel\/(UC[a-zA-Z0-9_-]{22})"'
     ),
     re.compile(
-        r'<meta[^>]*property="og:url"[^>]*content="[^"]*channel\/(UC[a-zA-Z0-9_-]{22})"'
+        rb'<meta[^>]*property="og:url"[^>]*content="[^"]*channel\/(UC[a-zA-Z0-9_-]{22})"'
     ),
-    re.compile(r'"externalId":"(UC[a-zA-Z0-9_-]{22})"'),
-    re.compile(r'"browseId":"(UC[a-zA-Z0-9_-]{22})"'),
-    re.compile(r'"channelId":"(UC[a-zA-Z0-9_-]{22})"'),
+    re.compile(rb'"externalId":"(UC[a-zA-Z0-9_-]{22})"'),
+    re.compile(rb'"browseId":"(UC[a-zA-Z0-9_-]{22})"'),
+    re.compile(rb'"channelId":"(UC[a-zA-Z0-9_-]{22})"'),
 ]
 
 # Module-level cache for resolved channel handles
 _handle_cache: dict[str, str] = {}
 
+# Module-level cache of the channel owning each post, looked up from the
+# post page; a post never moves to another channel
+_post_channel_cache: dict[str, str] = {}
+
+
+def _find_channel_id(html: bytes) -> str | None:
+    """
+    Find the channel ID in a YouTube HTML page.
+
+    Args:
+        html: Raw page body
+
+    Returns:
+        Channel ID from the most authoritative pattern that matches, or None
+    """
+    for pattern in _CHANNEL_ID_PATTERNS:
+        match = pattern.search(html)
+        if match:
+            return match.group(1).decode("ascii")
+    return None
+
+
+def _append_length_delimited(
+    buf: bytearray, tag: bytes, value: bytes | bytearray
+) -> None:
+    """
+    Append a length-delimited protobuf field to buf.
+
+    Args:
+        buf: Buffer to append to
+        tag: Encoded field tag (field number << 3 | wire type 2)
+        value: Field payload
+    """
+    buf += tag
+    length = len(value)
+    # Varint-encode the length (a single byte for anything under 128)
+    while length > 0x7F:
+        buf.append((length & 0x7F) | 0x80)
+        length >>= 7
+    buf.append(length)
+    buf += value
+
+
+# Module-level cache of encoded post detail params, keyed by (channel_id, post_id)
+@functools.lru_cache(maxsize=4096)
+def _build_post_detail_params(channel_id: str, post_id: str) -> str:
+    """
+    Build the base64 encoded protobuf params for a post detail request.
+
+    Args:
+        channel_id: YouTube channel ID
+        post_id: Post ID
+
+    Returns:
+        Base64 encoded params string
+    """
+    channel_bytes = channel_id.encode("utf-8")
+    post_bytes = post_id.encode("utf-8")
+
+    # Protobuf structure (from YouTube.js CommunityPostParams):
+    # message CommunityPostParams {
+    #   message Field1 {
+    #     string ucid1 = 2;    // channel_id
+    #     string post_id = 3;  // post_id
+    #     string ucid2 = 11;   // channel_id (repeated)
+    #   }
+    #   Field1 f1 = 56;
+    # }
+    #
+    # Wire format:
+    #   \xc2\x03 = field 56, wire type 2 (length-delimited)
+    #   <varint>  = length of inner message
+    #   \x12      = field 2, wire type 2 (ucid1)
+    #   \x1a      = field 3, wire type 2 (post_id)
+    #   \x5a      = field 11, wire type 2 (ucid2)
+
+    # Build inner message (Field1)
+    inner_message = bytearray()
+    _append_length_delimited(inner_message, b"\x12", channel_bytes)
+    _append_length_delimited(inner_message, b"\x1a", post_bytes)
+    _append_length_delimited(inner_message, b"\x5a", channel_bytes)
+
+    # Build outer message with correct length
+    params_data = bytearray()
+    _append_length_delimited(params_data, b"\xc2\x03", inner_message)
+
+    return base64.b64encode(params_data).decode("ascii")
+
 
 class YouTubeCommunityAPI:
     """
@@ -88,6 +179,7 @@ class YouTubeCommunityAPI:
 
         self.headers = {
             "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "User-Agent": DEFAULT_USER_AGENT,
             "X-YouTube-Client-Name": "1",
             "X-YouTube-Client-Version": YOUTUBE_CLIENT_VERSION,
@@ -159,30 +251,23 @@ class YouTubeCommunityAPI:
             "User-Agent": DEFAULT_USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
 
-        from urllib.request import Request, urlopen
-
         request = Request(channel_url, headers=headers)
 
         with urlopen(request, timeout=self.timeout) as response:  # nosec B310
             if response.status != 200:
                 raise APIError(f"Channel page returned status {response.status}")
 
-            content = response.read()
-            if response.info().get("Content-Encoding") == "gzip":
-                content = gzip.decompress(content)
-
-            html_content = content.decode("utf-8", errors="ignore")
+            content = decompress_body(
+                response.read(), response.info().get("Content-Encoding")
+            )
 
-        for pattern in _CHANNEL_ID_PATTERNS:
-            matches = pattern.findall(html_content)
-            if matches:
-                channel_id = matches[0]
-                logger.info(f"Resolved handle {handle} to channel ID: {channel_id}")
-                return str(channel_id)
+        channel_id = _find_channel_id(content)
+        if channel_id:
+            logger.info(f"Resolved handle {handle} to channel ID: {channel_id}")
+            return channel_id
 
         logger.warning(
             f"Could not resolve handle {handle} from HTML, trying alternative method"
@@ -356,47 +441,7 @@ class YouTubeCommunityAPI:
         logger.debug(f"Fetching post detail data for post: {post_id}")
 
         try:
-            channel_bytes = channel_id.encode("utf-8")
-            post_bytes = post_id.encode("utf-8")
-
-            # Protobuf structure (from YouTube.js CommunityPostParams):
-            # message CommunityPostParams {
-            #   message Field1 {
-            #     string ucid1 = 2;    // channel_id
-            #     string post_id = 3;  // post_id
-            #     string ucid2 = 11;   // channel_id (repeated)
-            #   }
-            #   Field1 f1 = 56;
-            # }
-            #
-            # Wire format:
-            #   \xc2\x03 = field 56, wire type 2 (length-delimited)
-            #   <varint>  = length of inner message
-            #   \x12      = field 2, wire type 2 (ucid1)
-            #   \x1a      = field 3, wire type 2 (post_id)
-            #   \x5a      = field 11, wire type 2 (ucid2)
-
-            # Build inner message (Field1)
-            inner_message = (
-                b"\x12"  # field 2 tag (ucid1)
-                + bytes([len(channel_bytes)])
-                + channel_bytes
-                + b"\x1a"  # field 3 tag (post_id)
-                + bytes([len(post_bytes)])
-                + post_bytes
-                + b"\x5a"  # field 11 tag (ucid2)
-                + bytes([len(channel_bytes)])
-                + channel_bytes
-            )
-
-            # Build outer message with correct length
-            params_data = (
-                b"\xc2\x03"  # field 56 tag
-                + bytes([len(inner_message)])  # varint length of inner msg
-                + inner_message
-            )
-
-            params = base64.b64encode(params_data).decode("ascii")
+            params = _build_post_detail_params(channel_id, post_id)
 
             payload = {
                 "context": self.client_context,
@@ -454,12 +499,9 @@ class YouTubeCommunityAPI:
                 # \x08\x01 - Request type flag (individual post)
                 # \x12<len><post_bytes> - Post ID with length prefix
                 # \x18\x01 - Additional flags for post access mode
-                params_data = (
-                    b"\x08\x01\x12"
-                    + bytes([len(post_bytes)])
-                    + post_bytes
-                    + b"\x18\x01"
-                )
+                params_data = bytearray(b"\x08\x01")
+                _append_length_delimited(params_data, b"\x12", post_bytes)
+                params_data += b"\x18\x01"
 
                 params = base64.b64encode(params_data).decode("ascii")
 
@@ -489,6 +531,10 @@ class YouTubeCommunityAPI:
         Returns:
             Channel ID if found, None otherwise
         """
+        if post_id in _post_channel_cache:
+            logger.debug(f"Using cached channel ID for post {post_id}")
+            return _post_channel_cache[post_id]
+
         try:
             post_url = f"https://www.youtube.com/post/{post_id}"
             logger.debug(f"Attempting to extract channel ID from post URL: {post_url}")
@@ -497,12 +543,9 @@ class YouTubeCommunityAPI:
                 "User-Agent": DEFAULT_USER_AGENT,
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
+                "Accept-Encoding": ACCEPT_ENCODING,
             }
 
-            from urllib.request import Request, urlopen
-
             request = Request(post_url, headers=headers)
 
             # Add cookies to the request if available
@@ -518,19 +561,16 @@ class YouTubeCommunityAPI:
                     logger.warning(f"Post page returned status {response.status}")
                     return None
 
-                # Read and decode the response
-                content = response.read()
-                if response.info().get("Content-Encoding") == "gzip":
-                    content = gzip.decompress(content)
-
-                html_content = content.decode("utf-8", errors="ignore")
+                # Read and decompress the response
+                content = decompress_body(
+                    response.read(), response.info().get("Content-Encoding")
+                )
 
-            for pattern in _CHANNEL_ID_PATTERNS:
-                matches = pattern.findall(html_content)
-                if matches:
-                    channel_id = str(matches[0])
-                    logger.debug(f"Extracted channel ID from post page: {channel_id}")
-                    return channel_id
+            channel_id = _find_channel_id(content)
+            if channel_id:
+                logger.debug(f"Extracted channel ID from post page: {channel_id}")
+                _post_channel_cache[post_id] = channel_id
+                return channel_id
 
             logger.warning(
                 f"Could not extract channel ID from post page for post {post_id}"
@@ -20,6 +20,7 @@ from .constants import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_DELAY,
     DEFAULT_TIMEOUT,
+    MAX_POST_WORKERS,
 )
 from .exceptions import (
     APIError,
@@ -151,6 +152,15 @@ def create_argument_parser() -> argparse.ArgumentParser:
         metavar="SECONDS",
         help=f"Delay between requests in seconds (default: {DEFAULT_RETRY_DELAY})",
     )
+    network_group.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help=(
+            "Maximum number of posts, image downloads and reply requests "
+            f"fetched at the same time (default: {MAX_POST_WORKERS})"
+        ),
+    )
 
     # Logging options
     logging_group = parser.add_argument_group("Logging Options")
@@ -344,6 +354,7 @@ def main() -> int:
                 "cookies_file": args.cookies,
                 "output_dir": args.output,
                 "log_file": args.log_file,
+                "max_workers": args.workers,
             }
 
             config.scraping.request_timeout = args.timeout
@@ -386,6 +397,7 @@ def main() -> int:
                 "cookies_file": args.cookies,
                 "output_dir": args.output,
                 "log_file": args.log_file,
+                "max_workers": args.workers,
             }
 
             config.scraping.request_timeout = args.timeout
@@ -7,18 +7,71 @@ from YouTube's API responses, including continuation handling.
 
 from __future__ import annotations
 
+import logging
 import time
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
 
+from .constants import MAX_REPLY_FETCH_WORKERS
 from .exceptions import APIError
 from .logging_config import get_logger
 from .models import Comment
 
 logger = get_logger(__name__)
 
+# Shared default for missing nested keys. Read-only: never mutate it.
+_EMPTY: dict[str, Any] = {}
+
+# Minimum delay between comment page requests, in seconds
+_COMMENT_PAGE_DELAY = 0.5
+
+# Reply continuations waiting to be fetched: (parent comment, token, replies wanted)
+PendingReplies = list[tuple[Comment, str, int]]
+
+
+class _EntityIndex:
+    """
+    Entity payloads of one continuation response, indexed by entityKey.
+
+    Built once per response so each comment can find its entities with dict
+    lookups instead of scanning every payload.
+    """
+
+    def __init__(self, entity_payloads: list[dict[str, Any]]) -> None:
+        self.by_key: dict[str, dict[str, Any]] = {}
+        for entity in entity_payloads:
+            self.by_key.setdefault(entity.get("entityKey", ""), entity)
+        # Sorted keys allow prefix lookups; positions restore response order
+        self._sorted_keys = sorted(self.by_key)
+        self._positions = {key: i for i, key in enumerate(self.by_key)}
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the entity with the given key, if any."""
+        return self.by_key.get(key)
+
+    def with_prefix(self, prefix: str) -> list[dict[str, Any]]:
+        """
+        Return entities whose key starts with prefix, in response order.
+
+        Args:
+            prefix: Entity key prefix to match
+
+        Returns:
+            List of matching entity payloads
+        """
+        keys = self._sorted_keys
+        matches = []
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix):
+                break
+            matches.append(keys[i])
+        matches.sort(key=self._positions.__getitem__)
+        return [self.by_key[key] for key in matches]
+
 
 class CommentProcessor:
     """
@@ -28,16 +81,23 @@ class CommentProcessor:
     capabilities including reply extraction and continuation handling.
     """
 
-    def __init__(self, api_client: Any, comment_extractor: Any) -> None:
+    def __init__(
+        self,
+        api_client: Any,
+        comment_extractor: Any,
+        max_workers: int = MAX_REPLY_FETCH_WORKERS,
+    ) -> None:
         """
         Initialize comment processor.
 
         Args:
             api_client: YouTube API client instance
             comment_extractor: Basic comment extractor instance
+            max_workers: Maximum number of simultaneous reply fetches
         """
         self.api = api_client
         self.extractor = comment_extractor
+        self.max_workers = max_workers
         logger.debug("Comment processor initialized")
 
     def extract_comments(
@@ -67,50 +127,93 @@ class CommentProcessor:
             # Get post detail data which contains initial comments
             response = self.api.get_post_detail_data(channel_id, post_id)
             continuation_token = self._find_comment_continuation_token(response)
+            # Only the token is needed from here on; drop the response tree so
+            # it can be freed while comment pages are fetched
+            del response
 
             if not continuation_token:
                 logger.info("No comments found for this post")
                 return comments
 
-            # Process comment batches with continuation
-            while continuation_token and len(comments) < max_comments:
-                try:
-                    logger.debug(
-                        f"Fetching comment batch (comments so far: {len(comments)})"
-                    )
-                    comment_response = self.api.get_continuation_data(
-                        continuation_token
+            # Process comment batches with continuation. A single worker
+            # fetches the next page while the current one is parsed and its
+            # replies are fetched.
+            # YouTube occasionally hands back a token it already returned
+            seen_tokens = {continuation_token}
+            with ThreadPoolExecutor(max_workers=1) as prefetch_pool:
+                next_page: Future[tuple[dict[str, Any], float]] | None = (
+                    prefetch_pool.submit(
+                        self._fetch_comment_page, continuation_token, time.monotonic()
                     )
+                )
+                while next_page is not None:
+                    try:
+                        logger.debug(
+                            f"Fetching comment batch (comments so far: {len(comments)})"
+                        )
+                        comment_response, fetched_at = next_page.result()
+                        next_page = None
+                        # Rate limiting: the next page starts no sooner than this
+                        next_request_time = fetched_at + _COMMENT_PAGE_DELAY
+
+                        # Find next continuation token and start fetching that
+                        # page now, unless this one should reach the limit
+                        continuation_token = self._find_continuation_token(
+                            comment_response
+                        )
+                        if continuation_token in seen_tokens:
+                            logger.debug("Continuation token repeated, stopping")
+                            continuation_token = None
+                        elif continuation_token:
+                            seen_tokens.add(continuation_token)
+                        expected_total = len(comments) + self._count_comment_threads(
+                            comment_response
+                        )
+                        if continuation_token and expected_total < max_comments:
+                            next_page = prefetch_pool.submit(
+                                self._fetch_comment_page,
+                                continuation_token,
+                                next_request_time,
+                            )
 
-                    new_comments = self._extract_comments_from_continuation(
-                        comment_response, max_replies_per_comment
-                    )
+                        new_comments = self._extract_comments_from_continuation(
+                            comment_response, max_replies_per_comment
+                        )
+                        # Free this page before the next one is parsed
+                        del comment_response
 
-                    if not new_comments:
-                        logger.debug("No more comments found")
-                        break
+                        if not new_comments:
+                            logger.debug("No more comments found")
+                            break
 
-                    comments.extend(new_comments)
-                    logger.debug(
-                        f"Extracted {len(new_comments)} comments in this batch"
-                    )
+                        comments.extend(new_comments)
+                        logger.debug(
+                            f"Extracted {len(new_comments)} comments in this batch"
+                        )
 
-                    # Find next continuation token
-                    continuation_token = self._find_continuation_token(comment_response)
+                        if len(comments) >= max_comments:
+                            logger.debug(
+                                f"Reached maximum comment limit: {max_comments}"
+                            )
+                            break
+
+                        # Fewer comments than expected; fetch the next page now
+                        if next_page is None and continuation_token:
+                            next_page = prefetch_pool.submit(
+                                self._fetch_comment_page,
+                                continuation_token,
+                                next_request_time,
+                            )
 
-                    if len(comments) >= max_comments:
-                        logger.debug(f"Reached maximum comment limit: {max_comments}")
+                    except APIError as e:
+                        logger.warning(f"API error during comment extraction: {e}")
+                        break
+                    except Exception as e:
+                        logger.warning(f"Error during comment extraction: {e}")
                         break
 
-                    # Rate limiting
-                    time.sleep(0.5)
-
-                except APIError as e:
-                    logger.warning(f"API error during comment extraction: {e}")
-                    break
-                except Exception as e:
-                    logger.warning(f"Error during comment extraction: {e}")
-                    break
+                if next_page is not None:
+                    next_page.cancel()
 
             # Limit to requested number
             comments = comments[:max_comments]
@@ -124,6 +227,47 @@ class CommentProcessor:
             logger.error(f"Error extracting comments for post {post_id}: {e}")
             return []
 
+    def _fetch_comment_page(
+        self, continuation_token: str, not_before: float
+    ) -> tuple[dict[str, Any], float]:
+        """
+        Fetch a page of comments once the rate limit allows it.
+
+        Args:
+            continuation_token: Continuation token of the page to fetch
+            not_before: Earliest time.monotonic() value the request may start at
+
+        Returns:
+            Tuple of (continuation response, time.monotonic() when it finished)
+        """
+        wait_time = not_before - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        response = self.api.get_continuation_data(continuation_token)
+        return response, time.monotonic()
+
+    @staticmethod
+    def _count_comment_threads(response: dict[str, Any]) -> int:
+        """
+        Count the comment items in a continuation response without parsing them.
+
+        Args:
+            response: Continuation API response
+
+        Returns:
+            Number of comment thread and comment renderer items
+        """
+        count = 0
+        for endpoint in response.get("onResponseReceivedEndpoints", ()):
+            command = endpoint.get("reloadContinuationItemsCommand") or endpoint.get(
+                "appendContinuationItemsAction", {}
+            )
+            for item in command.get("continuationItems", ()):
+                if "commentThreadRenderer" in item or "commentRenderer" in item:
+                    count += 1
+        return count
+
     def _find_comment_continuation_token(self, response: dict[str, Any]) -> str | None:
         """
         Find the continuation token for loading comments from post detail response.
@@ -135,40 +279,34 @@ class CommentProcessor:
             Continuation token or None if not found
         """
         try:
-            contents = response.get("contents", {})
-            if "twoColumnBrowseResultsRenderer" not in contents:
-                return None
-
-            tabs = contents["twoColumnBrowseResultsRenderer"].get("tabs", [])
-            for tab in tabs:
-                if "tabRenderer" not in tab:
-                    continue
-
-                tab_content = tab["tabRenderer"].get("content", {})
-                section_list = tab_content.get("sectionListRenderer", {})
-                sections = section_list.get("contents", [])
-
-                for section in sections:
-                    if "itemSectionRenderer" not in section:
-                        continue
+            tabs = (
+                response.get("contents", _EMPTY)
+                .get("twoColumnBrowseResultsRenderer", _EMPTY)
+                .get("tabs", ())
+            )
+            # Walk straight down to the comment item sections of each tab
+            comment_sections = (
+                section_renderer
+                for tab in tabs
+                for section in tab.get("tabRenderer", _EMPTY)
+                .get("content", _EMPTY)
+                .get("sectionListRenderer", _EMPTY)
+                .get("contents", ())
+                if (section_renderer := section.get("itemSectionRenderer"))
+                and section_renderer.get("sectionIdentifier") == "comment-item-section"
+            )
 
-                    section_renderer = section["itemSectionRenderer"]
-                    if (
-                        section_renderer.get("sectionIdentifier")
-                        == "comment-item-section"
-                    ):
-                        for item in section_renderer.get("contents", []):
-                            if "continuationItemRenderer" in item:
-                                continuation_endpoint = item[
-                                    "continuationItemRenderer"
-                                ]["continuationEndpoint"]
-                                token = continuation_endpoint["continuationCommand"][
-                                    "token"
-                                ]
-                                logger.debug(
-                                    f"Found comment continuation token: {token[:20]}..."
-                                )
-                                return str(token)
+            for section_renderer in comment_sections:
+                for item in section_renderer.get("contents", ()):
+                    continuation_item = item.get("continuationItemRenderer")
+                    if continuation_item is not None:
+                        token = continuation_item["continuationEndpoint"][
+                            "continuationCommand"
+                        ]["token"]
+                        logger.debug(
+                            f"Found comment continuation token: {token[:20]}..."
+                        )
+                        return str(token)
 
             return None
 
@@ -190,10 +328,11 @@ class CommentProcessor:
             List of Comment objects
         """
         comments = []
+        pending_replies: PendingReplies = []
 
         try:
             # Extract entity payloads for new format comments
-            entity_payloads = []
+            entity_payloads: list[dict[str, Any]] = []
             if "frameworkUpdates" in response:
                 framework_updates = response["frameworkUpdates"]
                 if "entityBatchUpdate" in framework_updates:
@@ -201,6 +340,7 @@ class CommentProcessor:
                         "mutations", []
                     )
                     entity_payloads = [m for m in mutations if "payload" in m]
+            entity_index = _EntityIndex(entity_payloads)
 
             # Process response endpoints
             if "onResponseReceivedEndpoints" in response:
@@ -218,7 +358,10 @@ class CommentProcessor:
 
                     for item in items:
                         comment = self._process_comment_item(
-                            item, entity_payloads, max_replies_per_comment
+                            item,
+                            entity_index,
+                            max_replies_per_comment,
+                            pending_replies,
                         )
                         if comment:
                             comments.append(comment)
@@ -226,21 +369,61 @@ class CommentProcessor:
         except Exception as e:
             logger.warning(f"Error extracting comments from continuation: {e}")
 
+        self._fetch_pending_replies(pending_replies)
+
         return comments
 
+    def _fetch_pending_replies(self, pending_replies: PendingReplies) -> None:
+        """
+        Fetch reply continuations for a batch of comments concurrently.
+
+        Each comment's continuation chain is still fetched in order by a
+        single worker; only different comments overlap their requests.
+
+        Args:
+            pending_replies: Reply continuations collected while processing a batch
+        """
+        if not pending_replies:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending_replies)),
+            thread_name_prefix="reply-fetch",
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_replies_from_continuation, token, remaining
+                ): (parent_comment, remaining)
+                for parent_comment, token, remaining in pending_replies
+            }
+
+            for future in as_completed(futures):
+                parent_comment, remaining = futures[future]
+                try:
+                    additional_replies = future.result()
+                except Exception as e:
+                    logger.warning(f"Error fetching replies: {e}")
+                    continue
+
+                parent_comment.replies.extend(additional_replies[:remaining])
+                logger.debug(f"Extracted {len(additional_replies)} additional replies")
+
     def _process_comment_item(
         self,
         item: dict[str, Any],
-        entity_payloads: list[dict[str, Any]],
+        entity_index: _EntityIndex,
         max_replies_per_comment: int,
+        pending_replies: PendingReplies | None = None,
     ) -> Comment | None:
         """
         Process a single comment item from the response.
 
         Args:
             item: Comment item from API response
-            entity_payloads: Entity payloads for new format comments
+            entity_index: Indexed entity payloads for new format comments
             max_replies_per_comment: Maximum number of replies per comment
+            pending_replies: If given, reply continuations are queued here
+                instead of being fetched immediately
 
         Returns:
             Comment object or None if processing fails
@@ -252,7 +435,10 @@ class CommentProcessor:
                 # Check for new format (commentViewModel)
                 if "commentViewModel" in thread_renderer:
                     return self._process_new_format_comment(
-                        thread_renderer, entity_payloads, max_replies_per_comment
+                        thread_renderer,
+                        entity_index,
+                        max_replies_per_comment,
+                        pending_replies,
                     )
 
                 # Check for old format (comment.commentRenderer)
@@ -261,7 +447,7 @@ class CommentProcessor:
                     and "commentRenderer" in thread_renderer["comment"]
                 ):
                     return self._process_old_format_comment(
-                        thread_renderer, max_replies_per_comment
+                        thread_renderer, max_replies_per_comment, pending_replies
                     )
 
             elif "commentRenderer" in item:
@@ -279,16 +465,18 @@ class CommentProcessor:
     def _process_new_format_comment(
         self,
         thread_renderer: dict[str, Any],
-        entity_payloads: list[dict[str, Any]],
+        entity_index: _EntityIndex,
         max_replies_per_comment: int,
+        pending_replies: PendingReplies | None = None,
     ) -> Comment | None:
         """
         Process comment in new format (commentViewModel).
 
         Args:
             thread_renderer: Thread renderer data
-            entity_payloads: Entity payloads for comment data
+            entity_index: Indexed entity payloads for comment data
             max_replies_per_comment: Maximum number of replies per comment
+            pending_replies: Optional queue for deferred reply continuations
 
         Returns:
             Comment object or None if processing fails
@@ -300,17 +488,18 @@ class CommentProcessor:
             inline_replies_key = view_model.get("inlineRepliesKey", "")
 
             # Find matching entities
-            matching_entities = []
-            reply_entities = []
-
-            for entity in entity_payloads:
-                entity_key = entity.get("entityKey", "")
-                if entity_key in [comment_key, toolbar_key]:
-                    matching_entities.append(entity)
-                elif entity_key.startswith(
-                    inline_replies_key
-                ) and "commentEntityPayload" in entity.get("payload", {}):
-                    reply_entities.append(entity)
+            own_keys = {comment_key, toolbar_key}
+            matching_entities = [
+                entity
+                for entity in map(entity_index.get, own_keys)
+                if entity is not None
+            ]
+            reply_entities = [
+                entity
+                for entity in entity_index.with_prefix(inline_replies_key)
+                if entity.get("entityKey", "") not in own_keys
+                and "commentEntityPayload" in entity.get("payload", {})
+            ]
 
             if not matching_entities:
                 return None
@@ -336,6 +525,7 @@ class CommentProcessor:
                     replies_data["commentRepliesRenderer"],
                     comment,
                     max_replies_per_comment,
+                    pending_replies,
                 )
 
             return comment
@@ -345,7 +535,10 @@ class CommentProcessor:
             return None
 
     def _process_old_format_comment(
-        self, thread_renderer: dict[str, Any], max_replies_per_comment: int
+        self,
+        thread_renderer: dict[str, Any],
+        max_replies_per_comment: int,
+        pending_replies: PendingReplies | None = None,
     ) -> Comment | None:
         """
         Process comment in old format (comment.commentRenderer).
@@ -353,6 +546,7 @@ class CommentProcessor:
         Args:
             thread_renderer: Thread renderer data
             max_replies_per_comment: Maximum number of replies per comment
+            pending_replies: Optional queue for deferred reply continuations
 
         Returns:
             Comment object or None if processing fails
@@ -373,6 +567,7 @@ class CommentProcessor:
                     replies_data["commentRepliesRenderer"],
                     comment,
                     max_replies_per_comment,
+                    pending_replies,
                 )
 
             return comment
@@ -386,6 +581,7 @@ class CommentProcessor:
         replies_renderer: dict[str, Any],
         parent_comment: Comment,
         max_replies: int = 200,
+        pending_replies: PendingReplies | None = None,
     ) -> None:
         """
         Extract replies from commentRepliesRenderer and add them to parent comment.
@@ -394,6 +590,8 @@ class CommentProcessor:
             replies_renderer: Replies renderer data
             parent_comment: Parent comment to add replies to
             max_replies: Maximum number of replies to extract
+            pending_replies: If given, the reply continuation is queued here
+                for a later concurrent fetch instead of being fetched now
         """
         try:
             initial_reply_count = len(parent_comment.replies)
@@ -409,12 +607,19 @@ class CommentProcessor:
                             parent_comment.replies.append(reply)
 
             replies_extracted = len(parent_comment.replies) - initial_reply_count
-            logger.debug(f"Extracted {replies_extracted} immediate replies")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted {replies_extracted} immediate replies")
 
             # Fetch additional replies if continuation token exists
             continuation_token = self._get_reply_continuation_token(replies_renderer)
             if continuation_token and len(parent_comment.replies) < max_replies:
                 remaining_replies = max_replies - len(parent_comment.replies)
+                if pending_replies is not None:
+                    pending_replies.append(
+                        (parent_comment, continuation_token, remaining_replies)
+                    )
+                    return
+
                 additional_replies = self._fetch_replies_from_continuation(
                     continuation_token, remaining_replies
                 )
@@ -510,6 +715,7 @@ class CommentProcessor:
         """
         replies: list[Comment] = []
         current_token: str | None = continuation_token
+        seen_tokens = {continuation_token}
         fetch_attempts = 0
         max_attempts = 10  # Prevent infinite loops
 
@@ -547,10 +753,16 @@ class CommentProcessor:
                     current_token = self._find_reply_continuation_token_in_response(
                         response
                     )
+                    # Free this page before the next one is downloaded and parsed
+                    del response
 
                     if not current_token:
                         logger.debug("No more continuation tokens found")
                         break
+                    if current_token in seen_tokens:
+                        logger.debug("Reply continuation token repeated, stopping")
+                        break
+                    seen_tokens.add(current_token)
 
                     # Rate limiting
                     time.sleep(0.3)
@@ -722,27 +934,19 @@ class CommentProcessor:
             Continuation token or None if not found
         """
         try:
-            if "onResponseReceivedEndpoints" in response:
-                for endpoint in response["onResponseReceivedEndpoints"]:
-                    items = []
-                    if "reloadContinuationItemsCommand" in endpoint:
-                        items = endpoint["reloadContinuationItemsCommand"].get(
-                            "continuationItems", []
-                        )
-                    elif "appendContinuationItemsAction" in endpoint:
-                        items = endpoint["appendContinuationItemsAction"].get(
-                            "continuationItems", []
-                        )
-
-                    for item in items:
-                        if "continuationItemRenderer" in item:
-                            continuation_endpoint = item["continuationItemRenderer"][
-                                "continuationEndpoint"
-                            ]
-                            token = continuation_endpoint["continuationCommand"][
-                                "token"
-                            ]
-                            return str(token)
+            # The token follows the comment threads in the last endpoint, so
+            # walk endpoints and items backwards to reach it first
+            for endpoint in reversed(response.get("onResponseReceivedEndpoints", [])):
+                action = endpoint.get("reloadContinuationItemsCommand") or endpoint.get(
+                    "appendContinuationItemsAction", _EMPTY
+                )
+                for item in reversed(action.get("continuationItems", [])):
+                    if "continuationItemRenderer" in item:
+                        continuation_endpoint = item["continuationItemRenderer"][
+                            "continuationEndpoint"
+                        ]
+                        token = continuation_endpoint["continuationCommand"]["token"]
+                        return str(token)
 
             return None
 
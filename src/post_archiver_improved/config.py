@@ -6,6 +6,7 @@ This module handles configuration loading, validation, and default values.
 
 from __future__ import annotations
 
+import copy
 import json
 import math
 from dataclasses import asdict, dataclass
@@ -18,11 +19,44 @@ from .constants import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_DELAY,
     DEFAULT_TIMEOUT,
+    MAX_POST_WORKERS,
 )
+from .exceptions import ConfigurationError
 from .logging_config import get_logger
+from .utils import decode_json, encode_json
 
 logger = get_logger(__name__)
 
+# JSON types accepted for each config file field. bool subclasses int, so it
+# is only accepted where listed explicitly.
+_FIELD_TYPES: dict[str, dict[str, tuple[type, ...]]] = {
+    "scraping": {
+        "max_posts": (int, float),
+        "extract_comments": (bool,),
+        "max_comments_per_post": (int,),
+        "max_replies_per_comment": (int,),
+        "download_images": (bool,),
+        "request_timeout": (int, float),
+        "max_retries": (int,),
+        "retry_delay": (int, float),
+        "max_workers": (int,),
+        "cookies_file": (str, type(None)),
+    },
+    "output": {
+        "output_dir": (str, type(None)),
+        "save_format": (str,),
+        "pretty_print": (bool,),
+        "include_metadata": (bool,),
+    },
+}
+_TOP_LEVEL_TYPES: dict[str, tuple[type, ...]] = {
+    "scraping": (dict,),
+    "output": (dict,),
+    "log_file": (str, type(None)),
+}
+
+_SAVE_FORMATS = ("json",)
+
 
 @dataclass
 class ScrapingConfig:
@@ -36,6 +70,9 @@ class ScrapingConfig:
     request_timeout: int = DEFAULT_TIMEOUT
     max_retries: int = DEFAULT_MAX_RETRIES
     retry_delay: float = DEFAULT_RETRY_DELAY
+    # Posts fetched at the same time; image downloads and reply fetches are
+    # capped at this too, so 1 fetches posts, images and replies one by one
+    max_workers: int = MAX_POST_WORKERS
     cookies_file: Path | str | None = None
 
 
@@ -72,16 +109,77 @@ class Config:
 
     def _validate_config(self) -> None:
         """Validate configuration values."""
-        if self.scraping.request_timeout <= 0:
-            raise ValueError("request_timeout must be positive")
-        if self.scraping.max_retries < 0:
-            raise ValueError("max_retries cannot be negative")
-        if self.scraping.retry_delay < 0:
-            raise ValueError("retry_delay cannot be negative")
-        if self.scraping.max_comments_per_post <= 0:
-            raise ValueError("max_comments_per_post must be positive")
-        if self.scraping.max_replies_per_comment <= 0:
-            raise ValueError("max_replies_per_comment must be positive")
+        violations = _value_violations(self.scraping, self.output)
+        if violations:
+            raise ValueError("; ".join(violations))
+
+
+def _value_violations(scraping: ScrapingConfig, output: OutputConfig) -> list[str]:
+    """
+    Check configuration values against their allowed ranges.
+
+    Args:
+        scraping: Scraping configuration to check
+        output: Output configuration to check
+
+    Returns:
+        One message per invalid value, empty if all values are valid
+    """
+    violations: list[str] = []
+    if scraping.max_posts <= 0:
+        violations.append("max_posts must be positive")
+    if scraping.request_timeout <= 0:
+        violations.append("request_timeout must be positive")
+    if scraping.max_retries < 0:
+        violations.append("max_retries cannot be negative")
+    if scraping.retry_delay < 0:
+        violations.append("retry_delay cannot be negative")
+    if scraping.max_workers <= 0:
+        violations.append("max_workers must be positive")
+    if scraping.max_comments_per_post <= 0:
+        violations.append("max_comments_per_post must be positive")
+    if scraping.max_replies_per_comment <= 0:
+        violations.append("max_replies_per_comment must be positive")
+    if output.save_format not in _SAVE_FORMATS:
+        violations.append(f"save_format must be one of: {', '.join(_SAVE_FORMATS)}")
+    return violations
+
+
+def _check_fields(
+    values: dict[str, Any],
+    field_types: dict[str, tuple[type, ...]],
+    prefix: str,
+    violations: list[str],
+) -> dict[str, Any]:
+    """
+    Check the keys and value types of one object in a config file.
+
+    Args:
+        values: Object to check
+        field_types: Accepted JSON types of each known key
+        prefix: Section name with a trailing dot, prepended to reported keys
+        violations: List the problems found are appended to
+
+    Returns:
+        The entries whose key is known and whose value has an accepted type
+    """
+    valid = {}
+    for key, value in values.items():
+        expected = field_types.get(key)
+        if expected is None:
+            violations.append(f"unknown key '{prefix}{key}'")
+        elif not isinstance(value, expected) or (
+            isinstance(value, bool) and bool not in expected
+        ):
+            type_names = " or ".join(
+                "null" if t is type(None) else t.__name__ for t in expected
+            )
+            violations.append(
+                f"{prefix}{key} must be {type_names}, got {type(value).__name__}"
+            )
+        else:
+            valid[key] = value
+    return valid
 
 
 def get_default_config() -> Config:
@@ -97,44 +195,93 @@ def load_config_from_file(config_path: Path) -> Config | None:
         config_path: Path to the configuration file
 
     Returns:
-        Loaded configuration or None if loading failed
+        Loaded configuration, or None if the file is missing or unreadable
+
+    Raises:
+        ConfigurationError: If the file is not valid JSON or holds invalid
+            settings; context["violations"] lists every problem found
     """
     try:
-        if not config_path.exists():
+        try:
+            raw = config_path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
             logger.debug(f"Config file not found: {config_path}")
             return None
 
-        with open(config_path, encoding="utf-8") as f:
-            data = json.load(f)
+        try:
+            data = decode_json(raw)
+        except json.JSONDecodeError as e:
+            raise _invalid_config(config_path, [f"invalid JSON: {e}"]) from e
+
+        if not isinstance(data, dict):
+            raise _invalid_config(config_path, ["configuration must be a JSON object"])
 
         # Extract configuration sections
         scraping_data = data.get("scraping", {})
         output_data = data.get("output", {})
 
         # Handle special cases for infinity
-        if (
+        if isinstance(scraping_data, dict) and (
             scraping_data.get("max_posts") == "infinity"
             or scraping_data.get("max_posts") is None
         ):
             scraping_data["max_posts"] = math.inf
 
-        config = Config(
-            scraping=ScrapingConfig(**scraping_data),
-            output=OutputConfig(**output_data),
-            log_file=data.get("log_file"),
+        # Every problem is reported at once, so one edit can fix them all.
+        # Values are range checked as long as their own type is right.
+        violations: list[str] = []
+        _check_fields(data, _TOP_LEVEL_TYPES, "", violations)
+        scraping = ScrapingConfig(
+            **_check_fields(
+                scraping_data if isinstance(scraping_data, dict) else {},
+                _FIELD_TYPES["scraping"],
+                "scraping.",
+                violations,
+            )
+        )
+        output = OutputConfig(
+            **_check_fields(
+                output_data if isinstance(output_data, dict) else {},
+                _FIELD_TYPES["output"],
+                "output.",
+                violations,
+            )
         )
+        violations += _value_violations(scraping, output)
+        if violations:
+            raise _invalid_config(config_path, violations)
+
+        config = Config(scraping=scraping, output=output, log_file=data.get("log_file"))
 
         logger.debug(f"Loaded configuration from {config_path}")
         return config
 
-    except (json.JSONDecodeError, TypeError, ValueError) as e:
-        logger.error(f"Error loading config from {config_path}: {e}")
-        return None
+    except ConfigurationError:
+        raise
     except Exception as e:
         logger.error(f"Unexpected error loading config from {config_path}: {e}")
         return None
 
 
+def _invalid_config(config_path: Path, violations: list[str]) -> ConfigurationError:
+    """
+    Build the error raised for a config file with invalid contents.
+
+    Args:
+        config_path: Path of the config file
+        violations: Every problem found in the file
+
+    Returns:
+        ConfigurationError listing the violations in its message and context
+    """
+    logger.error(f"Invalid configuration in {config_path}: {'; '.join(violations)}")
+    return ConfigurationError(
+        f"Invalid configuration in {config_path}: {'; '.join(violations)}",
+        config_file=str(config_path),
+        context={"violations": violations},
+    )
+
+
 def save_config_to_file(config: Config, config_path: Path) -> bool:
     """
     Save configuration to a JSON file.
@@ -164,8 +311,7 @@ def save_config_to_file(config: Config, config_path: Path) -> bool:
         if data["scraping"]["cookies_file"]:
             data["scraping"]["cookies_file"] = str(data["scraping"]["cookies_file"])
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        config_path.write_bytes(encode_json(data, pretty=True))
 
         logger.debug(f"Saved configuration to {config_path}")
         return True
@@ -208,6 +354,9 @@ def load_config(config_path: Path | None = None) -> Config:
 
     Returns:
         Loaded or default configuration
+
+    Raises:
+        ConfigurationError: If a config file holds invalid settings
     """
     if config_path:
         config = load_config_from_file(config_path)
@@ -226,6 +375,24 @@ def load_config(config_path: Path | None = None) -> Config:
     return get_default_config()
 
 
+# Command-line arguments mapped to the section they update; None is the
+# top level config
+_ARG_SECTIONS: dict[str, str | None] = {
+    "max_posts": "scraping",
+    "extract_comments": "scraping",
+    "max_comments_per_post": "scraping",
+    "max_replies_per_comment": "scraping",
+    "download_images": "scraping",
+    "cookies_file": "scraping",
+    "max_workers": "scraping",
+    "output_dir": "output",
+    "log_file": None,
+}
+
+# Arguments converted to Path before they are set
+_PATH_ARGS = frozenset({"output_dir", "log_file"})
+
+
 def update_config_from_args(config: Config, **kwargs: Any) -> Config:
     """
     Update configuration with command-line arguments.
@@ -236,30 +403,43 @@ def update_config_from_args(config: Config, **kwargs: Any) -> Config:
 
     Returns:
         Updated configuration
+
+    Raises:
+        ConfigurationError: If an argument is unknown or the updated settings
+            are invalid; context["violations"] lists every problem found. The
+            config is left unchanged in that case.
     """
-    # Update scraping config
-    scraping_updates = {}
-    for key in [
-        "max_posts",
-        "extract_comments",
-        "max_comments_per_post",
-        "max_replies_per_comment",
-        "download_images",
-        "cookies_file",
-    ]:
-        if key in kwargs and kwargs[key] is not None:
-            scraping_updates[key] = kwargs[key]
-
-    if scraping_updates:
-        for key, value in scraping_updates.items():
-            setattr(config.scraping, key, value)
-
-    # Update output config
-    if "output_dir" in kwargs and kwargs["output_dir"] is not None:
-        config.output.output_dir = Path(kwargs["output_dir"])
-
-    # Update log file
-    if "log_file" in kwargs and kwargs["log_file"] is not None:
-        config.log_file = Path(kwargs["log_file"])
+    violations: list[str] = []
+    updates: dict[str, Any] = {}
+    for key, value in kwargs.items():
+        if key not in _ARG_SECTIONS:
+            violations.append(f"unknown argument '{key}'")
+        elif value is not None:
+            updates[key] = Path(value) if key in _PATH_ARGS else value
+
+    # Values set after construction have not been validated yet, so they are
+    # checked on a copy and only applied once all of them are valid
+    candidate = copy.deepcopy(config)
+    _apply_args(candidate, updates)
+    violations += _value_violations(candidate.scraping, candidate.output)
+    if violations:
+        raise ConfigurationError(
+            f"Invalid configuration: {'; '.join(violations)}",
+            context={"violations": violations},
+        )
 
+    _apply_args(config, updates)
     return config
+
+
+def _apply_args(config: Config, updates: dict[str, Any]) -> None:
+    """
+    Set validated command-line arguments on a configuration.
+
+    Args:
+        config: Configuration to update in place
+        updates: Argument values keyed by names from _ARG_SECTIONS
+    """
+    for key, value in updates.items():
+        section = _ARG_SECTIONS[key]
+        setattr(config if section is None else getattr(config, section), key, value)
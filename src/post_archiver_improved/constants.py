@@ -10,9 +10,14 @@ YOUTUBE_API_BASE_URL = "https://www.youtube.com/youtubei/v1"
 YOUTUBE_BROWSE_ENDPOINT = f"{YOUTUBE_API_BASE_URL}/browse"
 YOUTUBE_NEXT_ENDPOINT = f"{YOUTUBE_API_BASE_URL}/next"
 
+# Seconds a resolved host is reused by pooled connections
+DNS_CACHE_TTL = 300.0
+
 # Request headers
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 YOUTUBE_CLIENT_VERSION = "2.20241113.07.00"
+# Response compressions make_http_request can decode
+ACCEPT_ENCODING = "gzip, deflate"
 
 # Posts tab parameters (URL-safe base64 encoded protobuf: \x12\x05posts\xf2\x06\x04\x0a\x02\x4a\x00)
 POSTS_TAB_PARAMS = "EgVwb3N0c_IGBAoCSgA="
@@ -21,9 +26,30 @@ POSTS_TAB_PARAMS = "EgVwb3N0c_IGBAoCSgA="
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
+# Longest server-requested Retry-After wait honoured before retrying
+MAX_RETRY_AFTER = 60.0
 DEFAULT_MAX_COMMENTS = 100
 DEFAULT_MAX_REPLIES = 200
 
+# Concurrent reply continuation fetches per comment batch
+MAX_REPLY_FETCH_WORKERS = 8
+
+# Default number of posts whose comments and images are fetched at the same
+# time; also caps the image downloads and reply fetches of a scrape
+MAX_POST_WORKERS = 4
+
+# Concurrent image downloads per post
+MAX_IMAGE_DOWNLOAD_WORKERS = 4
+
+# Idle keep-alive connections kept per host. The YouTube API host sees one
+# per reply worker, one per post worker and its comment page prefetch, plus
+# the main scraping thread and its page prefetch. An image host sees up to
+# MAX_IMAGE_DOWNLOAD_WORKERS downloads from every post worker.
+HTTP_POOL_MAXSIZE = max(
+    MAX_REPLY_FETCH_WORKERS + 2 * MAX_POST_WORKERS + 2,
+    MAX_POST_WORKERS * MAX_IMAGE_DOWNLOAD_WORKERS,
+)
+
 # File naming patterns
 POSTS_FILE_PREFIX = "posts"
 SUMMARY_FILE_PREFIX = "summary"
@@ -10,6 +10,28 @@ from __future__ import annotations
 from typing import Any
 
 
+def _with_context(
+    context: dict[str, Any] | None, **fields: Any
+) -> dict[str, Any] | None:
+    """
+    Merge the set error fields into a copy of the caller's context.
+
+    Fields that are empty or None are left out. When none are set the
+    caller's context is returned as is, so no dictionary is built.
+
+    Args:
+        context: Context passed by the caller, if any
+        **fields: Error specific fields to add to the context
+
+    Returns:
+        Merged context, or the caller's context if no field is set
+    """
+    extra = {key: value for key, value in fields.items() if value}
+    if not extra:
+        return context
+    return {**context, **extra} if context else extra
+
+
 class PostArchiverError(Exception):
     """
     Base exception class for post archiver errors.
@@ -93,11 +115,9 @@ class NetworkError(PostArchiverError):
             url: URL that caused the error if applicable
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})
-        if status_code:
-            context["status_code"] = status_code
-        if url:
-            context["url"] = url
+        context = _with_context(
+            kwargs.pop("context", None), status_code=status_code, url=url
+        )
 
         super().__init__(message, context=context, **kwargs)
         self.status_code = status_code
@@ -128,11 +148,9 @@ class APIError(PostArchiverError):
             endpoint: API endpoint that caused the error
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})
-        if endpoint:
-            context["endpoint"] = endpoint
-        if api_response:
-            context["api_response"] = api_response
+        context = _with_context(
+            kwargs.pop("context", None), endpoint=endpoint, api_response=api_response
+        )
 
         super().__init__(message, context=context, **kwargs)
         self.api_response = api_response
@@ -163,11 +181,9 @@ class ParseError(PostArchiverError):
             field_path: JSON path where parsing failed
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})
-        if data_source:
-            context["data_source"] = data_source
-        if field_path:
-            context["field_path"] = field_path
+        context = _with_context(
+            kwargs.pop("context", None), data_source=data_source, field_path=field_path
+        )
 
         super().__init__(message, context=context, **kwargs)
         self.data_source = data_source
@@ -197,14 +213,13 @@ class JSONParseError(ParseError):
             position: Character position where parsing failed
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})
-        if json_text:
-            # Truncate JSON text for logging (first 200 chars)
-            context["json_preview"] = json_text[:200] + (
-                "..." if len(json_text) > 200 else ""
-            )
-        if position:
-            context["position"] = position
+        # Truncate JSON text for logging (first 200 chars)
+        json_preview = json_text and json_text[:200] + (
+            "..." if len(json_text) > 200 else ""
+        )
+        context = _with_context(
+            kwargs.pop("context", None), json_preview=json_preview, position=position
+        )
 
         super().__init__(message, data_source="JSON", context=context, **kwargs)
         self.json_text = json_text
@@ -237,13 +252,14 @@ class ValidationError(PostArchiverError):
             expected_format: Expected format description
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})
-        if field_name:
-            context["field_name"] = field_name
+        context = _with_context(
+            kwargs.pop("context", None),
+            field_name=field_name,
+            expected_format=expected_format,
+        )
         if field_value is not None:
-            context["field_value"] = str(field_value)[:100]  # Truncate long values
-        if expected_format:
-            context["expected_format"] = expected_format
+            # Truncate long values
+            context = {**(context or {}), "field_value": str(field_value)[:100]}
 
         super().__init__(message, context=context, **kwargs)
         self.field_name = field_name
@@ -275,11 +291,9 @@ class ConfigurationError(PostArchiverError):
             config_key: Configuration key that caused the error
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})
-        if config_file:
-            context["config_file"] = config_file
-        if config_key:
-            context["config_key"] = config_key
+        context = _with_context(
+            kwargs.pop("context", None), config_file=config_file, config_key=config_key
+        )
 
         super().__init__(message, context=context, **kwargs)
         self.config_file = config_file
@@ -310,11 +324,9 @@ class FileOperationError(PostArchiverError):
             operation: File operation that failed (read, write, delete, etc.)
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})  # Use pop instead of get
-        if file_path:
-            context["file_path"] = file_path
-        if operation:
-            context["operation"] = operation
+        context = _with_context(
+            kwargs.pop("context", None), file_path=file_path, operation=operation
+        )
 
         super().__init__(message, context=context, **kwargs)
         self.file_path = file_path
@@ -344,11 +356,9 @@ class RateLimitError(NetworkError):
             limit_type: Type of rate limit (e.g., 'api', 'request')
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.get("context", {})
-        if retry_after:
-            context["retry_after"] = retry_after
-        if limit_type:
-            context["limit_type"] = limit_type
+        context = _with_context(
+            kwargs.pop("context", None), retry_after=retry_after, limit_type=limit_type
+        )
 
         super().__init__(message, error_code="RATE_LIMIT", context=context, **kwargs)
         self.retry_after = retry_after
@@ -373,9 +383,9 @@ class TimeoutError(NetworkError):
             timeout_duration: Timeout duration in seconds
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.get("context", {})
-        if timeout_duration:
-            context["timeout_duration"] = timeout_duration
+        context = _with_context(
+            kwargs.pop("context", None), timeout_duration=timeout_duration
+        )
 
         super().__init__(message, error_code="TIMEOUT", context=context, **kwargs)
         self.timeout_duration = timeout_duration
@@ -399,9 +409,7 @@ class ChannelNotFoundError(APIError):
             channel_id: Channel ID that was not found
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.get("context", {})
-        if channel_id:
-            context["channel_id"] = channel_id
+        context = _with_context(kwargs.pop("context", None), channel_id=channel_id)
 
         super().__init__(
             message, error_code="CHANNEL_NOT_FOUND", context=context, **kwargs
@@ -432,11 +440,9 @@ class CommentExtractionError(ParseError):
             comment_id: Specific comment ID if applicable
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.get("context", {})
-        if post_id:
-            context["post_id"] = post_id
-        if comment_id:
-            context["comment_id"] = comment_id
+        context = _with_context(
+            kwargs.pop("context", None), post_id=post_id, comment_id=comment_id
+        )
 
         super().__init__(message, data_source="comments", context=context, **kwargs)
         self.post_id = post_id
@@ -466,11 +472,9 @@ class ImageDownloadError(FileOperationError):
             image_size: Expected image size if known
             **kwargs: Additional arguments passed to parent
         """
-        context = kwargs.pop("context", {})  # Use pop instead of get
-        if image_url:
-            context["image_url"] = image_url
-        if image_size:
-            context["image_size"] = image_size
+        context = _with_context(
+            kwargs.pop("context", None), image_url=image_url, image_size=image_size
+        )
 
         super().__init__(message, operation="download", context=context, **kwargs)
         self.image_url = image_url
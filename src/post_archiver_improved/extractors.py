@@ -7,13 +7,19 @@ from YouTube's API responses into structured data models.
 
 from __future__ import annotations
 
+import functools
+import logging
 import re
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
 
-from .constants import RELATIVE_TIME_INDICATORS, YOUTUBE_BASE_URL
+from .constants import (
+    MAX_REPLY_FETCH_WORKERS,
+    RELATIVE_TIME_INDICATORS,
+    YOUTUBE_BASE_URL,
+)
 from .exceptions import ParseError
 from .logging_config import get_logger
 from .models import Author, Comment, Image, Link, Post
@@ -22,6 +28,111 @@ logger = get_logger(__name__)
 
 # Pre-compiled regex for extracting numeric values from strings
 _RE_EXTRACT_DIGITS = re.compile(r"(\d+)")
+# Abbreviated counts such as "15", "1,234" or "1.2K Comments"
+_RE_EXTRACT_COUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([KMB])?", re.IGNORECASE)
+_COUNT_MULTIPLIERS = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+# Any relative time indicator, matched in a single case-insensitive pass
+_RE_RELATIVE_TIME = re.compile(
+    "|".join(map(re.escape, RELATIVE_TIME_INDICATORS)), re.IGNORECASE
+)
+
+# Known metadataBadgeRenderer styles, checked by set membership
+_VERIFIED_BADGE_STYLES = frozenset(
+    {"BADGE_STYLE_TYPE_VERIFIED", "BADGE_STYLE_TYPE_VERIFIED_ARTIST"}
+)
+_MEMBER_BADGE_STYLES = frozenset({"BADGE_STYLE_TYPE_MEMBER"})
+
+# Shared default for missing nested keys so lookups don't allocate a new dict
+# each time. Read-only: never mutate it.
+_EMPTY: dict[str, Any] = {}
+
+
+def parse_count(text: str) -> int:
+    """
+    Parse a display count such as "5 Comments" or "1.2K" into an integer.
+
+    Args:
+        text: Count text as displayed by YouTube
+
+    Returns:
+        Parsed count, or 0 if the text holds no number
+    """
+    match = _RE_EXTRACT_COUNT.search(text)
+    if not match:
+        return 0
+
+    number = float(match.group(1).replace(",", ""))
+    suffix = match.group(2)
+    if suffix:
+        number *= _COUNT_MULTIPLIERS[suffix.upper()]
+    return int(number)
+
+
+@functools.lru_cache(maxsize=8192)
+def _author_url(canonical_url: str) -> str:
+    """
+    Build an absolute channel URL from a canonical base URL.
+
+    Authors repeat heavily across a post's comments, so results are cached
+    and every comment by the same author shares one string.
+
+    Args:
+        canonical_url: Canonical base URL such as "/@handle"
+
+    Returns:
+        Absolute channel URL
+    """
+    return f"{YOUTUBE_BASE_URL}{canonical_url}"
+
+
+def _extract_run_url(run: dict[str, Any]) -> str:
+    """
+    Extract the absolute link URL of a content run, if it has one.
+
+    Args:
+        run: Content run object
+
+    Returns:
+        Absolute URL, or an empty string if the run is not a link
+    """
+    nav_endpoint = run.get("navigationEndpoint")
+    if not nav_endpoint:
+        return ""
+
+    # Extract URL from various endpoint types
+    if "commandMetadata" in nav_endpoint:
+        web_metadata = nav_endpoint["commandMetadata"].get("webCommandMetadata")
+        url: str = (web_metadata or _EMPTY).get("url", "")
+    elif "urlEndpoint" in nav_endpoint:
+        url = nav_endpoint["urlEndpoint"].get("url", "")
+    elif "browseEndpoint" in nav_endpoint:
+        canonical_url = nav_endpoint["browseEndpoint"].get("canonicalBaseUrl", "")
+        return f"{YOUTUBE_BASE_URL}{canonical_url}" if canonical_url else ""
+    else:
+        return ""
+
+    # Convert relative URLs to absolute
+    if url and url[0] == "/":
+        return f"{YOUTUBE_BASE_URL}{url}"
+    return url
+
+
+def _join_text(content_runs: list[dict[str, Any]] | None) -> str:
+    """
+    Join the text of YouTube 'runs' into a single string.
+
+    Shared by the post and comment extractors. Joining a list comprehension
+    avoids the generator overhead str.join would otherwise add.
+
+    Args:
+        content_runs: List of content run objects
+
+    Returns:
+        Joined plain text
+    """
+    if not content_runs:
+        return ""
+    return "".join([run.get("text", "") for run in content_runs])
 
 
 class PostExtractor:
@@ -43,10 +154,7 @@ class PostExtractor:
         Returns:
             Extracted plain text
         """
-        if not content_runs:
-            return ""
-
-        return "".join(run.get("text", "") for run in content_runs)
+        return _join_text(content_runs)
 
     @staticmethod
     def _extract_links(content_runs: list[dict[str, Any]]) -> list[Link]:
@@ -63,34 +171,12 @@ class PostExtractor:
 
         try:
             for run in content_runs:
-                nav_endpoint = run.get("navigationEndpoint", {})
-                if nav_endpoint:
-                    # Extract URL from various endpoint types
-                    url = None
-
-                    if "commandMetadata" in nav_endpoint:
-                        web_metadata = nav_endpoint["commandMetadata"].get(
-                            "webCommandMetadata", {}
-                        )
-                        url = web_metadata.get("url", "")
-                    elif "urlEndpoint" in nav_endpoint:
-                        url = nav_endpoint["urlEndpoint"].get("url", "")
-                    elif "browseEndpoint" in nav_endpoint:
-                        canonical_url = nav_endpoint["browseEndpoint"].get(
-                            "canonicalBaseUrl", ""
-                        )
-                        if canonical_url:
-                            url = f"{YOUTUBE_BASE_URL}{canonical_url}"
-
-                    if url:
-                        # Convert relative URLs to absolute
-                        if url.startswith("/"):
-                            url = f"{YOUTUBE_BASE_URL}{url}"
-
-                        link_text = run.get("text", "")
-                        links.append(Link(text=link_text, url=url))
+                url = _extract_run_url(run)
+                if url:
+                    links.append(Link(text=run.get("text", ""), url=url))
 
-            logger.debug(f"Extracted {len(links)} links from content")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted {len(links)} links from content")
 
         except Exception as e:
             logger.warning(f"Error extracting links: {e}")
@@ -111,34 +197,36 @@ class PostExtractor:
         author = Author()
 
         try:
-            author_text = post_renderer.get("authorText", {})
-            if "runs" in author_text and author_text["runs"]:
-                author.name = author_text["runs"][0].get("text", "")
+            author_text = post_renderer.get("authorText", _EMPTY)
+            author_runs = author_text.get("runs")
+            if author_runs:
+                first_run = author_runs[0]
+                author.name = first_run.get("text", "")
 
                 # Try navigationEndpoint in runs first
-                author_endpoint = author_text["runs"][0].get("navigationEndpoint", {})
+                author_endpoint = first_run.get("navigationEndpoint", _EMPTY)
                 if "browseEndpoint" in author_endpoint:
                     browse_endpoint = author_endpoint["browseEndpoint"]
                     author.id = browse_endpoint.get("browseId", "")
 
                     canonical_url = browse_endpoint.get("canonicalBaseUrl", "")
                     if canonical_url:
-                        author.url = f"{YOUTUBE_BASE_URL}{canonical_url}"
+                        author.url = _author_url(canonical_url)
 
             # Also try direct authorEndpoint structure
             if not author.id:
-                author_endpoint = post_renderer.get("authorEndpoint", {})
+                author_endpoint = post_renderer.get("authorEndpoint", _EMPTY)
                 if "browseEndpoint" in author_endpoint:
                     browse_endpoint = author_endpoint["browseEndpoint"]
                     author.id = browse_endpoint.get("browseId", "")
 
                     canonical_url = browse_endpoint.get("canonicalBaseUrl", "")
                     if canonical_url:
-                        author.url = f"{YOUTUBE_BASE_URL}{canonical_url}"
+                        author.url = _author_url(canonical_url)
 
             # Extract thumbnail
-            author_thumbnail = post_renderer.get("authorThumbnail", {}).get(
-                "thumbnails", []
+            author_thumbnail = post_renderer.get("authorThumbnail", _EMPTY).get(
+                "thumbnails"
             )
             if author_thumbnail:
                 author.thumbnail = author_thumbnail[-1].get("url", "")
@@ -148,20 +236,23 @@ class PostExtractor:
             for badge in badges:
                 if "metadataBadgeRenderer" in badge:
                     badge_type = badge["metadataBadgeRenderer"].get("style", "")
-                    if "BADGE_STYLE_TYPE_VERIFIED" in badge_type:
+                    if badge_type in _VERIFIED_BADGE_STYLES:
                         author.is_verified = True
-                    elif "BADGE_STYLE_TYPE_MEMBER" in badge_type:
+                    elif badge_type in _MEMBER_BADGE_STYLES:
                         author.is_member = True
+                    if author.is_verified and author.is_member:
+                        break
 
             # Also check authorCommentBadge structure
-            comment_badge = post_renderer.get("authorCommentBadge", {})
+            comment_badge = post_renderer.get("authorCommentBadge", _EMPTY)
             if "authorCommentBadgeRenderer" in comment_badge:
                 badge_renderer = comment_badge["authorCommentBadgeRenderer"]
-                icon = badge_renderer.get("icon", {})
+                icon = badge_renderer.get("icon", _EMPTY)
                 if icon.get("iconType") == "CHECK_CIRCLE_THICK":
                     author.is_verified = True
 
-            logger.debug(f"Extracted author info: {author.name} ({author.id})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted author info: {author.name} ({author.id})")
 
         except Exception as e:
             logger.warning(f"Error extracting author info: {e}")
@@ -185,39 +276,20 @@ class PostExtractor:
         links = []
 
         try:
-            content_text = post_renderer.get("contentText", {})
-            if "runs" in content_text:
-                content = PostExtractor.extract_text_content(content_text["runs"])
+            content_runs = post_renderer.get("contentText", _EMPTY).get("runs")
+            if content_runs is not None:
+                content = _join_text(content_runs)
 
                 # Extract links from runs
-                for run in content_text["runs"]:
-                    nav_endpoint = run.get("navigationEndpoint", {})
-                    if nav_endpoint:
-                        # Extract URL from various endpoint types
-                        url = None
-
-                        if "commandMetadata" in nav_endpoint:
-                            web_metadata = nav_endpoint["commandMetadata"].get(
-                                "webCommandMetadata", {}
-                            )
-                            url = web_metadata.get("url", "")
-                        elif "urlEndpoint" in nav_endpoint:
-                            url = nav_endpoint["urlEndpoint"].get("url", "")
-                        elif "browseEndpoint" in nav_endpoint:
-                            canonical_url = nav_endpoint["browseEndpoint"].get(
-                                "canonicalBaseUrl", ""
-                            )
-                            if canonical_url:
-                                url = f"{YOUTUBE_BASE_URL}{canonical_url}"
-
-                        if url:
-                            # Convert relative URLs to absolute
-                            if url.startswith("/"):
-                                url = f"{YOUTUBE_BASE_URL}{url}"
-
-                            links.append(Link(text=run.get("text", ""), url=url))
+                for run in content_runs:
+                    url = _extract_run_url(run)
+                    if url:
+                        links.append(Link(text=run.get("text", ""), url=url))
 
-            logger.debug(f"Extracted content: {len(content)} chars, {len(links)} links")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Extracted content: {len(content)} chars, {len(links)} links"
+                )
 
         except Exception as e:
             logger.warning(f"Error extracting content and links: {e}")
@@ -281,7 +353,8 @@ class PostExtractor:
                                 Image(src=src_url, width=width, height=height)
                             )
 
-            logger.debug(f"Extracted {len(images)} images")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted {len(images)} images")
 
         except Exception as e:
             logger.warning(f"Error extracting images: {e}")
@@ -299,9 +372,7 @@ class PostExtractor:
         Returns:
             True if timestamp appears to be estimated/relative
         """
-        return any(
-            indicator in timestamp.lower() for indicator in RELATIVE_TIME_INDICATORS
-        )
+        return _RE_RELATIVE_TIME.search(timestamp) is not None
 
     @staticmethod
     def extract_post_data(post_renderer: dict[str, Any]) -> Post:
@@ -349,53 +420,51 @@ class PostExtractor:
             )
 
             # Extract timestamp
-            timestamp_data = post_renderer.get("publishedTimeText", {})
-            if "runs" in timestamp_data and timestamp_data["runs"]:
-                post.timestamp = timestamp_data["runs"][0].get("text", "")
+            try:
+                timestamp_run = post_renderer["publishedTimeText"]["runs"][0]
+            except (KeyError, IndexError):
+                pass
+            else:
+                post.timestamp = timestamp_run.get("text", "")
                 post.timestamp_estimated = PostExtractor._is_timestamp_estimated(
                     post.timestamp
                 )
 
             # Extract engagement metrics
-            vote_count = post_renderer.get("voteCount", {})
+            vote_count = post_renderer.get("voteCount", _EMPTY)
             if "simpleText" in vote_count:
                 post.likes = vote_count["simpleText"]
-            elif "runs" in vote_count and vote_count["runs"]:
-                post.likes = vote_count["runs"][0].get("text", "0")
+            else:
+                vote_runs = vote_count.get("runs")
+                if vote_runs:
+                    post.likes = vote_runs[0].get("text", "0")
 
             # Extract comment count
-            action_buttons = post_renderer.get("actionButtons", {})
-            comment_button = action_buttons.get("commentActionButtonsRenderer", {})
-            reply_button = comment_button.get("replyButton", {})
-            button_renderer = reply_button.get("buttonRenderer", {})
-            button_text = button_renderer.get("text", {})
+            action_buttons = post_renderer.get("actionButtons", _EMPTY)
+            comment_button = action_buttons.get("commentActionButtonsRenderer", _EMPTY)
+            reply_button = comment_button.get("replyButton", _EMPTY)
+            button_renderer = reply_button.get("buttonRenderer", _EMPTY)
+            button_text = button_renderer.get("text", _EMPTY)
 
             if "simpleText" in button_text:
-                comment_text = button_text["simpleText"]
                 # Extract number from text like "5 Comments"
-                match = _RE_EXTRACT_DIGITS.search(comment_text)
-                if match:
-                    post.comments_count = match.group(1)
-                else:
-                    post.comments_count = "0"
-            elif "runs" in button_text and button_text["runs"]:
-                comment_text = button_text["runs"][0].get("text", "")
-                # Extract number from text like "5 Comments" or just "15"
-                match = _RE_EXTRACT_DIGITS.search(comment_text)
-                if match:
-                    post.comments_count = match.group(1)
-                else:
-                    post.comments_count = "0"
+                post.comments_count = parse_count(button_text["simpleText"])
+            else:
+                # Extract number from text like "1.2K Comments" or just "15"
+                button_runs = button_text.get("runs")
+                if button_runs:
+                    post.comments_count = parse_count(button_runs[0].get("text", ""))
 
             # Check for members-only content
             post.members_only = "sponsorsOnlyBadge" in post_renderer
 
             # Extract images
-            attachment = post_renderer.get("backstageAttachment", {})
+            attachment = post_renderer.get("backstageAttachment")
             if attachment:
                 post.images = PostExtractor._extract_images(attachment)
 
-            logger.debug(f"Successfully extracted post data: {post.post_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Successfully extracted post data: {post.post_id}")
             return post
 
         except Exception as e:
@@ -411,14 +480,18 @@ class CommentExtractor:
     API response formats and converts them into structured Comment objects.
     """
 
-    def __init__(self, api_client: Any) -> None:
+    def __init__(
+        self, api_client: Any, max_workers: int = MAX_REPLY_FETCH_WORKERS
+    ) -> None:
         """
         Initialize comment extractor.
 
         Args:
             api_client: YouTube API client instance
+            max_workers: Maximum number of simultaneous reply fetches
         """
         self.api = api_client
+        self.max_workers = max_workers
         logger.debug("Comment extractor initialized")
 
     @staticmethod
@@ -549,7 +622,7 @@ class CommentExtractor:
         """
         from .comment_processor import CommentProcessor
 
-        processor = CommentProcessor(self.api, self)
+        processor = CommentProcessor(self.api, self, self.max_workers)
         return processor.extract_comments(
             channel_id, post_id, max_comments, max_replies_per_comment
         )
@@ -637,7 +710,7 @@ class CommentExtractor:
                 content = content_data["content"]
             elif "runs" in content_data:
                 # Handle runs format like {"runs": [{"text": "..."}]}
-                content = "".join(run.get("text", "") for run in content_data["runs"])
+                content = _join_text(content_data["runs"])
             else:
                 content = ""
 
@@ -662,13 +735,13 @@ class CommentExtractor:
                     "canonicalBaseUrl", ""
                 )
                 if canonical_url:
-                    author.url = f"{YOUTUBE_BASE_URL}{canonical_url}"
+                    author.url = _author_url(canonical_url)
             elif "commandMetadata" in channel_command:
                 web_metadata = channel_command["commandMetadata"].get(
                     "webCommandMetadata", {}
                 )
                 if "url" in web_metadata:
-                    author.url = f"{YOUTUBE_BASE_URL}{web_metadata['url']}"
+                    author.url = _author_url(web_metadata["url"])
 
             # Extract toolbar data (likes, favorited status, reply count)
             like_count, is_favorited, reply_count = self._extract_toolbar_data(
@@ -686,7 +759,8 @@ class CommentExtractor:
                 reply_count=reply_count,
             )
 
-            logger.debug(f"Extracted comment from entity: {comment_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted comment from entity: {comment_id}")
             return comment
 
         except Exception as e:
@@ -770,7 +844,7 @@ class CommentExtractor:
             if content_text is None:
                 content_text = {}
             content_runs = content_text.get("runs", [])
-            content = PostExtractor.extract_text_content(content_runs)
+            content = _join_text(content_runs)
 
             # Extract metrics
             vote_count = comment_renderer.get("voteCount", {})
@@ -812,7 +886,7 @@ class CommentExtractor:
                 author.id = browse_endpoint.get("browseId", "")
                 canonical_url = browse_endpoint.get("canonicalBaseUrl", "")
                 if canonical_url:
-                    author.url = f"{YOUTUBE_BASE_URL}{canonical_url}"
+                    author.url = _author_url(canonical_url)
 
             # Extract author thumbnail
             author_thumbnails = comment_renderer.get("authorThumbnail", {}).get(
@@ -826,9 +900,9 @@ class CommentExtractor:
             for badge in author_badges:
                 if "metadataBadgeRenderer" in badge:
                     badge_style = badge["metadataBadgeRenderer"].get("style", "")
-                    if "BADGE_STYLE_TYPE_VERIFIED" in badge_style:
+                    if badge_style in _VERIFIED_BADGE_STYLES:
                         author.is_verified = True
-                    elif "BADGE_STYLE_TYPE_MEMBER" in badge_style:
+                    elif badge_style in _MEMBER_BADGE_STYLES:
                         author.is_member = True
                 elif "liveChatAuthorBadgeRenderer" in badge:
                     badge_data = badge["liveChatAuthorBadgeRenderer"]
@@ -838,6 +912,8 @@ class CommentExtractor:
                             author.is_verified = True
                         elif "MEMBER" in badge_type:
                             author.is_member = True
+                if author.is_verified and author.is_member:
+                    break
 
             # Also check authorCommentBadge structure
             comment_badge = comment_renderer.get("authorCommentBadge", {})
@@ -898,7 +974,8 @@ class CommentExtractor:
                 reply_count=reply_count,
             )
 
-            logger.debug(f"Extracted comment from renderer: {comment_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted comment from renderer: {comment_id}")
             return comment
 
         except Exception as e:
@@ -7,11 +7,16 @@ and related metadata. Uses slots=True on Python 3.10+ for memory efficiency.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
+# Instances are created per post/comment, so drop the per-instance __dict__
+# where the running Python supports it.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Author:
     """Represents a YouTube channel author."""
 
@@ -23,7 +28,7 @@ class Author:
     is_member: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Link:
     """Represents a link within post or comment content."""
 
@@ -31,7 +36,7 @@ class Link:
     url: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Image:
     """Represents an image attachment."""
 
@@ -42,7 +47,7 @@ class Image:
     file_size: int | None = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Comment:
     """Represents a comment on a community post."""
 
@@ -105,7 +110,7 @@ class Comment:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Post:
     """Represents a YouTube community post."""
 
@@ -114,7 +119,7 @@ class Post:
     timestamp: str = ""
     timestamp_estimated: bool = False
     likes: str = "0"
-    comments_count: str = "0"
+    comments_count: int = 0
     members_only: bool = False
     author: Author = field(default_factory=Author)
     images: list[Image] = field(default_factory=list)
@@ -191,7 +196,7 @@ class Post:
             timestamp=data.get("timestamp", ""),
             timestamp_estimated=data.get("timestamp_estimated", False),
             likes=data.get("likes", "0"),
-            comments_count=data.get("comments_count", "0"),
+            comments_count=_parse_comments_count(data.get("comments_count", 0)),
             members_only=data.get("members_only", False),
             author=author,
             images=images,
@@ -200,7 +205,31 @@ class Post:
         )
 
 
-@dataclass
+def _parse_comments_count(value: Any) -> int:
+    """
+    Read a stored comments_count leniently.
+
+    Archives written before the count became an integer hold the display
+    text, such as "25", "1.2K" or "", so strings are parsed like the comment
+    button text.
+
+    Args:
+        value: Stored comments_count value
+
+    Returns:
+        Comment count, or 0 if the value holds no number
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        # Imported here because extractors builds on these models
+        from .extractors import parse_count
+
+        return parse_count(value)
+    return 0
+
+
+@dataclass(**_SLOTS)
 class ArchiveMetadata:
     """Metadata for an archive session."""
 
@@ -227,7 +256,7 @@ class ArchiveMetadata:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ArchiveData:
     """Complete archive data including metadata and posts."""
 
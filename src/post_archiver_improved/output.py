@@ -7,7 +7,6 @@ with proper error handling and backup creation.
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,7 +15,7 @@ from .config import OutputConfig
 from .exceptions import FileOperationError
 from .logging_config import get_logger
 from .models import ArchiveData
-from .utils import create_backup_filename, format_file_size
+from .utils import create_backup_filename, encode_json, format_file_size
 
 logger = get_logger(__name__)
 
@@ -125,20 +124,10 @@ class OutputManager:
             FileOperationError: If saving fails
         """
         try:
-            data = archive_data.to_dict()
+            data = encode_json(archive_data.to_dict(), pretty=self.config.pretty_print)
 
-            # Configure JSON formatting
-            if self.config.pretty_print:
-                indent = 2
-                separators = (",", ": ")
-            else:
-                indent = None
-                separators = (",", ":")
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    data, f, ensure_ascii=False, indent=indent, separators=separators
-                )
+            with open(file_path, "wb") as f:
+                f.write(data)
 
             logger.debug(f"JSON file saved: {file_path}")
 
@@ -9,18 +9,22 @@ from __future__ import annotations
 
 import math
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from .api import YouTubeCommunityAPI
 from .config import Config
+from .constants import MAX_IMAGE_DOWNLOAD_WORKERS, MAX_REPLY_FETCH_WORKERS
 from .exceptions import APIError, ValidationError
 from .extractors import CommentExtractor, PostExtractor
 from .logging_config import get_logger
 from .models import ArchiveData, ArchiveMetadata, Comment, Post
 from .utils import (
-    download_image,
+    download_images,
     is_post_url_or_id,
     validate_channel_id,
 )
@@ -54,9 +58,21 @@ class CommunityPostScraper:
             retry_delay=config.scraping.retry_delay,
             cookies_file=cookies_file_path,
         )
+
         self.post_extractor = PostExtractor()
+        self._max_workers = config.scraping.max_workers
         self.comment_extractor = (
-            CommentExtractor(self.api) if config.scraping.extract_comments else None
+            CommentExtractor(self.api, min(self._max_workers, MAX_REPLY_FETCH_WORKERS))
+            if config.scraping.extract_comments
+            else None
+        )
+
+        # Per-post feature switches, resolved once instead of for every post
+        self._download_images_enabled = bool(
+            config.scraping.download_images and config.output.output_dir
+        )
+        self._extract_comments_enabled = bool(
+            config.scraping.extract_comments and self.comment_extractor
         )
 
         logger.info("Community post scraper initialized")
@@ -81,7 +97,74 @@ class CommunityPostScraper:
             APIError: If API requests fail
             ParseError: If response parsing fails
         """
-        # Validate input
+        resolved_channel_id = self._resolve_channel_id(channel_id)
+
+        start_time = time.time()
+
+        # Initialize archive data; both scrape fields describe the same instant
+        now = datetime.now()
+        metadata = ArchiveMetadata(
+            channel_id=resolved_channel_id,
+            scrape_date=now.isoformat(),
+            scrape_timestamp=int(now.timestamp()),
+            posts_count=0,
+            config_used=self._get_config_summary(),
+        )
+        archive_data = ArchiveData(metadata=metadata)
+
+        try:
+            archive_data.posts = list(
+                self._iter_channel_posts(channel_id, resolved_channel_id)
+            )
+
+            # Update final metadata
+            archive_data.metadata.posts_count = len(archive_data.posts)
+
+            elapsed_time = time.time() - start_time
+            logger.info(
+                f"Scraping completed: {len(archive_data.posts)} posts in {elapsed_time:.1f}s"
+            )
+
+            return archive_data
+
+        except Exception as e:
+            logger.error(f"Error during scraping: {e}")
+            raise
+
+    def iter_posts(self, channel_id: str) -> Iterator[Post]:
+        """
+        Iterate over community posts from a YouTube channel.
+
+        Posts are yielded as soon as they are processed, so callers that write
+        them out incrementally never hold the whole archive in memory.
+
+        Args:
+            channel_id: YouTube channel ID or handle
+
+        Returns:
+            Iterator over processed Post objects
+
+        Raises:
+            ValidationError: If channel_id is invalid
+            APIError: If API requests fail
+        """
+        resolved_channel_id = self._resolve_channel_id(channel_id)
+        return self._iter_channel_posts(channel_id, resolved_channel_id)
+
+    def _resolve_channel_id(self, channel_id: str) -> str:
+        """
+        Validate a channel ID and resolve it if it is a handle.
+
+        Args:
+            channel_id: YouTube channel ID or handle
+
+        Returns:
+            Resolved channel ID
+
+        Raises:
+            ValidationError: If channel_id is invalid
+            APIError: If handle resolution fails
+        """
         if not validate_channel_id(channel_id):
             raise ValidationError(f"Invalid channel ID format: {channel_id}")
 
@@ -94,79 +177,111 @@ class CommunityPostScraper:
                 f"Resolved handle {channel_id} to channel ID: {resolved_channel_id}"
             )
 
-        logger.info(f"Starting to scrape posts for channel: {channel_id}")
-        start_time = time.time()
+        return resolved_channel_id
 
-        # Initialize archive data
-        metadata = ArchiveMetadata(
-            channel_id=resolved_channel_id,
-            scrape_date=datetime.now().isoformat(),
-            scrape_timestamp=int(datetime.now().timestamp()),
-            posts_count=0,
-            config_used=self._get_config_summary(),
-        )
-        archive_data = ArchiveData(metadata=metadata)
+    def _iter_channel_posts(
+        self, channel_id: str, resolved_channel_id: str
+    ) -> Iterator[Post]:
+        """
+        Fetch and yield posts page by page, following continuation tokens.
 
-        try:
-            # Get initial data
-            logger.info("Fetching initial channel data...")
-            response = self.api.get_initial_data(channel_id)
-
-            # Find community tab
-            community_tab = self._find_community_tab(response)
-            if not community_tab:
-                logger.warning("No community tab found for this channel")
-                return archive_data
+        Args:
+            channel_id: YouTube channel ID or handle as given by the caller
+            resolved_channel_id: Channel ID with any handle resolved
 
-            # Extract initial posts
-            contents = self._extract_tab_contents(community_tab)
-            continuation_token = self._find_continuation_token(contents)
+        Yields:
+            Processed Post objects
+        """
+        logger.info(f"Starting to scrape posts for channel: {channel_id}")
 
-            # Process initial batch
-            posts = self._process_posts_batch(contents, resolved_channel_id)
-            archive_data.posts.extend(posts)
+        # Get initial data
+        logger.info("Fetching initial channel data...")
+        response = self.api.get_initial_data(channel_id)
 
-            logger.info(f"Processed initial batch: {len(posts)} posts")
+        # Find community tab
+        community_tab = self._find_community_tab(response)
+        if not community_tab:
+            logger.warning("No community tab found for this channel")
+            return
 
-            # Process continuation batches
-            max_posts = self.config.scraping.max_posts
-            while continuation_token and (
-                max_posts is None or len(archive_data.posts) < max_posts
-            ):
-                try:
-                    logger.debug(
-                        f"Fetching continuation data (posts so far: {len(archive_data.posts)})"
+        # Extract initial posts
+        contents = self._extract_tab_contents(community_tab)
+        continuation_token = self._find_continuation_token(contents)
+        # Only the posts subtree is kept; the rest of the channel page can be
+        # freed instead of living for the whole scrape
+        del response, community_tab
+
+        max_posts = self.config.scraping.max_posts
+        retry_delay = self.config.scraping.retry_delay
+        # Rate limiting: earliest time the next continuation request may start.
+        # Time spent fetching and processing a page counts towards the delay.
+        next_request_time = time.monotonic()
+        posts_count = 0
+        initial_batch = True
+        # Continuation pages occasionally repeat posts from earlier pages
+        seen_post_ids: set[str] = set()
+
+        # A single worker fetches the next page while the current one is being
+        # processed, so network latency overlaps with comment/image extraction.
+        with ThreadPoolExecutor(max_workers=1) as prefetch_pool:
+            while True:
+                next_page: Future[tuple[dict[str, Any], float]] | None = None
+                if continuation_token and not self._batch_fills_limit(
+                    contents, posts_count
+                ):
+                    next_page = prefetch_pool.submit(
+                        self._fetch_continuation, continuation_token, next_request_time
                     )
-                    response = self.api.get_continuation_data(continuation_token)
 
-                    contents = self._extract_continuation_contents(response)
-                    continuation_token = self._find_continuation_token(contents)
-
-                    remaining_posts = None
-                    if max_posts is not None and max_posts != math.inf:
-                        remaining_posts = int(max_posts - len(archive_data.posts))
-                    posts = self._process_posts_batch(
-                        contents, resolved_channel_id, max_posts=remaining_posts
+                # The initial batch is processed in full; continuation batches
+                # are capped at the number of posts still wanted.
+                remaining_posts = (
+                    None if initial_batch else self._remaining_posts(posts_count)
+                )
+                batch_count = 0
+                for post in self._iter_posts_batch(
+                    contents,
+                    resolved_channel_id,
+                    max_posts=remaining_posts,
+                    seen_post_ids=seen_post_ids,
+                ):
+                    batch_count += 1
+                    posts_count += 1
+                    yield post
+
+                if initial_batch:
+                    logger.info(f"Processed initial batch: {batch_count} posts")
+                    initial_batch = False
+                elif batch_count:
+                    logger.info(
+                        f"Processed continuation batch: {batch_count} posts "
+                        f"(total: {posts_count})"
                     )
+                elif continuation_token:
+                    logger.debug(
+                        "No posts in this batch, following continuation token..."
+                    )
+                else:
+                    logger.info("No more posts found, stopping...")
 
-                    if not posts:
-                        if continuation_token:
-                            logger.debug(
-                                "No posts in this batch, following continuation token..."
-                            )
-                            continue
-                        logger.info("No more posts found, stopping...")
-                        break
+                if not continuation_token or (
+                    max_posts is not None and posts_count >= max_posts
+                ):
+                    break
 
-                    archive_data.posts.extend(posts)
-                    logger.info(
-                        f"Processed continuation batch: {len(posts)} posts "
-                        f"(total: {len(archive_data.posts)})"
-                    )
+                try:
+                    if next_page is None:
+                        next_page = prefetch_pool.submit(
+                            self._fetch_continuation,
+                            continuation_token,
+                            next_request_time,
+                        )
+                    response, fetched_at = next_page.result()
+                    next_request_time = fetched_at + retry_delay
 
-                    # Rate limiting
-                    if self.config.scraping.retry_delay > 0:
-                        time.sleep(self.config.scraping.retry_delay)
+                    contents = self._extract_continuation_contents(response)
+                    continuation_token = self._find_continuation_token(contents)
+                    del response
 
                 except APIError as e:
                     logger.error(f"API error during continuation: {e}")
@@ -175,19 +290,64 @@ class CommunityPostScraper:
                     logger.error(f"Unexpected error during continuation: {e}")
                     break
 
-            # Update final metadata
-            archive_data.metadata.posts_count = len(archive_data.posts)
+    def _fetch_continuation(
+        self, continuation_token: str, not_before: float
+    ) -> tuple[dict[str, Any], float]:
+        """
+        Fetch a continuation page once the rate limit allows it.
 
-            elapsed_time = time.time() - start_time
-            logger.info(
-                f"Scraping completed: {len(archive_data.posts)} posts in {elapsed_time:.1f}s"
-            )
+        Args:
+            continuation_token: Continuation token of the page to fetch
+            not_before: Earliest time.monotonic() value the request may start at
 
-            return archive_data
+        Returns:
+            Tuple of (continuation response, time.monotonic() when it finished)
+        """
+        wait_time = not_before - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
 
-        except Exception as e:
-            logger.error(f"Error during scraping: {e}")
-            raise
+        logger.debug(f"Fetching continuation data: {continuation_token[:20]}...")
+        response = self.api.get_continuation_data(continuation_token)
+        return response, time.monotonic()
+
+    def _remaining_posts(self, posts_count: int) -> int | None:
+        """
+        Get how many more posts may be scraped.
+
+        Args:
+            posts_count: Number of posts scraped so far
+
+        Returns:
+            Number of remaining posts, or None if unlimited
+        """
+        max_posts = self.config.scraping.max_posts
+        if max_posts is None or max_posts == math.inf:
+            return None
+        return int(max_posts - posts_count)
+
+    def _batch_fills_limit(
+        self, contents: list[dict[str, Any]], posts_count: int
+    ) -> bool:
+        """
+        Check whether a batch holds enough posts to reach max_posts.
+
+        Used to avoid prefetching a page that will never be processed.
+
+        Args:
+            contents: List of content items
+            posts_count: Number of posts scraped before this batch
+
+        Returns:
+            True if the batch can reach the configured limit on its own
+        """
+        remaining_posts = self._remaining_posts(posts_count)
+        if remaining_posts is None:
+            return False
+        batch_size = sum(
+            1 for content in contents if "backstagePostThreadRenderer" in content
+        )
+        return batch_size >= remaining_posts
 
     def _find_community_tab(self, response: dict[str, Any]) -> dict[str, Any] | None:
         """
@@ -297,7 +457,9 @@ class CommunityPostScraper:
             Continuation token or None if not found
         """
         try:
-            for item in contents:
+            # The next page's token is appended after the posts, so scan from
+            # the end instead of past every post renderer
+            for item in reversed(contents):
                 if "continuationItemRenderer" in item:
                     continuation_endpoint = item["continuationItemRenderer"].get(
                         "continuationEndpoint", {}
@@ -334,51 +496,193 @@ class CommunityPostScraper:
         Returns:
             List of processed Post objects
         """
-        posts = []
-        processed_count = 0
+        return list(self._iter_posts_batch(contents, channel_id, max_posts))
 
-        for content in contents:
-            if "backstagePostThreadRenderer" in content:
-                if max_posts and processed_count >= max_posts:
-                    break
+    def _iter_posts_batch(
+        self,
+        contents: list[dict[str, Any]],
+        channel_id: str,
+        max_posts: int | None = None,
+        seen_post_ids: set[str] | None = None,
+    ) -> Iterator[Post]:
+        """
+        Process content items lazily, yielding each post once it is complete.
 
-                try:
-                    post_renderer = content["backstagePostThreadRenderer"]["post"][
-                        "backstagePostRenderer"
-                    ]
-                    post = self.post_extractor.extract_post_data(post_renderer)
+        Args:
+            contents: List of content items
+            channel_id: YouTube channel ID
+            max_posts: Maximum number of posts to process
+            seen_post_ids: IDs of posts already processed; posts in it are
+                skipped and newly processed ones are added
 
-                    # Download images if configured
-                    if (
-                        self.config.scraping.download_images
-                        and post.images
-                        and self.config.output.output_dir
-                    ):
-                        self._download_post_images(post)
-
-                    # Extract comments if configured
-                    if (
-                        self.config.scraping.extract_comments
-                        and self.comment_extractor
-                        and post.comments_count != "0"
-                    ):
-                        post.comments = self._extract_post_comments(
-                            channel_id, post.post_id
-                        )
+        Returns:
+            Iterator over processed Post objects
+        """
+        thread_renderers: Iterator[dict[str, Any]] = (
+            content["backstagePostThreadRenderer"]
+            for content in contents
+            if "backstagePostThreadRenderer" in content
+        )
+        if seen_post_ids is not None:
+            thread_renderers = self._skip_seen_posts(thread_renderers, seen_post_ids)
+        if self._extract_comments_enabled or self._download_images_enabled:
+            return self._iter_posts_concurrently(
+                thread_renderers, channel_id, max_posts
+            )
 
-                    posts.append(post)
-                    processed_count += 1
+        posts = filter(
+            None,
+            (
+                self._process_post(thread_renderer, channel_id)
+                for thread_renderer in thread_renderers
+            ),
+        )
 
-                    logger.debug(
-                        f"Processed post: {post.post_id} "
-                        f"(comments: {len(post.comments)}, images: {len(post.images)})"
-                    )
+        if max_posts:
+            return islice(posts, max_posts)
+        return posts
 
-                except Exception as e:
-                    logger.warning(f"Error processing post: {e}")
+    @staticmethod
+    def _skip_seen_posts(
+        thread_renderers: Iterator[dict[str, Any]], seen_post_ids: set[str]
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Drop thread renderers of posts that were already processed.
+
+        Args:
+            thread_renderers: backstagePostThreadRenderer content items
+            seen_post_ids: IDs of posts already processed, updated in place
+
+        Yields:
+            Thread renderers of posts not seen before
+        """
+        for thread_renderer in thread_renderers:
+            post_id = (
+                thread_renderer.get("post", {})
+                .get("backstagePostRenderer", {})
+                .get("postId")
+            )
+            if post_id:
+                if post_id in seen_post_ids:
+                    logger.debug(f"Skipping repeated post: {post_id}")
                     continue
+                seen_post_ids.add(post_id)
+            yield thread_renderer
 
-        return posts
+    def _iter_posts_concurrently(
+        self,
+        thread_renderers: Iterator[dict[str, Any]],
+        channel_id: str,
+        max_posts: int | None = None,
+    ) -> Iterator[Post]:
+        """
+        Process posts with their comments and images fetched on a worker pool.
+
+        Post data is extracted in order on the calling thread and only the
+        network bound work runs on the workers. Posts are yielded in their
+        original order, and no post past max_posts is started.
+
+        Args:
+            thread_renderers: backstagePostThreadRenderer content items
+            channel_id: YouTube channel ID
+            max_posts: Maximum number of posts to process
+
+        Yields:
+            Processed Post objects
+        """
+        posts: Iterator[Post] = filter(None, map(self._extract_post, thread_renderers))
+        if max_posts:
+            posts = islice(posts, max_posts)
+
+        pending: deque[Future[Post | None]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="post-fetch"
+        ) as executor:
+            try:
+                for post in posts:
+                    pending.append(
+                        executor.submit(self._fetch_post_extras, post, channel_id)
+                    )
+                    if len(pending) < self._max_workers:
+                        continue
+                    completed = pending.popleft().result()
+                    if completed is not None:
+                        yield completed
+
+                while pending:
+                    completed = pending.popleft().result()
+                    if completed is not None:
+                        yield completed
+            finally:
+                # Posts the caller no longer wants are not fetched
+                for future in pending:
+                    future.cancel()
+
+    def _process_post(
+        self, thread_renderer: dict[str, Any], channel_id: str
+    ) -> Post | None:
+        """
+        Extract a single post and fetch its images and comments if configured.
+
+        Args:
+            thread_renderer: backstagePostThreadRenderer content item
+            channel_id: YouTube channel ID
+
+        Returns:
+            Processed Post object or None if processing fails
+        """
+        post = self._extract_post(thread_renderer)
+        if post is None:
+            return None
+        return self._fetch_post_extras(post, channel_id)
+
+    def _extract_post(self, thread_renderer: dict[str, Any]) -> Post | None:
+        """
+        Extract the data of a single post from its thread renderer.
+
+        Args:
+            thread_renderer: backstagePostThreadRenderer content item
+
+        Returns:
+            Post object or None if extraction fails
+        """
+        try:
+            post_renderer = thread_renderer["post"]["backstagePostRenderer"]
+            return self.post_extractor.extract_post_data(post_renderer)
+        except Exception as e:
+            logger.warning(f"Error processing post: {e}")
+            return None
+
+    def _fetch_post_extras(self, post: Post, channel_id: str) -> Post | None:
+        """
+        Download the images and extract the comments of a post if configured.
+
+        Args:
+            post: Extracted Post object
+            channel_id: YouTube channel ID
+
+        Returns:
+            The completed Post object or None if processing fails
+        """
+        try:
+            # Download images if configured
+            if self._download_images_enabled and post.images:
+                self._download_post_images(post)
+
+            # Extract comments if configured
+            if self._extract_comments_enabled and post.comments_count > 0:
+                post.comments = self._extract_post_comments(channel_id, post.post_id)
+
+            logger.debug(
+                f"Processed post: {post.post_id} "
+                f"(comments: {len(post.comments)}, images: {len(post.images)})"
+            )
+
+            return post
+
+        except Exception as e:
+            logger.warning(f"Error processing post: {e}")
+            return None
 
     def _download_post_images(self, post: Post) -> None:
         """
@@ -391,43 +695,37 @@ class CommunityPostScraper:
             logger.warning("No output directory configured for image downloads")
             return
 
-        for i, image in enumerate(post.images):
-            if not image.src:
-                continue
-
-            try:
-                # Generate filename
-                if len(post.images) > 1:
-                    filename = f"{post.post_id}_image_{i + 1}"
-                else:
-                    filename = post.post_id
-
-                # Download image
-                downloaded_path = download_image(
-                    image_url=image.src,
-                    filename=filename,
-                    output_dir=self.config.output.output_dir,
-                    timeout=self.config.scraping.request_timeout,
-                    max_retries=self.config.scraping.max_retries,
-                )
+        # Number the files only when the post has several images
+        numbered = len(post.images) > 1
+        images = [(i, image) for i, image in enumerate(post.images, 1) if image.src]
+
+        downloaded_paths = download_images(
+            [
+                (image.src, f"{post.post_id}_image_{i}" if numbered else post.post_id)
+                for i, image in images
+            ],
+            output_dir=self.config.output.output_dir,
+            timeout=self.config.scraping.request_timeout,
+            max_retries=self.config.scraping.max_retries,
+            max_workers=min(self._max_workers, MAX_IMAGE_DOWNLOAD_WORKERS),
+        )
 
-                if downloaded_path:
-                    image.local_path = downloaded_path
+        for (_, image), downloaded_path in zip(images, downloaded_paths):
+            if not downloaded_path:
+                logger.warning(f"Failed to download image: {image.src}")
+                continue
 
-                    # Get file size
-                    try:
-                        file_path = Path(downloaded_path)
-                        if file_path.exists():
-                            image.file_size = file_path.stat().st_size
-                    except OSError:
-                        pass
+            image.local_path = downloaded_path
 
-                    logger.info(f"Downloaded image: {downloaded_path}")
-                else:
-                    logger.warning(f"Failed to download image: {image.src}")
+            # Get file size
+            try:
+                file_path = Path(downloaded_path)
+                if file_path.exists():
+                    image.file_size = file_path.stat().st_size
+            except OSError:
+                pass
 
-            except Exception as e:
-                logger.error(f"Error downloading image {image.src}: {e}")
+            logger.info(f"Downloaded image: {downloaded_path}")
 
     def _extract_post_comments(self, channel_id: str, post_id: str) -> list[Comment]:
         """
@@ -484,10 +782,11 @@ class CommunityPostScraper:
         start_time = time.time()
 
         # Initialize archive data with placeholder metadata
+        now = datetime.now()
         metadata = ArchiveMetadata(
             channel_id=f"post_{post_id}",  # Use post-specific identifier for filename
-            scrape_date=datetime.now().isoformat(),
-            scrape_timestamp=int(datetime.now().timestamp()),
+            scrape_date=now.isoformat(),
+            scrape_timestamp=int(now.timestamp()),
             posts_count=0,
             config_used=self._get_config_summary(),
         )
@@ -509,15 +808,11 @@ class CommunityPostScraper:
             archive_data.metadata.channel_id = post.author.id or "unknown"
 
             # Download images if configured
-            if (
-                self.config.scraping.download_images
-                and post.images
-                and self.config.output.output_dir
-            ):
+            if self._download_images_enabled and post.images:
                 self._download_post_images(post)
 
             # Extract comments if configured
-            if self.config.scraping.extract_comments and self.comment_extractor:
+            if self._extract_comments_enabled:
                 logger.debug(
                     f"Attempting to extract comments for individual post: {post.post_id}"
                 )
@@ -648,4 +943,5 @@ class CommunityPostScraper:
             "download_images": self.config.scraping.download_images,
             "request_timeout": self.config.scraping.request_timeout,
             "max_retries": self.config.scraping.max_retries,
+            "max_workers": self.config.scraping.max_workers,
         }
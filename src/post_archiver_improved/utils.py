@@ -7,28 +7,397 @@ and other common tasks.
 
 from __future__ import annotations
 
+import functools
+import gzip
 import hashlib
+import http.client
 import json
+import logging
+import math
+import os
 import re
-import shutil
+import socket
+import string
+import threading
 import time
-from datetime import datetime
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-
+from urllib.request import HTTPHandler, HTTPSHandler, Request, build_opener
+
+from .constants import (
+    DEFAULT_USER_AGENT,
+    DNS_CACHE_TTL,
+    HTTP_POOL_MAXSIZE,
+    MAX_IMAGE_DOWNLOAD_WORKERS,
+    MAX_RETRY_AFTER,
+)
 from .exceptions import FileOperationError, NetworkError, RateLimitError
 from .logging_config import get_logger
 
+# Optional faster JSON codec; the standard library is used when it is missing
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 # Pre-compiled regex patterns for performance
-_RE_EXTENSION_CLEAN = re.compile(r"[^a-zA-Z0-9]")
 _RE_SANITIZE_FILENAME = re.compile(r"[^\w\-_.]")
 _RE_COLLAPSE_UNDERSCORES = re.compile(r"_+")
+# Same replacement as _RE_SANITIZE_FILENAME, for ASCII-only names where \w
+# is just letters, digits and the underscore
+_SANITIZE_ASCII_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_.")}
+)
 _RE_POST_ID = re.compile(r"/post/([a-zA-Z0-9_-]+)")
+# "@" followed by letters, digits, underscores and hyphens, with at least one
+# letter or digit
+_RE_CHANNEL_HANDLE = re.compile(r"@[\w-]*[^\W_][\w-]*")
+# Characters of YouTube channel and post IDs, the same set _RE_POST_ID accepts
+_ID_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
+
+# Read size for downloaded images; each chunk goes straight to an unbuffered
+# file, so most images reach the disk in a single write
+_IMAGE_CHUNK_SIZE = 256 * 1024
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+_IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif", "webp", "bmp", "svg"})
+
+# Image bodies are streamed to disk as is, so no content coding is accepted.
+# Connection reuse is handled by the keep-alive pool.
+_IMAGE_REQUEST_HEADERS = {
+    "User-Agent": DEFAULT_USER_AGENT,
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "identity",
+    "DNT": "1",
+}
+
+# Module-level DNS cache for pooled connections: (host, port) -> (expiry,
+# socket addresses). Only successful lookups are cached.
+_dns_cache: dict[tuple[str, int], tuple[float, list[tuple[Any, ...]]]] = {}
+_dns_cache_lock = threading.Lock()
+
+
+def _resolve(host: str, port: int) -> list[tuple[Any, ...]]:
+    """
+    Resolve a host for a pooled connection, reusing recent results.
+
+    Results are kept for DNS_CACHE_TTL seconds, so the connections opened
+    during a scrape share one lookup per host.
+
+    Args:
+        host: Host name to resolve
+        port: Port the connection will be made to
+
+    Returns:
+        getaddrinfo results for the host
+
+    Raises:
+        OSError: If the host cannot be resolved
+    """
+    key = (host, port)
+    entry = _dns_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    results = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    with _dns_cache_lock:
+        _dns_cache[key] = (time.monotonic() + DNS_CACHE_TTL, results)
+    return results
+
+
+def _create_connection(
+    address: tuple[str, int],
+    timeout: Any,
+    source_address: tuple[str, int] | None = None,
+) -> socket.socket:
+    """
+    Open a socket like socket.create_connection, resolving through _resolve.
+
+    Each cached address is tried in turn. When none of them accepts the
+    connection the cache entry is dropped, so the next attempt resolves
+    the host again.
+
+    Args:
+        address: Host and port to connect to
+        timeout: Socket timeout
+        source_address: Optional local address to bind to
+
+    Returns:
+        Connected socket
+
+    Raises:
+        OSError: If the host cannot be resolved or reached
+    """
+    host, port = address
+    error: OSError | None = None
+    for _family, _type, _proto, _canonname, sockaddr in _resolve(host, port):
+        try:
+            return socket.create_connection(sockaddr[:2], timeout, source_address)
+        except OSError as e:
+            error = e
+
+    with _dns_cache_lock:
+        _dns_cache.pop((host, port), None)
+    raise error or OSError(f"getaddrinfo returned no addresses for {host}")
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    """HTTP response that hands its connection back to the pool when closed."""
+
+    _release: Any = None
+
+    def close(self) -> None:
+        # The connection can only carry another request once this response
+        # has been read to the end and the server did not ask to close it.
+        reusable = self.isclosed() and not self.will_close
+        super().close()
+        release, self._release = self._release, None
+        if release is not None:
+            release(reusable)
+
+
+class _PooledHTTPConnection(http.client.HTTPConnection):
+    response_class = _PooledHTTPResponse
+
+
+class _PooledHTTPSConnection(http.client.HTTPSConnection):
+    response_class = _PooledHTTPResponse
+
+
+# Errors raised when a server has dropped an idle keep-alive connection
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class _ConnectionPool:
+    """
+    Thread-safe pool of idle keep-alive connections, keyed by scheme and host.
+
+    A connection is checked out for exactly one request and only returned
+    once its response has been fully consumed.
+    """
+
+    def __init__(self, maxsize: int = HTTP_POOL_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(
+        self, key: tuple[str, str], connection_class: Any, timeout: Any
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            conn = connection_class(key[1], timeout=timeout)
+            # Resolved through the DNS cache when the connection first connects
+            conn._create_connection = _create_connection
+            return conn, False
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(
+        self, key: tuple[str, str], conn: http.client.HTTPConnection, reusable: bool
+    ) -> None:
+        if reusable and conn.sock is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.maxsize:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def open(self, req: Request, connection_class: Any) -> Any:
+        """
+        Send a urllib request over a pooled connection.
+
+        Mirrors urllib's AbstractHTTPHandler.do_open, except that the
+        connection is kept alive. A reused connection that the server has
+        already dropped is retried once on a fresh connection.
+
+        Args:
+            req: Prepared urllib request
+            connection_class: HTTPConnection subclass to create connections with
+
+        Returns:
+            Response whose close() returns the connection to the pool
+
+        Raises:
+            URLError: If the request could not be sent
+        """
+        host = req.host
+        if not host:
+            raise URLError("no host given")
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers["Connection"] = "keep-alive"
+        headers = {name.title(): value for name, value in headers.items()}
+
+        key = (req.type, host)
+        while True:
+            conn, reused = self._acquire(key, connection_class, req.timeout)
+            try:
+                conn.request(
+                    req.get_method(),
+                    req.selector,
+                    req.data,
+                    headers,
+                    encode_chunked=req.has_header("Transfer-encoding"),
+                )
+                response: Any = conn.getresponse()
+            except OSError as e:
+                conn.close()
+                if reused and isinstance(e, _STALE_CONNECTION_ERRORS):
+                    continue
+                raise URLError(e) from e
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        response._release = lambda reusable: self._release(key, conn, reusable)
+        response.url = req.get_full_url()
+        response.msg = response.reason
+        return response
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class _KeepAliveHTTPHandler(HTTPHandler):
+    def __init__(self, pool: _ConnectionPool) -> None:
+        super().__init__()
+        self._pool = pool
+
+    def http_open(self, req: Request) -> Any:
+        return self._pool.open(req, _PooledHTTPConnection)
+
+
+class _KeepAliveHTTPSHandler(HTTPSHandler):
+    def __init__(self, pool: _ConnectionPool) -> None:
+        super().__init__()
+        self._pool = pool
+
+    def https_open(self, req: Request) -> Any:
+        # CONNECT tunnels through a proxy are left to urllib
+        if req._tunnel_host:  # type: ignore[attr-defined]
+            return super().https_open(req)
+        return self._pool.open(req, _PooledHTTPSConnection)
+
+
+# Module-level connection pool shared by every request made through urlopen
+_connection_pool = _ConnectionPool()
+_opener = build_opener(
+    _KeepAliveHTTPHandler(_connection_pool), _KeepAliveHTTPSHandler(_connection_pool)
+)
+
+
+def urlopen(request: Request, timeout: float) -> Any:
+    """
+    Open a request through the shared keep-alive opener.
+
+    Drop-in replacement for urllib.request.urlopen that reuses TCP/TLS
+    connections to the same host across calls instead of reconnecting for
+    every request. Redirects, proxies and HTTP errors are handled by urllib
+    as usual.
+
+    Args:
+        request: Request to send
+        timeout: Socket timeout in seconds
+
+    Returns:
+        File-like HTTP response; closing it returns the connection to the pool
+    """
+    return _opener.open(request, timeout=timeout)
+
+
+def encode_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON, using orjson when available.
+
+    Non-ASCII characters are written as is rather than escaped, and both
+    codecs produce the same layout.
+
+    Args:
+        data: JSON-serializable data
+        pretty: Indent nested values by two spaces
+
+    Returns:
+        Encoded JSON document
+    """
+    if _HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(raw: bytes) -> Any:
+    """
+    Parse a JSON document straight from UTF-8 encoded bytes.
+
+    Both orjson and the standard library accept bytes, so the input is never
+    decoded to an intermediate str. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers only need to catch the latter.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Parsed data
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def decompress_body(body: bytes, content_encoding: str | None) -> bytes:
+    """
+    Undo a gzip or deflate Content-Encoding on a response body.
+
+    Args:
+        body: Raw response body
+        content_encoding: Value of the Content-Encoding header, if any
+
+    Returns:
+        Decoded body; bodies with no or an unknown encoding are returned as is
+    """
+    if content_encoding == "gzip":
+        return gzip.decompress(body)
+    if content_encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate data without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
 
 
 def load_cookies_from_netscape_file(cookies_file: Path) -> dict[str, str] | None:
@@ -49,30 +418,31 @@ def load_cookies_from_netscape_file(cookies_file: Path) -> dict[str, str] | None
         cookies = {}
 
         with open(cookies_file, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
+            lines = f.read().split("\n")
 
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
 
-                # Parse Netscape cookie format:
-                # domain flag path secure expiration name value
-                parts = line.split("\t")
+            # Skip empty lines and comments
+            if not line or line[0] == "#":
+                continue
 
-                if len(parts) < 7:
-                    logger.warning(f"Invalid cookie format at line {line_num}: {line}")
-                    continue
+            # Parse Netscape cookie format:
+            # domain flag path secure expiration name value
+            parts = line.split("\t", 7)
 
-                domain, flag, path, secure, expiration, name, value = parts[:7]
+            if len(parts) < 7:
+                logger.warning(f"Invalid cookie format at line {line_num}: {line}")
+                continue
 
-                # For YouTube, we mainly care about cookies for *.youtube.com
-                if "youtube.com" in domain or "google.com" in domain:
-                    cookies[name] = value
-                    logger.debug(f"Loaded cookie: {name} for domain {domain}")
+            # For YouTube, we mainly care about cookies for *.youtube.com
+            domain = parts[0]
+            if "youtube.com" in domain or "google.com" in domain:
+                cookies[parts[5]] = parts[6]
 
         if cookies:
             logger.info(f"Loaded {len(cookies)} cookies from {cookies_file}")
+            logger.debug(f"Loaded cookie names: {', '.join(cookies)}")
             return cookies
         else:
             logger.warning("No YouTube/Google cookies found in cookie file")
@@ -110,7 +480,25 @@ def _generate_sapisid_authorization(sapisid: str, origin: str) -> str:
     Returns:
         Authorization header value in format "SAPISIDHASH {timestamp}_{hash}"
     """
-    timestamp = str(int(time.time()))
+    return _sapisid_authorization_at(int(time.time()), sapisid, origin)
+
+
+@functools.lru_cache(maxsize=8)
+def _sapisid_authorization_at(timestamp: int, sapisid: str, origin: str) -> str:
+    """
+    Build the SAPISID authorization header for a given second.
+
+    The hash only changes once per second, so requests made within the same
+    second share one SHA1 computation.
+
+    Args:
+        timestamp: Unix time in whole seconds
+        sapisid: The SAPISID cookie value
+        origin: The origin URL
+
+    Returns:
+        Authorization header value in format "SAPISIDHASH {timestamp}_{hash}"
+    """
     # Create hash of timestamp, sapisid, and origin
     # Note: SHA1 is required by YouTube's SAPISID protocol specification
     hash_input = f"{timestamp} {sapisid} {origin}"
@@ -118,6 +506,34 @@ def _generate_sapisid_authorization(sapisid: str, origin: str) -> str:
     return f"SAPISIDHASH {timestamp}_{hash_value}"
 
 
+def _parse_retry_after(headers: Any) -> float | None:
+    """
+    Read the delay a Retry-After response header asks for.
+
+    Args:
+        headers: Response headers, may be None
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    # The header may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def _validate_url_scheme(url: str) -> None:
     """
     Validate that the URL uses a safe scheme (http or https).
@@ -163,16 +579,20 @@ def make_http_request(
 
     Raises:
         NetworkError: If the request fails after all retries
-        RateLimitError: If rate limiting is detected
+        RateLimitError: If rate limiting is detected and the server gives no
+            short Retry-After delay to wait for, or retries run out
     """
-    if headers is None:
-        headers = {}
+    # Work on a copy so shared header dicts are safe to pass from several threads
+    headers = dict(headers) if headers else {}
+    # Resolved once so disabled debug messages are never formatted
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     # Add cookies to headers if provided
     if cookies:
         cookie_header = _format_cookie_header(cookies)
         headers["Cookie"] = cookie_header
-        logger.debug(f"Added {len(cookies)} cookies to request")
+        if debug:
+            logger.debug(f"Added {len(cookies)} cookies to request")
 
         # Add SAPISID-based authorization for YouTube API access
         if "SAPISID" in cookies:
@@ -191,10 +611,13 @@ def make_http_request(
     last_exception: Exception | None = None
 
     while attempt <= max_retries:
+        retry_after: float | None = None
         try:
-            logger.debug(
-                f"Making {method} request to {url} (attempt {attempt + 1}/{max_retries + 1})"
-            )
+            if debug:
+                logger.debug(
+                    f"Making {method} request to {url} "
+                    f"(attempt {attempt + 1}/{max_retries + 1})"
+                )
 
             # Validate URL scheme for security
             _validate_url_scheme(url)
@@ -202,7 +625,7 @@ def make_http_request(
             # Prepare request data
             json_data = None
             if data is not None:
-                json_data = json.dumps(data).encode("utf-8")
+                json_data = encode_json(data)
                 if "Content-Type" not in headers:
                     headers["Content-Type"] = "application/json"
 
@@ -219,17 +642,33 @@ def make_http_request(
                         response,
                     )
 
-                response_data = response.read().decode("utf-8")
-                result: dict[str, Any] = json.loads(response_data)
+                body = decompress_body(
+                    response.read(), response.headers.get("Content-Encoding")
+                )
+                result: dict[str, Any] = decode_json(body)
 
-                logger.debug(f"Request successful: {response.status}")
+                if debug:
+                    logger.debug(f"Request successful: {response.status}")
                 return result
 
         except HTTPError as e:
             last_exception = e
+            retry_after = _parse_retry_after(e.headers)
             if e.code == 429:  # Rate limiting
                 logger.warning("Rate limiting detected (HTTP 429)")
-                raise RateLimitError(f"Rate limited by server: {e}") from e
+                # Wait it out only when the server says how long and the
+                # delay is short enough; otherwise leave it to the caller
+                if (
+                    retry_after is None
+                    or retry_after > MAX_RETRY_AFTER
+                    or attempt >= max_retries
+                ):
+                    raise RateLimitError(
+                        f"Rate limited by server: {e}",
+                        retry_after=(
+                            None if retry_after is None else math.ceil(retry_after)
+                        ),
+                    ) from e
             elif e.code in (500, 502, 503, 504):  # Server errors - retry
                 logger.warning(f"Server error {e.code}, will retry")
             else:
@@ -251,8 +690,12 @@ def make_http_request(
 
         # Don't retry on the last attempt
         if attempt < max_retries:
-            wait_time = retry_delay * (2**attempt)  # Exponential backoff
-            logger.debug(f"Retrying in {wait_time:.1f} seconds...")
+            wait_time = retry_delay * (1 << attempt)  # Exponential backoff
+            if retry_after is not None:
+                # Never come back sooner than the server asked
+                wait_time = max(wait_time, min(retry_after, MAX_RETRY_AFTER))
+            if debug:
+                logger.debug(f"Retrying in {wait_time:.1f} seconds...")
             time.sleep(wait_time)
 
         attempt += 1
@@ -266,6 +709,19 @@ def make_http_request(
     raise NetworkError(error_msg) from last_exception
 
 
+def _write_all(f: Any, data: bytes) -> None:
+    """
+    Write all of data to an unbuffered file, resuming after short writes.
+
+    Args:
+        f: File opened with buffering=0
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view) :]
+
+
 def download_image(
     image_url: str,
     filename: str,
@@ -295,7 +751,6 @@ def download_image(
         elif isinstance(output_dir, str):
             output_dir = Path(output_dir)
         images_dir = output_dir / "images"
-        images_dir.mkdir(parents=True, exist_ok=True)
 
         # Clean and validate filename
         safe_filename = sanitize_filename(filename)
@@ -304,52 +759,36 @@ def download_image(
         parsed_url = urlparse(image_url)
         path = parsed_url.path
 
-        if "." in path:
-            extension = path.split(".")[-1].lower()
-            extension = _RE_EXTENSION_CLEAN.sub("", extension)[:10]
-            if extension not in ["jpg", "jpeg", "png", "gif", "webp", "bmp", "svg"]:
-                extension = "jpg"
-        else:
+        # Anything that is not exactly a known image extension becomes jpg
+        extension = path.rpartition(".")[2].lower()
+        if extension not in _IMAGE_EXTENSIONS:
             extension = "jpg"
 
         # Ensure filename has correct extension
-        if not safe_filename.lower().endswith(f".{extension}"):
+        _, dot, current_extension = safe_filename.rpartition(".")
+        if not dot or current_extension.lower() != extension:
             safe_filename = f"{safe_filename}.{extension}"
 
-        file_path = images_dir / safe_filename
-
         # Handle filename conflicts
-        counter = 1
-        original_path = file_path
-        while file_path.exists():
-            stem = original_path.stem
-            file_path = images_dir / f"{stem}_{counter}.{extension}"
-            counter += 1
+        file_path = _create_unique_file(images_dir, safe_filename, extension)
 
         # Download with retries
         attempt = 0
         last_exception = None
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         while attempt <= max_retries:
             try:
-                logger.debug(
-                    f"Downloading image from {image_url} (attempt {attempt + 1}/{max_retries + 1})"
-                )
+                if debug:
+                    logger.debug(
+                        f"Downloading image from {image_url} "
+                        f"(attempt {attempt + 1}/{max_retries + 1})"
+                    )
 
                 # Validate URL scheme for security
                 _validate_url_scheme(image_url)
 
-                request = Request(image_url, headers=headers)
+                request = Request(image_url, headers=_IMAGE_REQUEST_HEADERS)
                 # URL scheme has been validated above to ensure it's http/https only
                 with urlopen(request, timeout=timeout) as response:  # nosec B310
                     if response.status != 200:
@@ -368,12 +807,21 @@ def download_image(
                             f"Unexpected content type '{content_type}' for image URL"
                         )
 
-                    with open(file_path, "wb") as f:
-                        shutil.copyfileobj(response, f, length=65536)
-
-                    # Verify the file was created and has content
-                    if file_path.exists() and file_path.stat().st_size > 0:
-                        logger.debug(f"Successfully downloaded image to {file_path}")
+                    # The reserved file is rewritten in place rather than
+                    # recreated, so its name stays taken between attempts
+                    size = 0
+                    with open(file_path, "r+b", buffering=0) as f:
+                        while chunk := response.read(_IMAGE_CHUNK_SIZE):
+                            _write_all(f, chunk)
+                            size += len(chunk)
+                        f.truncate()
+
+                    # Verify the file has content
+                    if size > 0:
+                        if debug:
+                            logger.debug(
+                                f"Successfully downloaded image to {file_path}"
+                            )
                         return str(file_path)
                     else:
                         raise FileOperationError(
@@ -384,18 +832,17 @@ def download_image(
                 last_exception = e
                 logger.warning(f"Image download attempt {attempt + 1} failed: {e}")
 
-                # Clean up partial file
-                if file_path.exists():
-                    try:
-                        file_path.unlink()
-                    except OSError:
-                        pass
-
                 if attempt < max_retries:
-                    time.sleep(1.0 * (attempt + 1))  # Progressive delay
+                    time.sleep(attempt + 1)  # Progressive delay
 
                 attempt += 1
 
+        # Only give up the reserved name once no attempt is left
+        try:
+            file_path.unlink()
+        except OSError:
+            pass
+
         logger.error(
             f"Failed to download image after {max_retries + 1} attempts: {last_exception}"
         )
@@ -406,6 +853,77 @@ def download_image(
         return None
 
 
+def download_images(
+    items: Iterable[tuple[str, str]],
+    output_dir: Path | str | None,
+    timeout: int = 30,
+    max_retries: int = 3,
+    max_workers: int = MAX_IMAGE_DOWNLOAD_WORKERS,
+) -> list[str | None]:
+    """
+    Download several images concurrently.
+
+    Args:
+        items: (image URL, desired filename) pairs
+        output_dir: Directory to save the images
+        timeout: Download timeout in seconds
+        max_retries: Maximum number of retry attempts per image
+        max_workers: Maximum number of simultaneous downloads
+
+    Returns:
+        Path of each downloaded image, or None where the download failed,
+        in the order of items
+    """
+
+    def download(item: tuple[str, str]) -> str | None:
+        image_url, filename = item
+        try:
+            return download_image(image_url, filename, output_dir, timeout, max_retries)
+        except Exception as e:
+            logger.error(f"Error downloading image {image_url}: {e}")
+            return None
+
+    items = list(items)
+    if len(items) <= 1:
+        return [download(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)), thread_name_prefix="image-download"
+    ) as executor:
+        return list(executor.map(download, items))
+
+
+def _create_unique_file(directory: Path, filename: str, extension: str) -> Path:
+    """
+    Create an empty file under a name that is not taken yet.
+
+    On a conflict "_1", "_2", ... is appended to the stem. O_EXCL makes the
+    check and the creation a single step, so concurrent downloads can never
+    pick the same name. The directory is created if it does not exist yet.
+
+    Args:
+        directory: Directory to create the file in
+        filename: Preferred file name, including the extension
+        extension: Extension for numbered alternatives
+
+    Returns:
+        Path of the created file
+    """
+    file_path = directory / filename
+    stem = file_path.stem
+    counter = 1
+    while True:
+        try:
+            os.close(os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+            return file_path
+        except FileExistsError:
+            file_path = directory / f"{stem}_{counter}.{extension}"
+            counter += 1
+        except FileNotFoundError:
+            # Only the first download into a directory pays for creating it
+            directory.mkdir(parents=True, exist_ok=True)
+
+
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
     """
     Sanitize a filename by removing invalid characters and limiting length.
@@ -418,8 +936,12 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
         Sanitized filename
     """
     # Remove or replace invalid characters
-    safe_name = _RE_SANITIZE_FILENAME.sub("_", filename)
-    safe_name = _RE_COLLAPSE_UNDERSCORES.sub("_", safe_name)
+    if filename.isascii():
+        safe_name = filename.translate(_SANITIZE_ASCII_TABLE)
+    else:
+        safe_name = _RE_SANITIZE_FILENAME.sub("_", filename)
+    if "__" in safe_name:
+        safe_name = _RE_COLLAPSE_UNDERSCORES.sub("_", safe_name)
     safe_name = safe_name.strip("_.")  # Remove leading/trailing underscores and dots
 
     # Ensure filename is not empty
@@ -455,22 +977,16 @@ def validate_channel_id(channel_id: str) -> bool:
         return False
 
     # YouTube channel IDs typically start with 'UC' and are 24 characters long
-    # But also support @username format
-    if channel_id.startswith("@"):
-        return (
-            len(channel_id) > 1
-            and channel_id[1:].replace("_", "").replace("-", "").isalnum()
-        )
-
     if channel_id.startswith("UC") and len(channel_id) == 24:
         # YouTube channel IDs can contain letters, numbers, hyphens, and underscores
-        return all(c.isalnum() or c in "-_" for c in channel_id[2:])
+        return _ID_CHARS.issuperset(channel_id[2:])
 
-    # Also support custom channel URLs
-    if channel_id.startswith("c/") or channel_id.startswith("channel/"):
-        return True
+    # But also support @username format
+    if channel_id[0] == "@":
+        return _RE_CHANNEL_HANDLE.fullmatch(channel_id) is not None
 
-    return False
+    # Also support custom channel URLs
+    return channel_id.startswith(("c/", "channel/"))
 
 
 def extract_post_id_from_url(url: str) -> str | None:
@@ -512,7 +1028,7 @@ def validate_post_id(post_id: str) -> bool:
     # YouTube post IDs are typically alphanumeric with underscores and hyphens
     # They usually start with "Ugk" and are around 35-50 characters long
     if post_id.startswith("Ugk") and 20 <= len(post_id) <= 60:
-        return all(c.isalnum() or c in "_-" for c in post_id)
+        return _ID_CHARS.issuperset(post_id)
 
     return False
 
@@ -559,15 +1075,13 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size = float(size_bytes)
-
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    # directly; negative sizes stay in bytes
+    unit = 0
+    if size_bytes >= 1024:
+        unit = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
-    return f"{size:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def create_backup_filename(original_path: Path) -> Path:
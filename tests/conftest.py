@@ -8,7 +8,6 @@ import json
 
 # Add src to Python path for imports
 import sys
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -28,13 +27,6 @@ from post_archiver_improved.models import (
 )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
-
-
 @pytest.fixture
 def sample_config():
     """Create a sample configuration for testing."""
@@ -116,7 +108,7 @@ def sample_post(sample_author, sample_comment, sample_image, sample_link):
         timestamp="2023-01-01T10:00:00Z",
         timestamp_estimated=False,
         likes="100",
-        comments_count="25",
+        comments_count=25,
         members_only=False,
         author=sample_author,
         images=[sample_image],
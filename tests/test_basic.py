@@ -5,6 +5,8 @@ This module contains basic sanity tests to ensure the package
 can be imported and basic functionality works.
 """
 
+import importlib
+import os
 import sys
 from pathlib import Path
 
@@ -36,9 +38,9 @@ def test_version_string():
     assert "." in version
 
 
-def test_module_imports():
-    """Test that all main modules can be imported."""
-    modules_to_test = [
+@pytest.mark.parametrize(
+    "module_name",
+    [
         "post_archiver_improved.api",
         "post_archiver_improved.cli",
         "post_archiver_improved.config",
@@ -50,13 +52,14 @@ def test_module_imports():
         "post_archiver_improved.scraper",
         "post_archiver_improved.utils",
         "post_archiver_improved.comment_processor",
-    ]
-
-    for module_name in modules_to_test:
-        try:
-            __import__(module_name)
-        except ImportError as e:
-            pytest.fail(f"Failed to import {module_name}: {e}")
+    ],
+)
+def test_module_imports(module_name):
+    """Test that all main modules can be imported."""
+    try:
+        importlib.import_module(module_name)
+    except ImportError as e:
+        pytest.fail(f"Failed to import {module_name}: {e}")
 
 
 def test_python_version():
@@ -85,10 +88,12 @@ def test_package_structure():
         "comment_processor.py",
     ]
 
-    for file_name in expected_files:
-        file_path = package_dir / file_name
-        assert file_path.exists(), f"Expected file {file_name} not found"
-        assert file_path.is_file(), f"{file_name} is not a file"
+    # One directory listing instead of two stat calls per expected file
+    with os.scandir(package_dir) as entries:
+        files = {entry.name for entry in entries if entry.is_file()}
+
+    missing = [file_name for file_name in expected_files if file_name not in files]
+    assert not missing, f"Expected files not found: {missing}"
 
 
 def test_entry_point_exists():
@@ -0,0 +1,361 @@
+"""
+Tests for comment processing functionality.
+
+This module tests the CommentProcessor class, focusing on how replies
+are fetched for a batch of comments.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+from post_archiver_improved.comment_processor import CommentProcessor, _EntityIndex
+from post_archiver_improved.models import Comment
+
+
+def _thread_with_reply_token(comment_id):
+    """Build an old-format comment thread whose replies need a continuation."""
+    return {
+        "commentThreadRenderer": {
+            "comment": {"commentRenderer": {"commentId": comment_id}},
+            "replies": {
+                "commentRepliesRenderer": {
+                    "continuations": [
+                        {
+                            "nextContinuationData": {
+                                "continuation": f"replies_{comment_id}"
+                            }
+                        }
+                    ]
+                }
+            },
+        }
+    }
+
+
+def _continuation_response(comment_ids):
+    return {
+        "onResponseReceivedEndpoints": [
+            {
+                "appendContinuationItemsAction": {
+                    "continuationItems": [
+                        _thread_with_reply_token(comment_id)
+                        for comment_id in comment_ids
+                    ]
+                }
+            }
+        ]
+    }
+
+
+class TestFindCommentContinuationToken:
+    """Test locating the first comment page token in a post detail response."""
+
+    @staticmethod
+    def _response(sections):
+        return {
+            "contents": {
+                "twoColumnBrowseResultsRenderer": {
+                    "tabs": [
+                        {"expandableTabRenderer": {}},
+                        {
+                            "tabRenderer": {
+                                "content": {
+                                    "sectionListRenderer": {"contents": sections}
+                                }
+                            }
+                        },
+                    ]
+                }
+            }
+        }
+
+    @staticmethod
+    def _continuation(token):
+        return {
+            "continuationItemRenderer": {
+                "continuationEndpoint": {"continuationCommand": {"token": token}}
+            }
+        }
+
+    def test_token_from_comment_section(self):
+        """Test that only the comment item section is searched."""
+        response = self._response(
+            [
+                {
+                    "itemSectionRenderer": {
+                        "sectionIdentifier": "post-section",
+                        "contents": [self._continuation("wrong")],
+                    }
+                },
+                {
+                    "itemSectionRenderer": {
+                        "sectionIdentifier": "comment-item-section",
+                        "contents": [{"other": {}}, self._continuation("comments")],
+                    }
+                },
+            ]
+        )
+        processor = CommentProcessor(Mock(), Mock())
+
+        assert processor._find_comment_continuation_token(response) == "comments"
+
+    def test_no_comment_section(self):
+        """Test that responses without comments yield no token."""
+        processor = CommentProcessor(Mock(), Mock())
+
+        assert processor._find_comment_continuation_token(self._response([])) is None
+        assert processor._find_comment_continuation_token({}) is None
+
+
+class TestFindContinuationToken:
+    """Test locating the next comment page token in a continuation response."""
+
+    def test_token_after_comment_threads(self):
+        """Test that the token is found past the header and comment threads."""
+        response = _continuation_response(["c1", "c2"])
+        response["onResponseReceivedEndpoints"][0]["appendContinuationItemsAction"][
+            "continuationItems"
+        ].append(TestFindCommentContinuationToken._continuation("page2"))
+        response["onResponseReceivedEndpoints"].insert(
+            0,
+            {
+                "reloadContinuationItemsCommand": {
+                    "continuationItems": [{"commentsHeaderRenderer": {}}]
+                }
+            },
+        )
+        processor = CommentProcessor(Mock(), Mock())
+
+        assert processor._find_continuation_token(response) == "page2"
+
+    def test_last_page_has_no_token(self):
+        """Test that a page without a continuation item yields no token."""
+        processor = CommentProcessor(Mock(), Mock())
+
+        assert (
+            processor._find_continuation_token(_continuation_response(["c1"])) is None
+        )
+        assert processor._find_continuation_token({}) is None
+
+
+class TestReplyFetching:
+    """Test reply continuation fetching for comment batches."""
+
+    def setup_method(self):
+        self.extractor = Mock()
+        self.extractor.extract_comment_from_renderer.side_effect = lambda renderer: (
+            Comment(id=renderer["commentId"])
+        )
+        self.processor = CommentProcessor(Mock(), self.extractor)
+
+    def test_replies_fetched_concurrently(self):
+        """Test that reply continuations of different comments overlap."""
+        comment_ids = ["c1", "c2", "c3"]
+        # Every fetch waits until all of them are in flight at once
+        barrier = threading.Barrier(len(comment_ids), timeout=5)
+
+        def fetch_replies(token, max_replies):
+            barrier.wait()
+            return [Comment(id=f"{token}_reply")]
+
+        self.processor._fetch_replies_from_continuation = fetch_replies
+
+        comments = self.processor._extract_comments_from_continuation(
+            _continuation_response(comment_ids)
+        )
+
+        assert [comment.id for comment in comments] == comment_ids
+        for comment in comments:
+            assert [reply.id for reply in comment.replies] == [
+                f"replies_{comment.id}_reply"
+            ]
+
+    def test_reply_workers_stopped_after_batch(self):
+        """Test that no reply fetch thread outlives the batch it served."""
+        self.processor._fetch_replies_from_continuation = Mock(return_value=[])
+
+        self.processor._extract_comments_from_continuation(
+            _continuation_response(["c1", "c2"])
+        )
+
+        assert not [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith("reply-fetch")
+        ]
+
+    def test_replies_limited_per_comment(self):
+        """Test that fetched replies are trimmed to the per-comment limit."""
+        self.processor._fetch_replies_from_continuation = Mock(
+            return_value=[Comment(id=f"r{i}") for i in range(5)]
+        )
+
+        comments = self.processor._extract_comments_from_continuation(
+            _continuation_response(["c1"]), max_replies_per_comment=2
+        )
+
+        assert len(comments[0].replies) == 2
+        self.processor._fetch_replies_from_continuation.assert_called_once_with(
+            "replies_c1", 2
+        )
+
+    def test_failed_reply_fetch_keeps_comment(self):
+        """Test that an error fetching replies does not drop the comment."""
+        self.processor._fetch_replies_from_continuation = Mock(
+            side_effect=RuntimeError("boom")
+        )
+
+        comments = self.processor._extract_comments_from_continuation(
+            _continuation_response(["c1"])
+        )
+
+        assert [comment.id for comment in comments] == ["c1"]
+        assert comments[0].replies == []
+
+
+class TestEntityIndex:
+    """Test entity payload indexing for new format comments."""
+
+    def setup_method(self):
+        self.payloads = [
+            {"entityKey": "replies-b-2", "payload": {}},
+            {"entityKey": "comment-a", "payload": {}},
+            {"entityKey": "replies-b-1", "payload": {}},
+            {"entityKey": "replies-a-1", "payload": {}},
+        ]
+        self.index = _EntityIndex(self.payloads)
+
+    def test_get_by_key(self):
+        """Test exact key lookup."""
+        assert self.index.get("comment-a") is self.payloads[1]
+        assert self.index.get("missing") is None
+
+    def test_prefix_lookup_keeps_response_order(self):
+        """Test that prefix matches come back in their original order."""
+        matches = self.index.with_prefix("replies-b")
+
+        assert [entity["entityKey"] for entity in matches] == [
+            "replies-b-2",
+            "replies-b-1",
+        ]
+
+    def test_new_format_comment_uses_index(self):
+        """Test that a view model comment collects its own and reply entities."""
+        extractor = Mock()
+        extractor.extract_comment_from_entity.side_effect = lambda entities: Comment(
+            id=entities[0]["entityKey"]
+        )
+        processor = CommentProcessor(Mock(), extractor)
+        index = _EntityIndex(
+            [
+                {"entityKey": "c1", "payload": {"commentEntityPayload": {}}},
+                {"entityKey": "t1", "payload": {}},
+                {"entityKey": "r1-x", "payload": {"commentEntityPayload": {}}},
+                {"entityKey": "c2", "payload": {"commentEntityPayload": {}}},
+            ]
+        )
+        thread = {
+            "commentViewModel": {
+                "commentViewModel": {
+                    "commentKey": "c1",
+                    "toolbarStateKey": "t1",
+                    "inlineRepliesKey": "r1",
+                }
+            }
+        }
+
+        comment = processor._process_new_format_comment(thread, index, 10)
+
+        own_entities = extractor.extract_comment_from_entity.call_args_list[0][0][0]
+        assert sorted(entity["entityKey"] for entity in own_entities) == ["c1", "t1"]
+        assert [reply.id for reply in comment.replies] == ["r1-x"]
+
+
+class TestCommentPagePrefetch:
+    """Test prefetching of comment continuation pages."""
+
+    def setup_method(self):
+        self.api = Mock()
+        self.extractor = Mock()
+        self.extractor.extract_comment_from_renderer.side_effect = lambda renderer: (
+            Comment(id=renderer["commentId"])
+        )
+        self.processor = CommentProcessor(self.api, self.extractor)
+        self.processor._find_comment_continuation_token = Mock(return_value="page1")
+        self.processor._find_continuation_token = lambda response: response.get("next")
+        # Replies are not under test here
+        self.processor._fetch_pending_replies = Mock()
+
+    def _page(self, comment_ids, next_token=None):
+        page = _continuation_response(comment_ids)
+        page["next"] = next_token
+        return page
+
+    @patch("post_archiver_improved.comment_processor._COMMENT_PAGE_DELAY", 0)
+    def test_next_page_fetched_while_parsing(self):
+        """Test that the next page is requested before the current one is parsed."""
+        pages = {
+            "page1": self._page(["c1"], "page2"),
+            "page2": self._page(["c2"]),
+        }
+        page2_requested = threading.Event()
+
+        def get_continuation_data(token):
+            if token == "page2":
+                page2_requested.set()
+            return pages[token]
+
+        self.api.get_continuation_data.side_effect = get_continuation_data
+        extract = self.processor._extract_comments_from_continuation
+
+        def extract_waiting_for_prefetch(response, max_replies):
+            if response is pages["page1"]:
+                assert page2_requested.wait(timeout=5)
+            return extract(response, max_replies)
+
+        self.processor._extract_comments_from_continuation = (
+            extract_waiting_for_prefetch
+        )
+
+        comments = self.processor.extract_comments("UC123", "post1")
+
+        assert [comment.id for comment in comments] == ["c1", "c2"]
+
+    @patch("post_archiver_improved.comment_processor._COMMENT_PAGE_DELAY", 0)
+    def test_repeated_comment_token_stops(self):
+        """Test that a continuation token seen before is not fetched again."""
+        pages = {
+            "page1": self._page(["c1"], "page2"),
+            "page2": self._page(["c2"], "page1"),
+        }
+        self.api.get_continuation_data.side_effect = lambda token: pages[token]
+
+        comments = self.processor.extract_comments("UC123", "post1")
+
+        assert [comment.id for comment in comments] == ["c1", "c2"]
+        assert self.api.get_continuation_data.call_count == 2
+
+    @patch("post_archiver_improved.comment_processor.time.sleep")
+    def test_repeated_reply_token_stops(self, mock_sleep):
+        """Test that reply fetching stops when a token comes back again."""
+        self.processor._extract_replies_from_response = Mock(
+            return_value=[Comment(id="r1")]
+        )
+        self.processor._find_reply_continuation_token_in_response = Mock(
+            side_effect=["replies2", "replies1"]
+        )
+
+        replies = self.processor._fetch_replies_from_continuation("replies1")
+
+        assert len(replies) == 2
+        assert self.api.get_reply_continuation_data.call_count == 2
+
+    @patch("post_archiver_improved.comment_processor._COMMENT_PAGE_DELAY", 0)
+    def test_no_prefetch_past_comment_limit(self):
+        """Test that no page is requested once the current one fills the limit."""
+        self.api.get_continuation_data.return_value = self._page(["c1", "c2"], "page2")
+
+        comments = self.processor.extract_comments("UC123", "post1", max_comments=2)
+
+        assert [comment.id for comment in comments] == ["c1", "c2"]
+        self.api.get_continuation_data.assert_called_once_with("page1")
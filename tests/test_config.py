@@ -5,6 +5,7 @@ This module tests configuration loading, validation, and management
 including file-based configurations and argument parsing.
 """
 
+import copy
 import json
 from pathlib import Path
 from unittest.mock import patch
@@ -22,6 +23,7 @@ from post_archiver_improved.config import (
     save_config_to_file,
     update_config_from_args,
 )
+from post_archiver_improved.exceptions import ConfigurationError
 
 
 class TestScrapingConfig:
@@ -69,16 +71,16 @@ class TestOutputConfig:
         assert config.pretty_print is True
         assert config.include_metadata is True
 
-    def test_custom_values(self, temp_dir):
+    def test_custom_values(self, tmp_path):
         """Test output configuration with custom values."""
         config = OutputConfig(
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             save_format="json",
             pretty_print=False,
             include_metadata=False,
         )
 
-        assert config.output_dir == temp_dir
+        assert config.output_dir == tmp_path
         assert config.pretty_print is False
         assert config.include_metadata is False
 
@@ -94,33 +96,33 @@ class TestConfig:
         assert isinstance(config.output, OutputConfig)
         assert config.log_file is None
 
-    def test_post_init_path_conversion(self, temp_dir):
+    def test_post_init_path_conversion(self, tmp_path):
         """Test that paths are converted to Path objects."""
         config = Config(
             scraping=ScrapingConfig(),
-            output=OutputConfig(output_dir=str(temp_dir)),
-            log_file=str(temp_dir / "test.log"),
+            output=OutputConfig(output_dir=str(tmp_path)),
+            log_file=str(tmp_path / "test.log"),
         )
 
         assert isinstance(config.output.output_dir, Path)
         assert isinstance(config.log_file, Path)
-        assert config.output.output_dir == temp_dir
+        assert config.output.output_dir == tmp_path
 
 
 class TestConfigFileOperations:
     """Test configuration file loading and saving."""
 
-    def test_save_and_load_config(self, temp_dir):
+    def test_save_and_load_config(self, tmp_path):
         """Test saving and loading configuration from file."""
-        config_file = temp_dir / "test_config.json"
+        config_file = tmp_path / "test_config.json"
 
         # Create a test configuration
         original_config = Config(
             scraping=ScrapingConfig(
                 max_posts=25, extract_comments=True, max_comments_per_post=50
             ),
-            output=OutputConfig(output_dir=temp_dir, pretty_print=False),
-            log_file=temp_dir / "test.log",
+            output=OutputConfig(output_dir=tmp_path, pretty_print=False),
+            log_file=tmp_path / "test.log",
         )
 
         # Save configuration
@@ -137,25 +139,80 @@ class TestConfigFileOperations:
         assert loaded_config.scraping.extract_comments is True
         assert loaded_config.scraping.max_comments_per_post == 50
         assert loaded_config.output.pretty_print is False
-        assert loaded_config.log_file == temp_dir / "test.log"
+        assert loaded_config.log_file == tmp_path / "test.log"
+
+    def test_saved_config_is_reloaded(self, tmp_path):
+        """Test that a rewritten config file is loaded with its new values."""
+        config_file = tmp_path / "saved.json"
+        save_config_to_file(
+            Config(scraping=ScrapingConfig(max_posts=1), output=OutputConfig()),
+            config_file,
+        )
+        assert load_config_from_file(config_file).scraping.max_posts == 1
+
+        save_config_to_file(
+            Config(scraping=ScrapingConfig(max_posts=2), output=OutputConfig()),
+            config_file,
+        )
 
-    def test_load_nonexistent_file(self, temp_dir):
+        assert load_config_from_file(config_file).scraping.max_posts == 2
+
+    def test_load_nonexistent_file(self, tmp_path):
         """Test loading configuration from non-existent file."""
-        config_file = temp_dir / "nonexistent.json"
+        config_file = tmp_path / "nonexistent.json"
         config = load_config_from_file(config_file)
         assert config is None
 
-    def test_load_invalid_json(self, temp_dir):
+    def test_load_invalid_json(self, tmp_path):
         """Test loading configuration from invalid JSON file."""
-        config_file = temp_dir / "invalid.json"
+        config_file = tmp_path / "invalid.json"
         config_file.write_text("{ invalid json }")
 
-        config = load_config_from_file(config_file)
-        assert config is None
+        with pytest.raises(ConfigurationError) as exc_info:
+            load_config_from_file(config_file)
+
+        assert len(exc_info.value.context["violations"]) >= 1
+        assert exc_info.value.context["config_file"] == str(config_file)
+
+    def test_all_violations_reported_together(self, tmp_path):
+        """Test that every invalid setting is listed in a single error."""
+        config_file = tmp_path / "invalid_settings.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "scraping": {"max_retries": "3", "download_images": 1},
+                    "output": {"save_format": "csv", "colour": True},
+                    "verbose": True,
+                }
+            )
+        )
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            load_config_from_file(config_file)
+
+        assert sorted(exc_info.value.context["violations"]) == [
+            "save_format must be one of: json",
+            "scraping.download_images must be bool, got int",
+            "scraping.max_retries must be int, got str",
+            "unknown key 'output.colour'",
+            "unknown key 'verbose'",
+        ]
+
+    def test_wrong_section_type(self, tmp_path):
+        """Test that a section that is not an object is reported."""
+        config_file = tmp_path / "bad_section.json"
+        config_file.write_text(json.dumps({"scraping": [], "output": {}}))
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            load_config_from_file(config_file)
+
+        assert exc_info.value.context["violations"] == [
+            "scraping must be dict, got list"
+        ]
 
-    def test_save_config_creates_directory(self, temp_dir):
+    def test_save_config_creates_directory(self, tmp_path):
         """Test that saving config creates parent directories."""
-        nested_dir = temp_dir / "nested" / "directory"
+        nested_dir = tmp_path / "nested" / "directory"
         config_file = nested_dir / "config.json"
 
         config = get_default_config()
@@ -165,9 +222,9 @@ class TestConfigFileOperations:
         assert config_file.exists()
         assert nested_dir.exists()
 
-    def test_infinity_handling(self, temp_dir):
+    def test_infinity_handling(self, tmp_path):
         """Test handling of infinity values in configuration."""
-        config_file = temp_dir / "infinity_config.json"
+        config_file = tmp_path / "infinity_config.json"
 
         # Create config with infinity
         config = Config(
@@ -185,13 +242,27 @@ class TestConfigFileOperations:
             data = json.load(f)
         assert data["scraping"]["max_posts"] == "infinity"
 
+    def test_saved_file_layout(self, tmp_path):
+        """Test that configs are written indented with non-ASCII text kept."""
+        config_file = tmp_path / "layout.json"
+        config = get_default_config()
+        config.output.output_dir = Path("archivé")
+
+        save_config_to_file(config, config_file)
+
+        data = json.loads(config_file.read_text(encoding="utf-8"))
+        assert config_file.read_text(encoding="utf-8") == json.dumps(
+            data, indent=2, ensure_ascii=False
+        )
+        assert data["output"]["output_dir"] == "archivé"
+
 
 class TestConfigLoading:
     """Test configuration loading with search paths."""
 
-    def test_load_config_with_explicit_path(self, temp_dir):
+    def test_load_config_with_explicit_path(self, tmp_path):
         """Test loading config with explicit file path."""
-        config_file = temp_dir / "explicit_config.json"
+        config_file = tmp_path / "explicit_config.json"
 
         # Create a test config file
         test_config = {"scraping": {"max_posts": 42}, "output": {"pretty_print": False}}
@@ -241,23 +312,48 @@ class TestConfigArgumentUpdates:
         assert updated_config.scraping.max_comments_per_post == 75
         assert updated_config.scraping.download_images is True
 
-    def test_update_output_config(self, sample_config, temp_dir):
+    def test_update_output_config(self, sample_config, tmp_path):
         """Test updating output configuration from arguments."""
-        args = {"output_dir": temp_dir}
+        args = {"output_dir": tmp_path}
 
         updated_config = update_config_from_args(sample_config, **args)
 
-        assert updated_config.output.output_dir == temp_dir
+        assert updated_config.output.output_dir == tmp_path
 
-    def test_update_log_file(self, sample_config, temp_dir):
+    def test_update_log_file(self, sample_config, tmp_path):
         """Test updating log file from arguments."""
-        log_file = temp_dir / "test.log"
+        log_file = tmp_path / "test.log"
         args = {"log_file": log_file}
 
         updated_config = update_config_from_args(sample_config, **args)
 
         assert updated_config.log_file == log_file
 
+    def test_invalid_values_rejected(self, sample_config):
+        """Test that every invalid value set from arguments is reported."""
+        sample_config.scraping.request_timeout = 0
+        args = {"max_comments_per_post": 0, "max_workers": 0, "verbose": True}
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            update_config_from_args(sample_config, **args)
+
+        assert exc_info.value.context["violations"] == [
+            "unknown argument 'verbose'",
+            "request_timeout must be positive",
+            "max_workers must be positive",
+            "max_comments_per_post must be positive",
+        ]
+
+    def test_rejected_update_leaves_config_unchanged(self, sample_config):
+        """Test that no argument is applied when any of them is invalid."""
+        original = copy.deepcopy(sample_config)
+        args = {"max_posts": 5, "output_dir": "elsewhere", "max_replies_per_comment": 0}
+
+        with pytest.raises(ConfigurationError):
+            update_config_from_args(sample_config, **args)
+
+        assert sample_config == original
+
     def test_ignore_none_values(self, sample_config):
         """Test that None values in arguments are ignored."""
         original_max_posts = sample_config.scraping.max_posts
@@ -275,9 +371,9 @@ class TestConfigArgumentUpdates:
 class TestConfigEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_config_with_empty_dict(self, temp_dir):
+    def test_config_with_empty_dict(self, tmp_path):
         """Test loading config from empty JSON object."""
-        config_file = temp_dir / "empty_config.json"
+        config_file = tmp_path / "empty_config.json"
         config_file.write_text("{}")
 
         config = load_config_from_file(config_file)
@@ -287,9 +383,9 @@ class TestConfigEdgeCases:
         assert config.scraping.max_posts == float("inf")
         assert config.output.pretty_print is True
 
-    def test_config_with_partial_data(self, temp_dir):
+    def test_config_with_partial_data(self, tmp_path):
         """Test loading config with only partial data."""
-        config_file = temp_dir / "partial_config.json"
+        config_file = tmp_path / "partial_config.json"
         config_data = {
             "scraping": {"max_posts": 100}
             # Missing output section
@@ -303,10 +399,10 @@ class TestConfigEdgeCases:
         # Should use defaults for missing values
         assert config.output.pretty_print is True
 
-    @patch("builtins.open", side_effect=PermissionError("Access denied"))
-    def test_save_config_permission_error(self, mock_file, temp_dir):
+    @patch.object(Path, "write_bytes", side_effect=PermissionError("Access denied"))
+    def test_save_config_permission_error(self, mock_file, tmp_path):
         """Test saving config when permission is denied."""
-        config_file = temp_dir / "no_permission.json"
+        config_file = tmp_path / "no_permission.json"
         config = get_default_config()
 
         success = save_config_to_file(config, config_file)
@@ -371,6 +371,29 @@ class TestErrorContextManagement:
         assert error.context["key1"] == "value1"
         assert error.context["status_code"] == 404
 
+    def test_caller_context_not_modified(self):
+        """Test that error fields are added to a copy of the caller's context."""
+        original_context = {"key1": "value1"}
+        error = ImageDownloadError(
+            "Download failed",
+            image_url="https://example.com/a.jpg",
+            context=original_context,
+        )
+
+        assert original_context == {"key1": "value1"}
+        assert error.context == {
+            "key1": "value1",
+            "image_url": "https://example.com/a.jpg",
+            "operation": "download",
+        }
+
+    def test_specialized_error_accepts_context(self):
+        """Test that errors with a fixed error code also take caller context."""
+        error = RateLimitError("Rate limited", retry_after=5, context={"attempt": 3})
+
+        assert error.context == {"attempt": 3, "retry_after": 5}
+        assert error.error_code == "RATE_LIMIT"
+
     def test_error_serialization(self):
         """Test that errors can be properly serialized."""
         error = NetworkError(
@@ -10,7 +10,13 @@ from unittest.mock import Mock
 import pytest
 
 from post_archiver_improved.exceptions import ParseError
-from post_archiver_improved.extractors import CommentExtractor, PostExtractor
+from post_archiver_improved.extractors import (
+    _EMPTY,
+    CommentExtractor,
+    PostExtractor,
+    _extract_run_url,
+    parse_count,
+)
 
 
 class TestPostExtractor:
@@ -277,7 +283,7 @@ class TestPostExtractor:
         assert post.content == "Test post content with a link"
         assert post.timestamp == "2 hours ago"
         assert post.likes == "42"
-        assert post.comments_count == "15"
+        assert post.comments_count == 15
         assert post.author.name == "Test Channel"
         assert post.author.id == "UC123456789"
         assert len(post.images) == 1
@@ -301,7 +307,7 @@ class TestPostExtractor:
         assert post.content == "Basic post"
         assert post.timestamp == ""
         assert post.likes == "0"
-        assert post.comments_count == "0"
+        assert post.comments_count == 0
         assert post.images == []
         assert post.links == []
 
@@ -342,6 +348,144 @@ class TestPostExtractor:
         assert post.post_id == "members_post"
         assert post.members_only is True
 
+    @pytest.mark.parametrize(
+        "styles,verified,member",
+        [
+            (["BADGE_STYLE_TYPE_VERIFIED"], True, False),
+            (["BADGE_STYLE_TYPE_VERIFIED_ARTIST"], True, False),
+            (["BADGE_STYLE_TYPE_MEMBER"], False, True),
+            (["BADGE_STYLE_TYPE_MEMBER", "BADGE_STYLE_TYPE_VERIFIED"], True, True),
+            (["BADGE_STYLE_TYPE_COLLECTION"], False, False),
+        ],
+    )
+    def test_extract_author_badges(self, styles, verified, member):
+        """Test that badge styles map to verified and member flags."""
+        author = PostExtractor._extract_author_info(
+            {
+                "authorBadges": [
+                    {"metadataBadgeRenderer": {"style": style}} for style in styles
+                ]
+            }
+        )
+
+        assert author.is_verified is verified
+        assert author.is_member is member
+
+    def test_extract_post_with_sparse_renderer(self):
+        """Test that missing optional sections fall back to defaults."""
+        post = PostExtractor.extract_post_data(
+            {"postId": "sparse_post", "publishedTimeText": {"runs": []}}
+        )
+
+        assert post.post_id == "sparse_post"
+        assert post.timestamp == ""
+        assert post.likes == "0"
+        assert post.comments_count == 0
+        assert post.images == []
+        # The shared default must never pick up data from a renderer
+        assert _EMPTY == {}
+
+
+class TestParseCount:
+    """Test parse_count helper."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("15", 15),
+            ("5 Comments", 5),
+            ("1,234 Comments", 1234),
+            ("1.2K", 1200),
+            ("3.5k comments", 3500),
+            ("2M", 2_000_000),
+            ("Comment", 0),
+            ("", 0),
+        ],
+    )
+    def test_parse_count(self, text, expected):
+        """Test parsing of plain and abbreviated display counts."""
+        assert parse_count(text) == expected
+
+
+class TestExtractRunUrl:
+    """Test link URL extraction from content runs."""
+
+    @pytest.mark.parametrize(
+        "run,expected",
+        [
+            (
+                {
+                    "navigationEndpoint": {
+                        "commandMetadata": {"webCommandMetadata": {"url": "/watch?v=x"}}
+                    }
+                },
+                "https://www.youtube.com/watch?v=x",
+            ),
+            (
+                {"navigationEndpoint": {"urlEndpoint": {"url": "https://example.com"}}},
+                "https://example.com",
+            ),
+            (
+                {
+                    "navigationEndpoint": {
+                        "browseEndpoint": {"canonicalBaseUrl": "/@channel"}
+                    }
+                },
+                "https://www.youtube.com/@channel",
+            ),
+            ({"navigationEndpoint": {"commandMetadata": {}}}, ""),
+            ({"navigationEndpoint": {"browseEndpoint": {}}}, ""),
+            ({"text": "plain text"}, ""),
+        ],
+    )
+    def test_extract_run_url(self, run, expected):
+        """Test each endpoint type and runs without links."""
+        assert _extract_run_url(run) == expected
+
+
+class TestAuthorUrl:
+    """Test cached author URL construction."""
+
+    def test_author_url_shared_between_comments(self):
+        """Test that repeated authors get the same URL object."""
+        extractor = CommentExtractor(Mock())
+        renderer = {
+            "commentId": "c1",
+            "authorText": {"runs": [{"text": "Author"}]},
+            "authorEndpoint": {
+                "browseEndpoint": {
+                    "browseId": "UC1",
+                    "canonicalBaseUrl": "/@author",
+                }
+            },
+        }
+
+        first = extractor.extract_comment_from_renderer(renderer)
+        second = extractor.extract_comment_from_renderer(dict(renderer, commentId="c2"))
+
+        assert first.author.url == "https://www.youtube.com/@author"
+        assert first.author.url is second.author.url
+
+
+class TestTimestampEstimation:
+    """Test detection of relative timestamps."""
+
+    @pytest.mark.parametrize(
+        "timestamp,expected",
+        [
+            ("2 hours ago", True),
+            ("1 Day Ago", True),
+            ("3 weeks ago (edited)", True),
+            ("Edited", True),
+            ("2023-01-01T12:00:00Z", False),
+            ("Jan 1, 2023", False),
+            ("", False),
+        ],
+    )
+    def test_is_timestamp_estimated(self, timestamp, expected):
+        """Test that relative indicators are found regardless of case."""
+        assert PostExtractor._is_timestamp_estimated(timestamp) is expected
+
 
 class TestCommentExtractor:
     """Test CommentExtractor class."""
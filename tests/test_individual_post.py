@@ -70,6 +70,7 @@ class TestPostUtilities:
             "Ugk" + "x" * 100,  # Too long
             "Ugk with spaces 123456789012345678901",  # Contains spaces
             "Ugk@invalid#chars!123456789012345678",  # Invalid characters
+            "Ugk\u00e9\u00e8" + "x" * 30,  # Non-ASCII letters
             "",  # Empty
             None,  # None
         ]
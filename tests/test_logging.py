@@ -206,10 +206,10 @@ class TestSetupLogging:
         # Default should be WARNING
         assert logger.level == logging.WARNING
 
-    def test_file_logging(self, temp_dir):
+    def test_file_logging(self, tmp_path):
         """Test logging to file."""
         with cleanup_logging_handlers():
-            log_file = temp_dir / "test.log"
+            log_file = tmp_path / "test.log"
 
             logger = setup_logging(log_file=log_file)
 
@@ -226,10 +226,10 @@ class TestSetupLogging:
             assert file_handler is not None
             assert log_file.name in str(file_handler.baseFilename)
 
-    def test_file_logging_creates_directory(self, temp_dir):
+    def test_file_logging_creates_directory(self, tmp_path):
         """Test that file logging creates parent directories."""
         with cleanup_logging_handlers():
-            nested_dir = temp_dir / "logs" / "nested"
+            nested_dir = tmp_path / "logs" / "nested"
             log_file = nested_dir / "test.log"
 
             logger = setup_logging(log_file=log_file)
@@ -258,10 +258,10 @@ class TestSetupLogging:
         assert console_handler is not None
         assert isinstance(console_handler.formatter, ColoredFormatter)
 
-    def test_file_handler_has_standard_formatter(self, temp_dir):
+    def test_file_handler_has_standard_formatter(self, tmp_path):
         """Test that file handler uses standard formatter."""
         with cleanup_logging_handlers():
-            log_file = temp_dir / "test.log"
+            log_file = tmp_path / "test.log"
             logger = setup_logging(log_file=log_file)
 
             # Find file handler
@@ -282,10 +282,10 @@ class TestSetupLogging:
 
         assert logger.name == custom_name
 
-    def test_logging_levels_work(self, temp_dir):
+    def test_logging_levels_work(self, tmp_path):
         """Test that different logging levels work correctly."""
         with cleanup_logging_handlers():
-            log_file = temp_dir / "levels_test.log"
+            log_file = tmp_path / "levels_test.log"
             logger = setup_logging(debug=True, log_file=log_file)
 
             # Test all levels
@@ -364,13 +364,13 @@ class TestLoggingIntegration:
         assert api_logger.name == "post_archiver_improved.api"
         assert config_logger.name == "post_archiver_improved.config"
 
-    def test_logging_with_file_permissions_error(self, temp_dir):
+    def test_logging_with_file_permissions_error(self, tmp_path):
         """Test handling of file permission errors."""
         with cleanup_logging_handlers():
             import os
 
             # Create a read-only directory
-            readonly_dir = temp_dir / "readonly"
+            readonly_dir = tmp_path / "readonly"
             readonly_dir.mkdir()
 
             # Handle Windows vs Unix permission setting
@@ -402,10 +402,10 @@ class TestLoggingIntegration:
                 else:
                     readonly_dir.chmod(0o755)
 
-    def test_log_message_format(self, temp_dir):
+    def test_log_message_format(self, tmp_path):
         """Test that log messages have expected format."""
         with cleanup_logging_handlers():
-            log_file = temp_dir / "format_test.log"
+            log_file = tmp_path / "format_test.log"
             logger = setup_logging(debug=True, log_file=log_file)
 
             test_message = "Test log message"
@@ -419,10 +419,10 @@ class TestLoggingIntegration:
             # Should have timestamp (basic check for date-like format)
             assert any(char.isdigit() for char in log_content)
 
-    def test_exception_logging(self, temp_dir):
+    def test_exception_logging(self, tmp_path):
         """Test logging of exceptions with tracebacks."""
         with cleanup_logging_handlers():
-            log_file = temp_dir / "exception_test.log"
+            log_file = tmp_path / "exception_test.log"
             logger = setup_logging(debug=True, log_file=log_file)
 
             try:
@@ -5,6 +5,8 @@ This module tests the data model classes including Post, Comment, Author,
 Image, Link, and archive-related models.
 """
 
+import sys
+
 import pytest
 
 from post_archiver_improved.models import (
@@ -18,6 +20,28 @@ from post_archiver_improved.models import (
 )
 
 
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+"
+)
+class TestModelSlots:
+    """Test that per-record models do not carry an instance __dict__."""
+
+    @pytest.mark.parametrize(
+        "model", [Author, Link, Image, Comment, Post, ArchiveData, ArchiveMetadata]
+    )
+    def test_models_use_slots(self, model):
+        """Test that model classes define __slots__."""
+        assert "__slots__" in model.__dict__
+
+    def test_post_rejects_unknown_attributes(self):
+        """Test that slotted instances reject attributes outside the fields."""
+        post = Post(post_id="post123")
+
+        assert not hasattr(post, "__dict__")
+        with pytest.raises(AttributeError):
+            post.unknown_field = "value"
+
+
 class TestAuthor:
     """Test Author model."""
 
@@ -244,7 +268,7 @@ class TestPost:
             timestamp="2023-01-01T10:00:00Z",
             timestamp_estimated=False,
             likes="100",
-            comments_count="25",
+            comments_count=25,
             members_only=True,
             author=sample_author,
             images=[sample_image],
@@ -257,7 +281,7 @@ class TestPost:
         assert post.timestamp == "2023-01-01T10:00:00Z"
         assert post.timestamp_estimated is False
         assert post.likes == "100"
-        assert post.comments_count == "25"
+        assert post.comments_count == 25
         assert post.members_only is True
         assert post.author == sample_author
         assert len(post.images) == 1
@@ -273,7 +297,7 @@ class TestPost:
         assert post.timestamp == ""
         assert post.timestamp_estimated is False
         assert post.likes == "0"
-        assert post.comments_count == "0"
+        assert post.comments_count == 0
         assert post.members_only is False
         assert isinstance(post.author, Author)
         assert post.images == []
@@ -289,7 +313,7 @@ class TestPost:
             content="Test post content",
             timestamp="2023-01-01T15:00:00Z",
             likes="50",
-            comments_count="10",
+            comments_count=10,
             author=sample_author,
             images=[sample_image],
             links=[sample_link],
@@ -302,7 +326,7 @@ class TestPost:
         assert post_dict["content"] == "Test post content"
         assert post_dict["timestamp"] == "2023-01-01T15:00:00Z"
         assert post_dict["likes"] == "50"
-        assert post_dict["comments_count"] == "10"
+        assert post_dict["comments_count"] == 10
         assert post_dict["author"] == sample_author.name
         assert post_dict["author_id"] == sample_author.id
         assert post_dict["author_url"] == sample_author.url
@@ -339,7 +363,7 @@ class TestPost:
             "timestamp": "2023-01-03T08:00:00Z",
             "timestamp_estimated": True,
             "likes": "75",
-            "comments_count": "15",
+            "comments_count": 15,
             "members_only": False,
             "author": "Test Author",
             "author_id": "UC111222333",
@@ -367,7 +391,7 @@ class TestPost:
         assert post.timestamp == "2023-01-03T08:00:00Z"
         assert post.timestamp_estimated is True
         assert post.likes == "75"
-        assert post.comments_count == "15"
+        assert post.comments_count == 15
         assert post.members_only is False
         assert post.author.name == "Test Author"
         assert post.author.id == "UC111222333"
@@ -538,6 +562,21 @@ class TestArchiveData:
         # Downloaded images: 2 (only img1 and img3 have local_path)
         assert archive_dict["images_downloaded"] == 2
 
+    @pytest.mark.parametrize(
+        "stored, expected",
+        [("25", 25), ("1.2K", 1200), ("3 Comments", 3), ("", 0), (None, 0)],
+    )
+    def test_archive_with_string_comments_count(self, stored, expected):
+        """Test that archives storing comments_count as text still load."""
+        archive_dict = {
+            "channel_id": "UC555666777",
+            "posts": [{"post_id": "old_post", "comments_count": stored}],
+        }
+
+        archive_data = ArchiveData.from_dict(archive_dict)
+
+        assert archive_data.posts[0].comments_count == expected
+
     def test_archive_data_from_dict(self):
         """Test archive data creation from dictionary."""
         archive_dict = {
@@ -583,6 +622,8 @@ class TestArchiveData:
         assert archive_data.metadata.config_used == {"max_posts": 50}
         assert len(archive_data.posts) == 1
         assert archive_data.posts[0].post_id == "test_post"
+        # Archives written before comments_count became an int still load
+        assert archive_data.posts[0].comments_count == 5
         assert archive_data.posts[0].content == "Test content"
 
 
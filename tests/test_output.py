@@ -27,15 +27,15 @@ class TestOutputManager:
 
         assert manager.config == config
 
-    def test_save_archive_data_basic(self, temp_dir, sample_archive_data):
+    def test_save_archive_data_basic(self, tmp_path, sample_archive_data):
         """Test basic archive data saving."""
-        config = OutputConfig(output_dir=temp_dir, pretty_print=True)
+        config = OutputConfig(output_dir=tmp_path, pretty_print=True)
         manager = OutputManager(config)
 
         result_path = manager.save_archive_data(sample_archive_data)
 
         assert result_path.exists()
-        assert result_path.parent == temp_dir
+        assert result_path.parent == tmp_path
         assert result_path.suffix == ".json"
         assert sample_archive_data.metadata.channel_id in result_path.name
 
@@ -46,9 +46,9 @@ class TestOutputManager:
         assert saved_data["channel_id"] == sample_archive_data.metadata.channel_id
         assert "posts" in saved_data
 
-    def test_save_archive_data_compact(self, temp_dir, sample_archive_data):
+    def test_save_archive_data_compact(self, tmp_path, sample_archive_data):
         """Test saving archive data in compact format."""
-        config = OutputConfig(output_dir=temp_dir, pretty_print=False)
+        config = OutputConfig(output_dir=tmp_path, pretty_print=False)
         manager = OutputManager(config)
 
         result_path = manager.save_archive_data(sample_archive_data)
@@ -60,9 +60,9 @@ class TestOutputManager:
         assert "\n" not in content or content.count("\n") < 5
         assert "  " not in content  # No double spaces from indentation
 
-    def test_save_archive_data_pretty_print(self, temp_dir, sample_archive_data):
+    def test_save_archive_data_pretty_print(self, tmp_path, sample_archive_data):
         """Test saving archive data with pretty printing."""
-        config = OutputConfig(output_dir=temp_dir, pretty_print=True)
+        config = OutputConfig(output_dir=tmp_path, pretty_print=True)
         manager = OutputManager(config)
 
         result_path = manager.save_archive_data(sample_archive_data)
@@ -74,20 +74,39 @@ class TestOutputManager:
         assert "\n" in content
         assert "  " in content  # Indentation spaces
 
-    def test_save_archive_data_custom_path(self, temp_dir, sample_archive_data):
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_save_archive_data_same_with_and_without_orjson(
+        self, tmp_path, sample_archive_data, pretty_print
+    ):
+        """Test that the saved file does not depend on the JSON codec."""
+        pytest.importorskip("orjson")
+        sample_archive_data.posts[0].content = "caf\u00e9 \U0001f600"
+        manager = OutputManager(OutputConfig(pretty_print=pretty_print))
+
+        contents = []
+        for use_orjson in (True, False):
+            path = tmp_path / f"orjson_{use_orjson}.json"
+            with patch("post_archiver_improved.utils._HAS_ORJSON", use_orjson):
+                manager.save_archive_data(sample_archive_data, path)
+            contents.append(path.read_bytes())
+
+        assert contents[0] == contents[1]
+        assert "caf\u00e9 \U0001f600".encode() in contents[0]
+
+    def test_save_archive_data_custom_path(self, tmp_path, sample_archive_data):
         """Test saving archive data to custom path."""
         config = OutputConfig()
         manager = OutputManager(config)
 
-        custom_path = temp_dir / "custom_archive.json"
+        custom_path = tmp_path / "custom_archive.json"
         result_path = manager.save_archive_data(sample_archive_data, custom_path)
 
         assert result_path == custom_path
         assert custom_path.exists()
 
-    def test_save_archive_data_creates_directory(self, temp_dir, sample_archive_data):
+    def test_save_archive_data_creates_directory(self, tmp_path, sample_archive_data):
         """Test that saving creates output directory if it doesn't exist."""
-        nested_dir = temp_dir / "output" / "archives"
+        nested_dir = tmp_path / "output" / "archives"
         config = OutputConfig(output_dir=nested_dir)
         manager = OutputManager(config)
 
@@ -96,9 +115,9 @@ class TestOutputManager:
         assert nested_dir.exists()
         assert result_path.parent == nested_dir
 
-    def test_save_archive_data_backup_existing(self, temp_dir, sample_archive_data):
+    def test_save_archive_data_backup_existing(self, tmp_path, sample_archive_data):
         """Test that existing files are backed up before overwriting."""
-        config = OutputConfig(output_dir=temp_dir)
+        config = OutputConfig(output_dir=tmp_path)
         manager = OutputManager(config)
 
         # Save first time
@@ -110,20 +129,20 @@ class TestOutputManager:
         manager.save_archive_data(sample_archive_data, result_path)
 
         # Check that backup was created
-        backup_files = list(temp_dir.glob("*backup*"))
+        backup_files = list(tmp_path.glob("*backup*"))
         assert len(backup_files) >= 1
 
         # Verify backup contains original content
         backup_content = backup_files[0].read_text()
         assert backup_content == original_content
 
-    def test_save_archive_data_permission_error(self, temp_dir, sample_archive_data):
+    def test_save_archive_data_permission_error(self, tmp_path, sample_archive_data):
         """Test handling of permission errors during file save."""
         import os
         import platform
 
         # Create read-only directory
-        readonly_dir = temp_dir / "readonly"
+        readonly_dir = tmp_path / "readonly"
         readonly_dir.mkdir()
 
         # Handle Windows vs Unix permission setting
@@ -173,10 +192,10 @@ class TestOutputManager:
 
     @patch("builtins.open", side_effect=PermissionError("Access denied"))
     def test_save_archive_data_permission_error_mocked(
-        self, mock_open, temp_dir, sample_archive_data
+        self, mock_open, tmp_path, sample_archive_data
     ):
         """Test handling of permission errors during save with mocked open."""
-        config = OutputConfig(output_dir=temp_dir)
+        config = OutputConfig(output_dir=tmp_path)
         manager = OutputManager(config)
 
         with pytest.raises(FileOperationError) as exc_info:
@@ -184,7 +203,7 @@ class TestOutputManager:
 
         assert "Permission" in str(exc_info.value) or "Access" in str(exc_info.value)
 
-    def test_save_archive_data_unicode_content(self, temp_dir):
+    def test_save_archive_data_unicode_content(self, tmp_path):
         """Test saving archive data with Unicode content."""
         # Create archive data with Unicode content
         author = Author(name="测试频道", id="UC123456789")
@@ -201,7 +220,7 @@ class TestOutputManager:
         )
         archive_data = ArchiveData(metadata=metadata, posts=[post])
 
-        config = OutputConfig(output_dir=temp_dir, pretty_print=True)
+        config = OutputConfig(output_dir=tmp_path, pretty_print=True)
         manager = OutputManager(config)
 
         result_path = manager.save_archive_data(archive_data)
@@ -213,7 +232,7 @@ class TestOutputManager:
         assert saved_data["posts"][0]["content"] == "Hello 世界! 🎥 Testing Unicode 📹"
         assert saved_data["posts"][0]["author"] == "测试频道"
 
-    def test_save_archive_data_large_file(self, temp_dir):
+    def test_save_archive_data_large_file(self, tmp_path):
         """Test saving large archive data."""
         # Create large archive data
         author = Author(name="Large Channel", id="UC123456789")
@@ -234,7 +253,7 @@ class TestOutputManager:
         )
         archive_data = ArchiveData(metadata=metadata, posts=posts)
 
-        config = OutputConfig(output_dir=temp_dir)
+        config = OutputConfig(output_dir=tmp_path)
         manager = OutputManager(config)
 
         result_path = manager.save_archive_data(archive_data)
@@ -254,9 +273,9 @@ class TestOutputManager:
 class TestCreateSummaryReport:
     """Test create_summary_report method."""
 
-    def test_create_summary_basic(self, temp_dir, sample_archive_data):
+    def test_create_summary_basic(self, tmp_path, sample_archive_data):
         """Test basic summary report creation."""
-        config = OutputConfig(output_dir=temp_dir)
+        config = OutputConfig(output_dir=tmp_path)
         manager = OutputManager(config)
 
         summary_text = manager.create_summary_report(sample_archive_data)
@@ -270,9 +289,9 @@ class TestCreateSummaryReport:
             or sample_archive_data.metadata.channel_id in summary_text
         )
 
-    def test_save_summary_report(self, temp_dir, sample_archive_data):
+    def test_save_summary_report(self, tmp_path, sample_archive_data):
         """Test saving summary report to file."""
-        config = OutputConfig(output_dir=temp_dir)
+        config = OutputConfig(output_dir=tmp_path)
         manager = OutputManager(config)
 
         result_path = manager.save_summary_report(sample_archive_data)
@@ -286,9 +305,9 @@ class TestCreateSummaryReport:
 class TestOutputErrorHandling:
     """Test error handling in output operations."""
 
-    def test_output_manager_disk_full_simulation(self, temp_dir, sample_archive_data):
+    def test_output_manager_disk_full_simulation(self, tmp_path, sample_archive_data):
         """Test handling of disk full errors."""
-        config = OutputConfig(output_dir=temp_dir)
+        config = OutputConfig(output_dir=tmp_path)
         manager = OutputManager(config)
 
         # Mock disk full error
@@ -301,7 +320,7 @@ class TestOutputErrorHandling:
                 or "disk" in str(exc_info.value).lower()
             )
 
-    def test_output_manager_readonly_filesystem(self, temp_dir, sample_archive_data):
+    def test_output_manager_readonly_filesystem(self, tmp_path, sample_archive_data):
         """Test handling of read-only filesystem."""
         import platform
 
@@ -312,10 +331,10 @@ class TestOutputErrorHandling:
             pytest.skip("Read-only filesystem tests are unreliable on Windows")
         else:
             # Make directory read-only
-            temp_dir.chmod(0o444)
+            tmp_path.chmod(0o444)
 
         try:
-            config = OutputConfig(output_dir=temp_dir)
+            config = OutputConfig(output_dir=tmp_path)
             manager = OutputManager(config)
 
             with pytest.raises(FileOperationError):
@@ -323,9 +342,9 @@ class TestOutputErrorHandling:
         finally:
             # Restore permissions for cleanup
             if platform.system() != "Windows":
-                temp_dir.chmod(0o755)
+                tmp_path.chmod(0o755)
 
-    def test_output_manager_invalid_json_serialization(self, temp_dir):
+    def test_output_manager_invalid_json_serialization(self, tmp_path):
         """Test handling of objects that can't be JSON serialized."""
         # Create archive data with non-serializable object
         metadata = ArchiveMetadata(
@@ -339,7 +358,7 @@ class TestOutputErrorHandling:
         # but our models should handle this properly
         archive_data = ArchiveData(metadata=metadata, posts=[])
 
-        config = OutputConfig(output_dir=temp_dir)
+        config = OutputConfig(output_dir=tmp_path)
         manager = OutputManager(config)
 
         # Should handle gracefully
@@ -5,21 +5,34 @@ This module tests the CommunityPostScraper class and its integration
 with other components.
 """
 
+import threading
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
 
 from post_archiver_improved.config import Config, OutputConfig, ScrapingConfig
+from post_archiver_improved.constants import MAX_POST_WORKERS
 from post_archiver_improved.exceptions import (
     APIError,
     ParseError,
     ValidationError,
 )
-from post_archiver_improved.models import ArchiveData, Comment, Post
+from post_archiver_improved.models import ArchiveData, Comment, Image, Post
 from post_archiver_improved.scraper import CommunityPostScraper
 
 
+@pytest.fixture(autouse=True)
+def mock_resolve():
+    """Keep scraper tests off the network by failing every DNS lookup."""
+    with patch(
+        "post_archiver_improved.utils._resolve",
+        side_effect=OSError("DNS disabled in tests"),
+    ) as mock:
+        yield mock
+
+
 class TestCommunityPostScraper:
     """Test CommunityPostScraper class."""
 
@@ -47,10 +60,10 @@ class TestCommunityPostScraper:
 
         assert scraper.comment_extractor is None
 
-    def test_scraper_initialization_with_cookies(self, temp_dir):
+    def test_scraper_initialization_with_cookies(self, tmp_path):
         """Test scraper initialization with cookie file."""
         # Create a mock cookie file
-        cookies_file = temp_dir / "cookies.txt"
+        cookies_file = tmp_path / "cookies.txt"
         cookie_content = (
             """.youtube.com\tTRUE\t/\tFALSE\t1735689600\tSIDCC\ttest_value"""
         )
@@ -93,6 +106,34 @@ class TestCommunityPostScraper:
                 cookies_file=None,
             )
 
+    def test_feature_flags_resolved_at_init(self, tmp_path):
+        """Test that image/comment switches account for their prerequisites."""
+        no_output = CommunityPostScraper(
+            Config(
+                scraping=ScrapingConfig(download_images=True, extract_comments=False),
+                output=OutputConfig(),
+            )
+        )
+        assert no_output._download_images_enabled is False
+        assert no_output._extract_comments_enabled is False
+
+        enabled = CommunityPostScraper(
+            Config(
+                scraping=ScrapingConfig(download_images=True, extract_comments=True),
+                output=OutputConfig(output_dir=tmp_path),
+            )
+        )
+        assert enabled._download_images_enabled is True
+        assert enabled._extract_comments_enabled is True
+
+    def test_initialization_does_no_lookups(self, sample_config, mock_resolve):
+        """Test that creating a scraper leaves DNS to the first request."""
+        sample_config.scraping.download_images = True
+
+        CommunityPostScraper(sample_config)
+
+        mock_resolve.assert_not_called()
+
     @patch("post_archiver_improved.scraper.YouTubeCommunityAPI")
     def test_scraper_api_configuration(self, mock_api_class, sample_config):
         """Test that API is configured with correct parameters."""
@@ -166,7 +207,7 @@ class TestScrapePosts:
         mock_extractor = Mock()
         mock_post = Mock(spec=Post)
         mock_post.post_id = "test_post_1"
-        mock_post.comments_count = "0"
+        mock_post.comments_count = 0
         mock_post.images = []
         mock_extractor.extract_post_data.return_value = mock_post
         mock_extractor_class.return_value = mock_extractor
@@ -247,7 +288,226 @@ class TestScrapePosts:
             result = scraper.scrape_posts("UC123456789")
 
             assert result.metadata.scrape_timestamp == 1672574400
+            assert result.metadata.scrape_date == fixed_datetime.isoformat()
             assert result.metadata.channel_id == "UC123456789"
+            mock_datetime.now.assert_called_once()
+
+
+def _post_items(post_id, token=None):
+    """Build continuation items holding one post and an optional next token."""
+    items = [
+        {
+            "backstagePostThreadRenderer": {
+                "post": {"backstagePostRenderer": {"postId": post_id}}
+            }
+        }
+    ]
+    if token:
+        items.append(
+            {
+                "continuationItemRenderer": {
+                    "continuationEndpoint": {"continuationCommand": {"token": token}}
+                }
+            }
+        )
+    return items
+
+
+class TestContinuationRateLimiting:
+    """Test rate limiting between continuation requests."""
+
+    def _run_scrape(self, mock_time, monotonic_values):
+        mock_time.time.return_value = 0.0
+        mock_time.monotonic.side_effect = monotonic_values
+
+        config = Config(
+            scraping=ScrapingConfig(extract_comments=False, retry_delay=1.0),
+            output=OutputConfig(),
+        )
+        scraper = CommunityPostScraper(config)
+        scraper.api = Mock()
+        scraper.api.get_continuation_data.side_effect = [
+            {
+                "onResponseReceivedEndpoints": [
+                    {"appendContinuationItemsAction": {"continuationItems": items}}
+                ]
+            }
+            for items in (_post_items("post1", "token2"), _post_items("post2"))
+        ]
+
+        with patch.object(
+            scraper, "_find_community_tab", return_value={"title": "Posts"}
+        ), patch.object(
+            scraper,
+            "_extract_tab_contents",
+            return_value=_post_items("post0", "token1"),
+        ), patch.object(
+            scraper.post_extractor,
+            "extract_post_data",
+            side_effect=lambda renderer: Post(post_id=renderer["postId"]),
+        ):
+            return scraper.scrape_posts("UC123456789012345678901A")
+
+    @patch("post_archiver_improved.scraper.time")
+    def test_sleeps_only_remaining_delay(self, mock_time):
+        """Fast pages sleep only for the part of the delay not yet elapsed."""
+        # start, wait check 1, after request 1, wait check 2, after request 2
+        result = self._run_scrape(mock_time, [0.0, 0.0, 0.2, 0.5, 0.6])
+
+        assert [post.post_id for post in result.posts] == ["post0", "post1", "post2"]
+        mock_time.sleep.assert_called_once()
+        assert mock_time.sleep.call_args[0][0] == pytest.approx(0.7)
+
+    @patch("post_archiver_improved.scraper.time")
+    def test_slow_page_skips_sleep(self, mock_time):
+        """Pages slower than the delay do not sleep at all."""
+        result = self._run_scrape(mock_time, [0.0, 0.0, 0.2, 3.0, 3.1])
+
+        assert len(result.posts) == 3
+        mock_time.sleep.assert_not_called()
+
+
+class TestContinuationPrefetch:
+    """Test fetching the next continuation page in the background."""
+
+    def _make_scraper(self, max_posts=float("inf")):
+        config = Config(
+            scraping=ScrapingConfig(
+                extract_comments=False, retry_delay=0, max_posts=max_posts
+            ),
+            output=OutputConfig(),
+        )
+        scraper = CommunityPostScraper(config)
+        scraper.api = Mock()
+        return scraper
+
+    def test_next_page_fetched_while_batch_is_processed(self):
+        """The continuation request runs while the initial batch is processed."""
+        scraper = self._make_scraper()
+        fetched = threading.Event()
+
+        def get_continuation_data(token):
+            fetched.set()
+            return {
+                "onResponseReceivedEndpoints": [
+                    {
+                        "appendContinuationItemsAction": {
+                            "continuationItems": _post_items("post1")
+                        }
+                    }
+                ]
+            }
+
+        def extract_post_data(renderer):
+            if renderer["postId"] == "post0":
+                # Only completes if the fetch runs concurrently
+                assert fetched.wait(timeout=5)
+            return Post(post_id=renderer["postId"])
+
+        scraper.api.get_continuation_data.side_effect = get_continuation_data
+
+        with patch.object(
+            scraper, "_find_community_tab", return_value={"title": "Posts"}
+        ), patch.object(
+            scraper, "_extract_tab_contents", return_value=_post_items("post0", "t1")
+        ), patch.object(
+            scraper.post_extractor, "extract_post_data", side_effect=extract_post_data
+        ):
+            posts = list(scraper.iter_posts("UC123456789012345678901A"))
+
+        assert [post.post_id for post in posts] == ["post0", "post1"]
+
+    def test_no_prefetch_when_batch_reaches_limit(self):
+        """No continuation is requested if the current batch fills max_posts."""
+        scraper = self._make_scraper(max_posts=1)
+
+        with patch.object(
+            scraper, "_find_community_tab", return_value={"title": "Posts"}
+        ), patch.object(
+            scraper, "_extract_tab_contents", return_value=_post_items("post0", "t1")
+        ), patch.object(
+            scraper.post_extractor,
+            "extract_post_data",
+            side_effect=lambda renderer: Post(post_id=renderer["postId"]),
+        ):
+            result = scraper.scrape_posts("UC123456789012345678901A")
+
+        assert len(result.posts) == 1
+        scraper.api.get_continuation_data.assert_not_called()
+
+
+class TestIterPosts:
+    """Test iter_posts generator."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = Config(
+            scraping=ScrapingConfig(extract_comments=False), output=OutputConfig()
+        )
+        self.scraper = CommunityPostScraper(self.config)
+        self.scraper.api = Mock()
+
+    def test_iter_posts_invalid_channel_id(self):
+        """Invalid channel IDs are rejected before iteration starts."""
+        with pytest.raises(ValidationError):
+            self.scraper.iter_posts("invalid_channel_id")
+
+    def test_iter_posts_is_lazy(self):
+        """No request is made until the iterator is consumed."""
+        contents = [
+            {
+                "backstagePostThreadRenderer": {
+                    "post": {"backstagePostRenderer": {"postId": f"post{i}"}}
+                }
+            }
+            for i in range(3)
+        ]
+
+        with patch.object(
+            self.scraper, "_find_community_tab", return_value={"title": "Posts"}
+        ), patch.object(
+            self.scraper, "_extract_tab_contents", return_value=contents
+        ), patch.object(
+            self.scraper.post_extractor,
+            "extract_post_data",
+            side_effect=lambda renderer: Post(post_id=renderer["postId"]),
+        ):
+            posts = self.scraper.iter_posts("UC123456789012345678901A")
+            self.scraper.api.get_initial_data.assert_not_called()
+
+            first = next(posts)
+            assert first.post_id == "post0"
+            assert self.scraper.post_extractor.extract_post_data.call_count == 1
+
+            assert [post.post_id for post in posts] == ["post1", "post2"]
+
+    def test_repeated_posts_skipped(self):
+        """Posts re-emitted by a later page are neither re-extracted nor yielded."""
+        self.scraper.api.get_continuation_data.return_value = {
+            "onResponseReceivedEndpoints": [
+                {
+                    "appendContinuationItemsAction": {
+                        "continuationItems": _post_items("post0") + _post_items("post1")
+                    }
+                }
+            ]
+        }
+
+        with patch.object(
+            self.scraper, "_find_community_tab", return_value={"title": "Posts"}
+        ), patch.object(
+            self.scraper,
+            "_extract_tab_contents",
+            return_value=_post_items("post0", "t1"),
+        ), patch.object(
+            self.scraper.post_extractor,
+            "extract_post_data",
+            side_effect=lambda renderer: Post(post_id=renderer["postId"]),
+        ):
+            posts = list(self.scraper.iter_posts("UC123456789012345678901A"))
+
+            assert [post.post_id for post in posts] == ["post0", "post1"]
+            assert self.scraper.post_extractor.extract_post_data.call_count == 2
 
 
 class TestCommunityTabFinding:
@@ -338,13 +598,13 @@ class TestPostProcessing:
         mock_extractor = Mock()
         mock_post1 = Mock(spec=Post)
         mock_post1.post_id = "post1"
-        mock_post1.comments_count = "0"
+        mock_post1.comments_count = 0
         mock_post1.images = []
         mock_post1.comments = []
 
         mock_post2 = Mock(spec=Post)
         mock_post2.post_id = "post2"
-        mock_post2.comments_count = "5"
+        mock_post2.comments_count = 5
         mock_post2.images = []
         mock_post2.comments = []
 
@@ -397,7 +657,7 @@ class TestPostProcessing:
             for i in range(10):
                 mock_post = Mock(spec=Post)
                 mock_post.post_id = f"post{i}"
-                mock_post.comments_count = "0"
+                mock_post.comments_count = 0
                 mock_post.images = []
                 mock_post.comments = []
                 mock_posts.append(mock_post)
@@ -440,13 +700,13 @@ class TestPostProcessing:
             # First call succeeds, second fails, third succeeds
             valid_post1 = Mock(spec=Post)
             valid_post1.post_id = "valid_post"
-            valid_post1.comments_count = "0"
+            valid_post1.comments_count = 0
             valid_post1.images = []
             valid_post1.comments = []
 
             valid_post2 = Mock(spec=Post)
             valid_post2.post_id = "another_valid_post"
-            valid_post2.comments_count = "0"
+            valid_post2.comments_count = 0
             valid_post2.images = []
             valid_post2.comments = []
 
@@ -465,6 +725,81 @@ class TestPostProcessing:
         assert posts[1].post_id == "another_valid_post"
 
 
+class TestConcurrentCommentExtraction:
+    """Test fetching comments for several posts at once."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = Config(
+            scraping=ScrapingConfig(extract_comments=True), output=OutputConfig()
+        )
+        self.scraper = CommunityPostScraper(self.config)
+        self.contents = [item for i in range(6) for item in _post_items(f"post{i}")]
+        self.scraper.post_extractor = Mock()
+        self.scraper.post_extractor.extract_post_data.side_effect = lambda renderer: (
+            Post(post_id=renderer["postId"], comments_count=1)
+        )
+
+    def test_comments_fetched_concurrently_in_order(self):
+        """Test that comment extraction overlaps and posts keep their order."""
+        # The first pool's worth of extractions wait until all are in flight
+        barrier = threading.Barrier(MAX_POST_WORKERS, timeout=5)
+        first_posts = {f"post{i}" for i in range(MAX_POST_WORKERS)}
+
+        def extract_comments(channel_id, post_id):
+            if post_id in first_posts:
+                barrier.wait()
+            return [Comment(id=f"{post_id}_comment")]
+
+        with patch.object(
+            self.scraper, "_extract_post_comments", side_effect=extract_comments
+        ):
+            posts = self.scraper._process_posts_batch(self.contents, "UC123")
+
+        assert [post.post_id for post in posts] == [f"post{i}" for i in range(6)]
+        for post in posts:
+            assert [comment.id for comment in post.comments] == [
+                f"{post.post_id}_comment"
+            ]
+
+    def test_single_worker_fetches_one_post_at_a_time(self):
+        """Test that max_workers=1 never overlaps the posts' requests."""
+        self.config.scraping.max_workers = 1
+        scraper = CommunityPostScraper(self.config)
+        scraper.post_extractor = self.scraper.post_extractor
+        active = []
+        overlapped = []
+
+        def extract_comments(channel_id, post_id):
+            active.append(post_id)
+            overlapped.append(len(active) > 1)
+            time.sleep(0.01)
+            active.remove(post_id)
+            return []
+
+        with patch.object(
+            scraper, "_extract_post_comments", side_effect=extract_comments
+        ):
+            posts = scraper._process_posts_batch(self.contents, "UC123")
+
+        assert len(posts) == 6
+        assert not any(overlapped)
+        assert scraper.comment_extractor.max_workers == 1
+
+    def test_no_comments_fetched_past_limit(self):
+        """Test that posts beyond max_posts are neither extracted nor fetched."""
+        with patch.object(
+            self.scraper, "_extract_post_comments", return_value=[]
+        ) as mock_extract_comments:
+            posts = self.scraper._process_posts_batch(
+                self.contents, "UC123", max_posts=2
+            )
+
+        assert [post.post_id for post in posts] == ["post0", "post1"]
+        assert mock_extract_comments.call_count == 2
+        assert self.scraper.post_extractor.extract_post_data.call_count == 2
+
+
 class TestImageDownloading:
     """Test image downloading functionality."""
 
@@ -475,13 +810,13 @@ class TestImageDownloading:
         )
         self.scraper = CommunityPostScraper(self.config)
 
-    @patch("post_archiver_improved.scraper.download_image")
-    def test_download_post_images_success(self, mock_download, temp_dir):
+    @patch("post_archiver_improved.utils.download_image")
+    def test_download_post_images_success(self, mock_download, tmp_path):
         """Test successful image downloading."""
-        self.config.output.output_dir = temp_dir
+        self.config.output.output_dir = tmp_path
 
         # Mock successful download
-        mock_download.return_value = temp_dir / "downloaded_image.jpg"
+        mock_download.return_value = tmp_path / "downloaded_image.jpg"
 
         # Create post with images
         from post_archiver_improved.models import Image
@@ -501,16 +836,36 @@ class TestImageDownloading:
         assert image1.local_path is not None
         assert image2.local_path is not None
 
-    @patch("post_archiver_improved.scraper.download_image")
-    def test_download_post_images_with_errors(self, mock_download, temp_dir):
+    @patch("post_archiver_improved.scraper.download_images")
+    def test_image_downloads_capped_by_workers(self, mock_download, tmp_path):
+        """Test that max_workers also limits simultaneous image downloads."""
+        self.config.output.output_dir = tmp_path
+        self.config.scraping.max_workers = 1
+        scraper = CommunityPostScraper(self.config)
+        mock_download.return_value = [None, None]
+        post = Post(post_id="post1")
+        post.images = [
+            Image(src="https://example.com/1.jpg"),
+            Image(src="https://example.com/2.jpg"),
+        ]
+
+        scraper._download_post_images(post)
+
+        assert mock_download.call_args.kwargs["max_workers"] == 1
+
+    @patch("post_archiver_improved.utils.download_image")
+    def test_download_post_images_with_errors(self, mock_download, tmp_path):
         """Test image downloading with some errors."""
-        self.config.output.output_dir = temp_dir
+        self.config.output.output_dir = tmp_path
 
-        # Mock download with error for second image
-        mock_download.side_effect = [
-            temp_dir / "image1.jpg",  # Success
-            FileNotFoundError("Download failed"),  # Error
-        ]
+        # Mock download with error for second image; images download
+        # concurrently, so the outcome is chosen by URL rather than call order
+        def download(image_url, *args):
+            if image_url.endswith("image2.jpg"):
+                raise FileNotFoundError("Download failed")
+            return tmp_path / "image1.jpg"
+
+        mock_download.side_effect = download
 
         from post_archiver_improved.models import Image
 
@@ -527,6 +882,27 @@ class TestImageDownloading:
         assert image1.local_path is not None
         assert image2.local_path is None
 
+    def test_post_images_download_concurrently(self, tmp_path):
+        """Test that the images of one post are downloaded at the same time."""
+        self.config.output.output_dir = tmp_path
+        from post_archiver_improved.models import Image
+
+        images = [Image(src=f"https://example.com/image{i}.jpg") for i in range(3)]
+        post = Post(post_id="post1", images=images)
+        # Every download waits until all of them are in flight at once
+        barrier = threading.Barrier(len(images), timeout=5)
+
+        def download(image_url, filename, *args):
+            barrier.wait()
+            return str(tmp_path / f"{filename}.jpg")
+
+        with patch("post_archiver_improved.utils.download_image", side_effect=download):
+            self.scraper._download_post_images(post)
+
+        assert [image.local_path for image in images] == [
+            str(tmp_path / f"post1_image_{i}.jpg") for i in range(1, 4)
+        ]
+
     def test_download_post_images_no_output_dir(self):
         """Test image downloading when no output directory is configured."""
         self.config.output.output_dir = None
@@ -730,13 +1106,13 @@ class TestScraperIntegration:
         mock_extractor = Mock()
         mock_post1 = Mock(spec=Post)
         mock_post1.post_id = "post1"
-        mock_post1.comments_count = "0"
+        mock_post1.comments_count = 0
         mock_post1.images = []
         mock_post1.comments = []
 
         mock_post2 = Mock(spec=Post)
         mock_post2.post_id = "post2"
-        mock_post2.comments_count = "0"
+        mock_post2.comments_count = 0
         mock_post2.images = []
         mock_post2.comments = []
 
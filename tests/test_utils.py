@@ -4,14 +4,23 @@ Tests for utility functions.
 This module tests HTTP requests, file operations, validation functions, and other utility functionality.
 """
 
+import gzip
+import hashlib
 import json
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 from urllib.error import HTTPError, URLError
 
 import pytest
 
+from post_archiver_improved import utils
+from post_archiver_improved.constants import MAX_REPLY_FETCH_WORKERS
 from post_archiver_improved.exceptions import (
+    FileOperationError,
     NetworkError,
     RateLimitError,
 )
@@ -90,7 +99,8 @@ class TestMakeHttpRequest:
         assert "Not Found" in str(exc_info.value)
 
     @patch("post_archiver_improved.utils.urlopen")
-    def test_url_error_handling(self, mock_urlopen):
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_url_error_handling(self, mock_sleep, mock_urlopen):
         """Test URL error handling."""
         mock_urlopen.side_effect = URLError("Connection failed")
 
@@ -109,6 +119,91 @@ class TestMakeHttpRequest:
 
         assert "429" in str(exc_info.value)
 
+    @patch("post_archiver_improved.utils.urlopen")
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_rate_limit_retry_after(self, mock_sleep, mock_urlopen):
+        """Test that the Retry-After header is carried on RateLimitError."""
+        mock_urlopen.side_effect = HTTPError(
+            "https://example.com", 429, "Too Many Requests", {"Retry-After": "7"}, None
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            make_http_request("https://example.com/api", max_retries=2)
+
+        assert exc_info.value.retry_after == 7
+        assert mock_urlopen.call_count == 3
+        assert mock_sleep.call_args_list == [call(7.0), call(7.0)]
+
+    @patch("post_archiver_improved.utils.urlopen")
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_rate_limit_waits_then_succeeds(self, mock_sleep, mock_urlopen):
+        """Test that a 429 with a short Retry-After is retried after the delay."""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.read.return_value = b'{"ok": true}'
+        mock_response.headers = {}
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=None)
+        mock_urlopen.side_effect = [
+            HTTPError(
+                "https://example.com",
+                429,
+                "Too Many Requests",
+                {"Retry-After": "3"},
+                None,
+            ),
+            mock_response,
+        ]
+
+        assert make_http_request("https://example.com/api") == {"ok": True}
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch("post_archiver_improved.utils.urlopen")
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_rate_limit_long_retry_after_not_waited(self, mock_sleep, mock_urlopen):
+        """Test that a Retry-After beyond the cap is left to the caller."""
+        mock_urlopen.side_effect = HTTPError(
+            "https://example.com",
+            429,
+            "Too Many Requests",
+            {"Retry-After": "3600"},
+            None,
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            make_http_request("https://example.com/api")
+
+        assert exc_info.value.retry_after == 3600
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "retry_after,expected_wait",
+        [("5", 5.0), ("3600", 60.0), ("0", 1.0), ("soon", 1.0), (None, 1.0)],
+    )
+    @patch("post_archiver_improved.utils.urlopen")
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_server_error_honours_retry_after(
+        self, mock_sleep, mock_urlopen, retry_after, expected_wait
+    ):
+        """Test that a 503 waits as long as the server asks, up to a cap."""
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        mock_urlopen.side_effect = HTTPError(
+            "https://example.com", 503, "Service Unavailable", headers, None
+        )
+
+        with pytest.raises(NetworkError):
+            make_http_request("https://example.com/api", max_retries=1)
+
+        mock_sleep.assert_called_once_with(expected_wait)
+
+    def test_retry_after_http_date(self):
+        """Test that Retry-After given as an HTTP date becomes a delay."""
+        wait = utils._parse_retry_after(
+            {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+
+        assert wait == 0.0
+
     @patch("post_archiver_improved.utils.urlopen")
     @patch("post_archiver_improved.utils.time.sleep")
     def test_retry_logic(self, mock_sleep, mock_urlopen):
@@ -130,7 +225,8 @@ class TestMakeHttpRequest:
         assert mock_sleep.call_count == 3
 
     @patch("post_archiver_improved.utils.urlopen")
-    def test_max_retries_exceeded(self, mock_urlopen):
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_max_retries_exceeded(self, mock_sleep, mock_urlopen):
         """Test behavior when max retries are exceeded."""
         mock_urlopen.side_effect = URLError("Connection failed")
 
@@ -150,6 +246,49 @@ class TestMakeHttpRequest:
         with pytest.raises(NetworkError):
             make_http_request("https://example.com/api")
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("post_archiver_improved.utils.urlopen")
+    def test_json_codec_fallback(self, mock_urlopen, use_orjson):
+        """Test request encoding and decoding with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        mock_response = Mock()
+        mock_response.read.return_value = '{"text": "caf\u00e9"}'.encode()
+        mock_response.status = 200
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        with patch("post_archiver_improved.utils._HAS_ORJSON", use_orjson):
+            result = make_http_request(
+                "https://example.com/api", data={"q": "caf\u00e9"}, method="POST"
+            )
+            with pytest.raises(NetworkError):
+                mock_response.read.return_value = b"{not json"
+                make_http_request("https://example.com/api")
+
+        assert result == {"text": "caf\u00e9"}
+        request = mock_urlopen.call_args_list[0][0][0]
+        assert json.loads(request.data) == {"q": "caf\u00e9"}
+
+    @pytest.mark.parametrize(
+        "encoding,compress",
+        [
+            ("gzip", gzip.compress),
+            ("deflate", zlib.compress),
+            ("deflate", lambda data: zlib.compress(data)[2:-4]),  # raw deflate
+            (None, lambda data: data),
+        ],
+    )
+    @patch("post_archiver_improved.utils.urlopen")
+    def test_compressed_response(self, mock_urlopen, encoding, compress):
+        """Test that gzip and deflate response bodies are decoded."""
+        mock_response = Mock()
+        mock_response.read.return_value = compress(b'{"success": true}')
+        mock_response.headers = {"Content-Encoding": encoding} if encoding else {}
+        mock_response.status = 200
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        assert make_http_request("https://example.com/api") == {"success": True}
+
     def test_request_timeout(self):
         """Test request timeout parameter."""
         # This test verifies that timeout is passed to the request
@@ -211,11 +350,66 @@ class TestValidateChannelId:
 
         # Handle with special characters
         assert validate_channel_id("@user_name-123")
+        assert validate_channel_id("@名前")
+        assert not validate_channel_id("@_-")
+        assert not validate_channel_id("@user name")
 
         # Case sensitivity should fail for lowercase UC
         assert not validate_channel_id("uc1234567890123456789012")
 
 
+class TestSapisidAuthorization:
+    """Test SAPISID authorization header generation."""
+
+    def setup_method(self):
+        utils._sapisid_authorization_at.cache_clear()
+
+    @patch("post_archiver_improved.utils.time.time")
+    def test_hash_reused_within_a_second(self, mock_time):
+        """Test that requests in the same second share one hash computation."""
+        origin = "https://www.youtube.com"
+        expected_hash = hashlib.sha1(f"1000 sid {origin}".encode()).hexdigest()
+
+        mock_time.side_effect = [1000.2, 1000.9, 1001.0]
+        first = utils._generate_sapisid_authorization("sid", origin)
+        second = utils._generate_sapisid_authorization("sid", origin)
+        third = utils._generate_sapisid_authorization("sid", origin)
+
+        assert first == second == f"SAPISIDHASH 1000_{expected_hash}"
+        assert third.startswith("SAPISIDHASH 1001_")
+        assert utils._sapisid_authorization_at.cache_info().hits == 1
+
+
+class TestDownloadImages:
+    """Test download_images batch helper."""
+
+    @patch("post_archiver_improved.utils.download_image")
+    def test_results_keep_item_order(self, mock_download, tmp_path):
+        """Test that results line up with items and failures become None."""
+
+        def download(image_url, filename, *args):
+            if filename == "bad":
+                raise FileOperationError("disk full")
+            return f"{filename}.jpg"
+
+        mock_download.side_effect = download
+
+        results = utils.download_images(
+            [
+                ("https://e.com/a", "a"),
+                ("https://e.com/b", "bad"),
+                ("https://e.com/c", "c"),
+            ],
+            tmp_path,
+        )
+
+        assert results == ["a.jpg", None, "c.jpg"]
+
+    def test_empty_batch(self, tmp_path):
+        """Test that no work is done for an empty batch."""
+        assert utils.download_images([], tmp_path) == []
+
+
 class TestSanitizeFilename:
     """Test sanitize_filename function."""
 
@@ -240,6 +434,12 @@ class TestSanitizeFilename:
         for input_name, expected in test_cases:
             assert sanitize_filename(input_name) == expected
 
+    def test_non_ascii_names(self):
+        """Test that Unicode word characters are kept and other symbols replaced."""
+        assert sanitize_filename("caf\u00e9 \u2014 menu.png") == "caf\u00e9_menu.png"
+        assert sanitize_filename("\u6295\u7a3f\U0001f600.jpg") == "\u6295\u7a3f_.jpg"
+        assert sanitize_filename("a  --  b") == "a_--_b"
+
     def test_length_limiting(self):
         """Test filename length limiting."""
         long_name = "a" * 300 + ".txt"
@@ -315,6 +515,11 @@ class TestFormatFileSize:
         for size, expected in test_cases:
             assert format_file_size(size) == expected
 
+    def test_terabytes_are_largest_unit(self):
+        """Test that sizes past 1 TB stay in terabytes."""
+        assert format_file_size(1 << 40) == "1.0 TB"
+        assert format_file_size(1 << 50) == "1024.0 TB"
+
     def test_negative_sizes(self):
         """Test handling of negative file sizes."""
         assert format_file_size(-1) == "-1.0 B"
@@ -326,9 +531,9 @@ class TestFormatFileSize:
 class TestCreateBackupFilename:
     """Test create_backup_filename function."""
 
-    def test_basic_backup_naming(self, temp_dir):
+    def test_basic_backup_naming(self, tmp_path):
         """Test basic backup filename creation."""
-        original_file = temp_dir / "test.json"
+        original_file = tmp_path / "test.json"
         original_file.write_text("{}")
 
         backup_name = create_backup_filename(original_file)
@@ -338,9 +543,9 @@ class TestCreateBackupFilename:
         assert backup_name.suffix == ".json"
         assert "backup" in backup_name.name
 
-    def test_backup_with_timestamp(self, temp_dir):
+    def test_backup_with_timestamp(self, tmp_path):
         """Test that backup includes timestamp."""
-        original_file = temp_dir / "data.txt"
+        original_file = tmp_path / "data.txt"
         original_file.write_text("content")
 
         backup_name = create_backup_filename(original_file)
@@ -351,9 +556,9 @@ class TestCreateBackupFilename:
         timestamp_pattern = r"\d{8}_\d{6}"  # YYYYMMDD_HHMMSS
         assert re.search(timestamp_pattern, backup_name.name)
 
-    def test_backup_nonexistent_file(self, temp_dir):
+    def test_backup_nonexistent_file(self, tmp_path):
         """Test backup naming for non-existent file."""
-        original_file = temp_dir / "nonexistent.json"
+        original_file = tmp_path / "nonexistent.json"
 
         backup_name = create_backup_filename(original_file)
 
@@ -362,9 +567,9 @@ class TestCreateBackupFilename:
         assert backup_name.suffix == ".json"
 
     @patch("post_archiver_improved.utils.datetime")
-    def test_multiple_backups_different_names(self, mock_datetime, temp_dir):
+    def test_multiple_backups_different_names(self, mock_datetime, tmp_path):
         """Test that multiple backups get different names."""
-        original_file = temp_dir / "test.json"
+        original_file = tmp_path / "test.json"
         original_file.write_text("{}")
 
         mock_datetime.now.side_effect = [
@@ -382,9 +587,9 @@ class TestDownloadImage:
     """Test download_image function."""
 
     @patch("post_archiver_improved.utils.urlopen")
-    def test_successful_image_download(self, mock_urlopen, temp_dir):
+    def test_successful_image_download(self, mock_urlopen, tmp_path):
         """Test successful image download."""
-        # Mock response with proper file-like read behavior for shutil.copyfileobj
+        # Mock response with proper file-like read behavior
         mock_response = Mock()
         mock_response.status = 200
         mock_response.headers = {"content-type": "image/jpeg"}
@@ -393,7 +598,7 @@ class TestDownloadImage:
         mock_urlopen.return_value.__enter__.return_value = mock_response
 
         image_url = "https://example.com/image.jpg"
-        output_dir = temp_dir
+        output_dir = tmp_path
 
         result = download_image(image_url, "test_image", output_dir)
 
@@ -404,7 +609,152 @@ class TestDownloadImage:
         mock_urlopen.assert_called_once()
 
     @patch("post_archiver_improved.utils.urlopen")
-    def test_download_creates_directory(self, mock_urlopen, temp_dir):
+    def test_image_written_in_chunks(self, mock_urlopen, tmp_path):
+        """Test that every chunk read from the response reaches the file."""
+        chunks = [b"a" * utils._IMAGE_CHUNK_SIZE, b"b" * 10]
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"content-type": "image/jpeg"}
+        mock_response.read.side_effect = [*chunks, b""]
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        result = download_image("https://example.com/image.jpg", "big", tmp_path)
+
+        assert Path(result).read_bytes() == b"".join(chunks)
+        mock_response.read.assert_called_with(utils._IMAGE_CHUNK_SIZE)
+
+    @patch("post_archiver_improved.utils.urlopen")
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_empty_image_discarded(self, mock_sleep, mock_urlopen, tmp_path):
+        """Test that an empty response body counts as a failed download."""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"content-type": "image/jpeg"}
+        mock_response.read.return_value = b""
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        result = download_image(
+            "https://example.com/image.jpg", "empty", tmp_path, max_retries=0
+        )
+
+        assert result is None
+        assert list((tmp_path / "images").iterdir()) == []
+
+    @patch("post_archiver_improved.utils.urlopen")
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_retry_keeps_reserved_name(self, mock_sleep, mock_urlopen, tmp_path):
+        """Test that a retry cannot overwrite a file another download reserved."""
+        images_dir = tmp_path / "images"
+        other_files = []
+
+        def concurrent_download(seconds):
+            # Another worker picks a name for the same image meanwhile
+            other = utils._create_unique_file(images_dir, "post1.jpg", "jpg")
+            other.write_bytes(b"other_image")
+            other_files.append(other)
+
+        mock_sleep.side_effect = concurrent_download
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"content-type": "image/jpeg"}
+        mock_response.read.side_effect = [b"partial", URLError("reset"), b"image", b""]
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        result = download_image(
+            "https://example.com/img.jpg", "post1", tmp_path, max_retries=1
+        )
+
+        assert result == str(images_dir / "post1.jpg")
+        assert Path(result).read_bytes() == b"image"
+        assert other_files == [images_dir / "post1_1.jpg"]
+        assert other_files[0].read_bytes() == b"other_image"
+
+    def test_write_all_resumes_short_writes(self):
+        """Test that a short write is followed by the remaining bytes."""
+        written = []
+
+        def write(view):
+            written.append(bytes(view[:3]))
+            return min(3, len(view))
+
+        utils._write_all(Mock(write=write), b"abcdefgh")
+
+        assert written == [b"abc", b"def", b"gh"]
+
+    @patch("post_archiver_improved.utils.urlopen")
+    def test_image_requested_without_content_coding(self, mock_urlopen, tmp_path):
+        """Test that images are requested uncompressed since they are saved as is."""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"content-type": "image/png"}
+        mock_response.read.side_effect = [b"png", b""]
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        download_image("https://example.com/image.png", "test_image", tmp_path)
+
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("Accept-encoding") == "identity"
+
+    @pytest.mark.parametrize(
+        "image_url,filename,expected_name",
+        [
+            ("https://example.com/img.PNG", "post1", "post1.png"),
+            ("https://example.com/img.webp", "post1.WEBP", "post1.WEBP"),
+            ("https://yt3.ggpht.com/abc=s1080-c-k", "post1", "post1.jpg"),
+            ("https://example.com/v1.2/img", "post1", "post1.jpg"),
+            ("https://example.com/img.tiff", "post1.png", "post1.png.jpg"),
+            ("https://example.com/img.gif", "gif", "gif.gif"),
+        ],
+    )
+    @patch("post_archiver_improved.utils.urlopen")
+    def test_image_extension(
+        self, mock_urlopen, tmp_path, image_url, filename, expected_name
+    ):
+        """Test that the saved file gets a known image extension."""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"content-type": "image/png"}
+        mock_response.read.side_effect = [b"data", b""]
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        result = download_image(image_url, filename, tmp_path)
+
+        assert Path(result).name == expected_name
+
+    @patch("post_archiver_improved.utils.urlopen")
+    def test_filename_conflicts_numbered(self, mock_urlopen, tmp_path):
+        """Test that existing files are kept and the next free name is used."""
+        images_dir = tmp_path / "images"
+        images_dir.mkdir()
+        (images_dir / "post1.png").write_bytes(b"old")
+        (images_dir / "post1_1.png").write_bytes(b"old")
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"content-type": "image/png"}
+        mock_response.read.side_effect = [b"new", b""]
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        result = download_image("https://example.com/img.png", "post1", tmp_path)
+
+        assert Path(result).name == "post1_2.png"
+        assert Path(result).read_bytes() == b"new"
+        assert (images_dir / "post1.png").read_bytes() == b"old"
+
+    @patch("post_archiver_improved.utils.time.sleep")
+    @patch("post_archiver_improved.utils.urlopen")
+    def test_failed_download_leaves_no_file(self, mock_urlopen, mock_sleep, tmp_path):
+        """Test that the reserved file is removed when every attempt fails."""
+        mock_urlopen.side_effect = URLError("Connection failed")
+
+        result = download_image(
+            "https://example.com/img.png", "post1", tmp_path, max_retries=1
+        )
+
+        assert result is None
+        assert list((tmp_path / "images").iterdir()) == []
+
+    @patch("post_archiver_improved.utils.urlopen")
+    def test_download_creates_directory(self, mock_urlopen, tmp_path):
         """Test that download creates output directory."""
         mock_response = Mock()
         mock_response.status = 200
@@ -413,7 +763,7 @@ class TestDownloadImage:
         mock_urlopen.return_value.__enter__.return_value = mock_response
 
         image_url = "https://example.com/image.jpg"
-        output_dir = temp_dir / "nested"
+        output_dir = tmp_path / "nested"
 
         result = download_image(image_url, "test_image", output_dir)
 
@@ -424,7 +774,7 @@ class TestDownloadImage:
         assert result_path.parent == images_dir
 
     @patch("post_archiver_improved.utils.urlopen")
-    def test_download_with_custom_filename(self, mock_urlopen, temp_dir):
+    def test_download_with_custom_filename(self, mock_urlopen, tmp_path):
         """Test download with custom filename."""
         mock_response = Mock()
         mock_response.status = 200
@@ -433,7 +783,7 @@ class TestDownloadImage:
         mock_urlopen.return_value.__enter__.return_value = mock_response
 
         image_url = "https://example.com/image.jpg"
-        output_dir = temp_dir
+        output_dir = tmp_path
         custom_filename = "custom_name.jpg"
 
         result = download_image(image_url, custom_filename, output_dir)
@@ -443,14 +793,15 @@ class TestDownloadImage:
         assert result_path.name == custom_filename
 
     @patch("post_archiver_improved.utils.urlopen")
-    def test_download_network_error(self, mock_urlopen, temp_dir):
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_download_network_error(self, mock_sleep, mock_urlopen, tmp_path):
         """Test download network error handling."""
         mock_urlopen.side_effect = HTTPError(
             "https://example.com", 404, "Not Found", {}, None
         )
 
         image_url = "https://example.com/image.jpg"
-        output_dir = temp_dir
+        output_dir = tmp_path
 
         result = download_image(image_url, "test_image", output_dir)
 
@@ -458,22 +809,24 @@ class TestDownloadImage:
         assert result is None
 
     @patch("post_archiver_improved.utils.urlopen")
-    def test_download_invalid_url(self, mock_urlopen, temp_dir):
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_download_invalid_url(self, mock_sleep, mock_urlopen, tmp_path):
         """Test download with invalid URL."""
         mock_urlopen.side_effect = URLError("unknown url type: 'not_a_url'")
 
         image_url = "not_a_url"
-        output_dir = temp_dir
+        output_dir = tmp_path
 
         result = download_image(image_url, "test_image", output_dir)
 
         # Should return None on failure, not raise exception
         assert result is None
 
-    def test_download_permission_error(self, temp_dir):
+    @patch("post_archiver_improved.utils.time.sleep")
+    def test_download_permission_error(self, mock_sleep, tmp_path):
         """Test download with permission error."""
         # Create read-only directory
-        readonly_dir = temp_dir / "readonly"
+        readonly_dir = tmp_path / "readonly"
         readonly_dir.mkdir()
         readonly_dir.chmod(0o444)
 
@@ -510,9 +863,9 @@ class TestUtilityIntegration:
         assert "*" not in sanitized
         assert "<" not in sanitized
 
-    def test_file_operations_with_backup(self, temp_dir):
+    def test_file_operations_with_backup(self, tmp_path):
         """Test file operations with backup creation."""
-        original_file = temp_dir / "test.json"
+        original_file = tmp_path / "test.json"
         original_file.write_text('{"original": "data"}')
 
         # Create backup
@@ -534,9 +887,9 @@ class TestUtilityIntegration:
 class TestLoadCookiesFromNetscapeFile:
     """Test load_cookies_from_netscape_file function."""
 
-    def test_load_valid_cookies(self, temp_dir):
+    def test_load_valid_cookies(self, tmp_path):
         """Test loading valid Netscape format cookies."""
-        cookies_file = temp_dir / "cookies.txt"
+        cookies_file = tmp_path / "cookies.txt"
 
         # Create a sample Netscape format cookie file
         cookie_content = """# Netscape HTTP Cookie File
@@ -558,9 +911,22 @@ example.com\tTRUE\t/\tFALSE\t1735689600\tother_cookie\tignored
         assert cookies["NID"] == "CC1234567890"
         assert "other_cookie" not in cookies  # Should ignore non-YouTube/Google cookies
 
-    def test_load_cookies_with_comments_and_empty_lines(self, temp_dir):
+    def test_load_cookies_crlf_and_extra_fields(self, tmp_path):
+        """Test Windows line endings and lines with more than seven fields."""
+        cookies_file = tmp_path / "cookies.txt"
+        cookies_file.write_bytes(
+            b"# Netscape HTTP Cookie File\r\n"
+            b".youtube.com\tTRUE\t/\tFALSE\t0\tSID\tAA\r\n"
+            b".youtube.com\tTRUE\t/\tFALSE\t0\tHSID\tBB\textra\r\n"
+        )
+
+        cookies = load_cookies_from_netscape_file(cookies_file)
+
+        assert cookies == {"SID": "AA", "HSID": "BB"}
+
+    def test_load_cookies_with_comments_and_empty_lines(self, tmp_path):
         """Test loading cookies file with comments and empty lines."""
-        cookies_file = temp_dir / "cookies.txt"
+        cookies_file = tmp_path / "cookies.txt"
 
         cookie_content = """# This is a comment
 # Another comment
@@ -581,9 +947,9 @@ example.com\tTRUE\t/\tFALSE\t1735689600\tother_cookie\tignored
         assert cookies["SIDCC"] == "value1"
         assert cookies["NID"] == "value2"
 
-    def test_load_cookies_invalid_format(self, temp_dir):
+    def test_load_cookies_invalid_format(self, tmp_path):
         """Test handling of invalid cookie format."""
-        cookies_file = temp_dir / "cookies.txt"
+        cookies_file = tmp_path / "cookies.txt"
 
         cookie_content = """# Valid cookie
 .youtube.com\tTRUE\t/\tFALSE\t1735689600\tvalid_cookie\tvalue1
@@ -602,9 +968,9 @@ example.com\tTRUE\t/\tFALSE\t1735689600\tother_cookie\tignored
         assert cookies["valid_cookie"] == "value1"
         assert cookies["another_cookie"] == "value2"
 
-    def test_load_cookies_no_youtube_cookies(self, temp_dir):
+    def test_load_cookies_no_youtube_cookies(self, tmp_path):
         """Test loading cookies file with no YouTube/Google cookies."""
-        cookies_file = temp_dir / "cookies.txt"
+        cookies_file = tmp_path / "cookies.txt"
 
         cookie_content = """example.com\tTRUE\t/\tFALSE\t1735689600\tcookie1\tvalue1
 other.com\tTRUE\t/\tFALSE\t1735689600\tcookie2\tvalue2
@@ -616,17 +982,17 @@ other.com\tTRUE\t/\tFALSE\t1735689600\tcookie2\tvalue2
         # Should return None when no YouTube/Google cookies are found
         assert cookies is None
 
-    def test_load_cookies_file_not_found(self, temp_dir):
+    def test_load_cookies_file_not_found(self, tmp_path):
         """Test handling of non-existent cookie file."""
-        cookies_file = temp_dir / "nonexistent.txt"
+        cookies_file = tmp_path / "nonexistent.txt"
 
         cookies = load_cookies_from_netscape_file(cookies_file)
 
         assert cookies is None
 
-    def test_load_cookies_file_read_error(self, temp_dir):
+    def test_load_cookies_file_read_error(self, tmp_path):
         """Test handling of file read errors."""
-        cookies_file = temp_dir / "cookies.txt"
+        cookies_file = tmp_path / "cookies.txt"
         cookies_file.write_text("content")
         cookies_file.chmod(0o000)  # Remove all permissions
 
@@ -756,5 +1122,176 @@ class TestCookieIntegration:
         assert header == "single=value"
 
 
+class TestPooledDNSCache:
+    """Test the DNS cache used by pooled connections."""
+
+    ADDRESSES = [
+        (2, 1, 6, "", ("203.0.113.1", 443)),
+        (2, 1, 6, "", ("203.0.113.2", 443)),
+    ]
+
+    def setup_method(self):
+        """Start every test with an empty DNS cache."""
+        utils._dns_cache.clear()
+
+    @patch("post_archiver_improved.utils.socket.create_connection")
+    @patch("post_archiver_improved.utils.socket.getaddrinfo")
+    def test_host_resolved_once(self, mock_getaddrinfo, mock_connect):
+        """Test that later connections to a host reuse the first lookup."""
+        mock_getaddrinfo.return_value = self.ADDRESSES
+
+        utils._create_connection(("www.youtube.com", 443), 10)
+        utils._create_connection(("www.youtube.com", 443), 10)
+
+        mock_getaddrinfo.assert_called_once()
+        assert mock_connect.call_args_list == [
+            call(("203.0.113.1", 443), 10, None),
+            call(("203.0.113.1", 443), 10, None),
+        ]
+
+    @patch("post_archiver_improved.utils.socket.create_connection")
+    @patch("post_archiver_improved.utils.socket.getaddrinfo")
+    def test_next_address_tried(self, mock_getaddrinfo, mock_connect):
+        """Test that an unreachable address falls through to the next one."""
+        mock_getaddrinfo.return_value = self.ADDRESSES
+        mock_connect.side_effect = [ConnectionRefusedError(), "socket"]
+
+        assert utils._create_connection(("www.youtube.com", 443), 10) == "socket"
+        assert mock_connect.call_args[0][0] == ("203.0.113.2", 443)
+
+    @patch("post_archiver_improved.utils.socket.create_connection")
+    @patch("post_archiver_improved.utils.socket.getaddrinfo")
+    def test_unreachable_host_resolved_again(self, mock_getaddrinfo, mock_connect):
+        """Test that a failed connection drops the cached addresses."""
+        mock_getaddrinfo.return_value = self.ADDRESSES
+        mock_connect.side_effect = ConnectionRefusedError()
+
+        with pytest.raises(ConnectionRefusedError):
+            utils._create_connection(("www.youtube.com", 443), 10)
+        with pytest.raises(ConnectionRefusedError):
+            utils._create_connection(("www.youtube.com", 443), 10)
+
+        assert mock_getaddrinfo.call_count == 2
+
+    @patch("post_archiver_improved.utils.socket.getaddrinfo")
+    def test_failed_lookup_not_cached(self, mock_getaddrinfo):
+        """Test that a failed lookup is retried on the next connection."""
+        mock_getaddrinfo.side_effect = OSError("no network")
+
+        with pytest.raises(OSError):
+            utils._create_connection(("www.youtube.com", 443), 10)
+
+        assert utils._dns_cache == {}
+
+    @patch("post_archiver_improved.utils.socket.getaddrinfo")
+    def test_pool_resolves_on_first_connect(self, mock_getaddrinfo):
+        """Test that creating a pooled connection does not resolve the host."""
+        pool = utils._ConnectionPool()
+
+        conn, reused = pool._acquire(
+            ("https", "www.youtube.com"), utils._PooledHTTPSConnection, 10
+        )
+
+        assert not reused
+        assert conn._create_connection is utils._create_connection
+        mock_getaddrinfo.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Serves a small JSON body over HTTP/1.1 and records client ports."""
+
+    protocol_version = "HTTP/1.1"
+    close_after_response = False
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.close_after_response:
+            # Drop the connection without telling the client, like an
+            # idle keep-alive timeout on the server side
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestConnectionPool:
+    """Test keep-alive connection reuse in make_http_request."""
+
+    def setup_method(self):
+        utils._connection_pool.clear()
+
+    def teardown_method(self):
+        utils._connection_pool.clear()
+
+    def _serve(self, handler):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.client_ports = []
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+    def test_connection_reused_across_requests(self):
+        """Test that consecutive requests to one host share a connection."""
+        server, url = self._serve(_KeepAliveHandler)
+        try:
+            for _ in range(3):
+                assert make_http_request(url, timeout=5) == {"ok": True}
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(server.client_ports) == 3
+        assert len(set(server.client_ports)) == 1
+
+    def test_pool_keeps_connection_per_reply_worker(self):
+        """Test that a full batch of reply workers reuses its connections."""
+        workers = MAX_REPLY_FETCH_WORKERS
+        # Every request waits for the rest of its batch, so each batch needs
+        # one connection per worker
+        barrier = threading.Barrier(workers, timeout=5)
+
+        class BatchHandler(_KeepAliveHandler):
+            def do_GET(self):
+                barrier.wait()
+                super().do_GET()
+
+        server, url = self._serve(BatchHandler)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in range(2):
+                    results = executor.map(
+                        lambda _: make_http_request(url, timeout=5), range(workers)
+                    )
+                    assert list(results) == [{"ok": True}] * workers
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(server.client_ports) == 2 * workers
+        assert len(set(server.client_ports)) == workers
+
+    def test_stale_connection_is_replaced(self):
+        """Test that a connection dropped by the server is retried on a new one."""
+
+        class ClosingHandler(_KeepAliveHandler):
+            close_after_response = True
+
+        server, url = self._serve(ClosingHandler)
+        try:
+            assert make_http_request(url, timeout=5, max_retries=0) == {"ok": True}
+            assert make_http_request(url, timeout=5, max_retries=0) == {"ok": True}
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(set(server.client_ports)) == 2